@@ -1,6 +1,7 @@
 from hypurrquant.utils.singleton import Singleton
 from hypurrquant.evm import Chain
 from .utils import send_request, BASE_URL
+from .cache import response_cache
 from .models import BaseResponse, ReferralSummaryDict, AccountDto, EvmBalanceDto
 from hypurrquant.logging_config import configure_logging
 
@@ -319,6 +320,7 @@ class AccountService(metaclass=Singleton):
         )
         return response.data
 
+    @response_cache.cached("evm_managed_token", ttl=600, redis=True)
     async def get_evm_managed_token(self, chain: Chain) -> List[str]:
         response: BaseResponse = await send_request(
             "GET", f"{BASE_URL}/dex/managed-tokens", params={"chain": chain}
@@ -2,11 +2,11 @@
 
 from hypurrquant.logging_config import configure_logging
 from hypurrquant.utils.singleton import singleton
-from hypurrquant.api.async_http import send_request_for_external
 from hypurrquant.db.redis import get_redis_async
 from hypurrquant.constant.redis import TelegramRedisKey
 
 from .hyperliquid import MarketDataCache
+from .utils import send_request_for_external, single_flight
 import asyncio
 import json
 from enum import Enum
@@ -105,6 +105,19 @@ class BridgeService:
     async def estimate_solana_fees(
         self,
         convert_to_usd: bool = True,
+    ) -> dict:
+        """
+        동시에 들어온 수수료 조회를 하나의 요청으로 병합한다. (자세한 내용은 _estimate_solana_fees)
+        """
+        return await single_flight.do(
+            ("estimate_solana_fees", convert_to_usd),
+            "estimate_solana_fees",
+            lambda: self._estimate_solana_fees(convert_to_usd),
+        )
+
+    async def _estimate_solana_fees(
+        self,
+        convert_to_usd: bool = True,
     ) -> dict:
         """
         Hyper-Unit v2 estimate-fees API 에서 Solana 수수료 정보를 조회 후
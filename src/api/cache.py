@@ -0,0 +1,249 @@
+from hypurrquant.logging_config import configure_logging
+from hypurrquant.db.redis import get_redis_async
+from .exception import NOT_FOUND_EXCEPTIONS
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+import inspect
+import json
+import time
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+REDIS_KEY_PREFIX = "telegram:response-cache"
+_MISS = object()
+
+
+# ================================
+# namespace 별 LRU + TTL 저장소
+# ================================
+class _Namespace:
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        maxsize: int,
+        negative_ttl: Optional[float],
+        negative_on: Tuple[Type[Exception], ...],
+        redis: bool,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.negative_on = negative_on
+        self.redis = redis
+        # key -> (만료 시각, 값, 예외 여부)
+        self.entries: "OrderedDict[str, Tuple[float, Any, bool]]" = OrderedDict()
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def get(self, key: str) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            return _MISS
+        expires_at, value, is_error = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return _MISS
+        self.entries.move_to_end(key)
+        if is_error:
+            self.stats["negative_hits"] += 1
+            # 같은 예외 객체를 다시 올리므로 이전 hit 의 traceback 이 쌓이지 않도록 비운다
+            raise value.with_traceback(None)
+        self.stats["hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, is_error: bool = False):
+        self.entries[key] = (time.monotonic() + ttl, value, is_error)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+
+def _key_builder(func: Callable) -> Callable[..., str]:
+    """
+    호출을 캐시 key 로 바꾸는 함수. 인자를 signature 에 bind 하고 기본값을 채우므로
+    위치 인자 / 키워드 인자 / 기본값 생략 여부와 관계없이 같은 호출은 같은 key 가 된다.
+    """
+    signature = inspect.signature(func)
+
+    def build(service, *args, **kwargs) -> str:
+        bound = signature.bind(service, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = []
+        for name, value in list(bound.arguments.items())[1:]:  # self 제외
+            if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+                value = sorted(value.items())
+            arguments.append((name, value))
+        return repr(arguments)
+
+    return build
+
+
+# ================================
+# 응답 캐시 레지스트리
+# ================================
+class ResponseCache:
+    """
+    서비스 메소드 단위의 선언적 응답 캐시.
+
+    - cached(): namespace 별 TTL, LRU 크기 제한, not-found 계열 예외의 negative caching
+    - invalidates(): 상태를 바꾸는 메소드가 끝나면 지정한 namespace 를 비운다
+    - redis=True 인 namespace 는 프로세스 메모리 다음 단계로 Redis 를 조회한다 (JSON 직렬화 가능한 값만)
+    """
+
+    def __init__(self):
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._redis_client = None
+
+    # ================================
+    # Redis tier
+    # ================================
+    def _redis(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_async()
+        return self._redis_client
+
+    async def _redis_get(self, namespace: _Namespace, key: str) -> Any:
+        try:
+            cached = await self._redis().get(
+                f"{REDIS_KEY_PREFIX}:{namespace.name}:{key}"
+            )
+        except Exception as e:
+            _logger.warning(f"response cache redis get failed: {e}")
+            return _MISS
+        if cached is None:
+            return _MISS
+        return json.loads(cached)
+
+    async def _redis_set(self, namespace: _Namespace, key: str, value: Any):
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return  # JSON 으로 표현할 수 없는 값은 메모리에만 보관
+        try:
+            await self._redis().setex(
+                f"{REDIS_KEY_PREFIX}:{namespace.name}:{key}",
+                max(int(namespace.ttl), 1),
+                payload,
+            )
+        except Exception as e:
+            _logger.warning(f"response cache redis set failed: {e}")
+
+    async def _redis_clear(self, namespace: _Namespace):
+        try:
+            client = self._redis()
+            async for redis_key in client.scan_iter(
+                match=f"{REDIS_KEY_PREFIX}:{namespace.name}:*"
+            ):
+                await client.delete(redis_key)
+        except Exception as e:
+            _logger.warning(f"response cache redis invalidate failed: {e}")
+
+    # ================================
+    # 데코레이터
+    # ================================
+    def cached(
+        self,
+        namespace: str,
+        ttl: float,
+        *,
+        maxsize: int = 256,
+        negative_ttl: Optional[float] = 10.0,
+        negative_on: Tuple[Type[Exception], ...] = NOT_FOUND_EXCEPTIONS,
+        redis: bool = False,
+    ):
+        """
+        서비스 메소드의 반환값을 (인자 기준으로) ttl 초 동안 캐시한다.
+
+        Args:
+            namespace (str): 캐시 이름. invalidate / invalidates 에서 사용
+            ttl (float): 정상 응답 보관 시간 (초)
+            maxsize (int): namespace 당 최대 항목 수. 넘으면 가장 오래 안 쓴 항목부터 제거
+            negative_ttl (Optional[float]): negative_on 예외 보관 시간. None 이면 예외는 캐시하지 않음
+            negative_on: negative caching 대상 예외 타입
+            redis (bool): Redis 를 2차 캐시로 사용할지 여부
+        """
+        ns = _Namespace(namespace, ttl, maxsize, negative_ttl, negative_on, redis)
+        self._namespaces[namespace] = ns
+
+        def decorator(func):
+            build_key = _key_builder(func)
+
+            @wraps(func)
+            async def wrapper(service, *args, **kwargs):
+                key = build_key(service, *args, **kwargs)
+
+                value = ns.get(key)
+                if value is not _MISS:
+                    return value
+
+                if ns.redis:
+                    value = await self._redis_get(ns, key)
+                    if value is not _MISS:
+                        ns.stats["hits"] += 1
+                        ns.set(key, value, ns.ttl)
+                        return value
+
+                ns.stats["misses"] += 1
+                try:
+                    value = await func(service, *args, **kwargs)
+                except ns.negative_on as e:
+                    if ns.negative_ttl is not None:
+                        ns.set(key, e, ns.negative_ttl, is_error=True)
+                    raise
+
+                ns.set(key, value, ns.ttl)
+                if ns.redis:
+                    await self._redis_set(ns, key, value)
+                return value
+
+            return wrapper
+
+        return decorator
+
+    def invalidates(self, *namespaces: str):
+        """
+        데코레이트된 메소드가 끝나면 (성공/실패와 무관하게) namespaces 를 비운다.
+        """
+
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    for namespace in namespaces:
+                        await self.invalidate(namespace)
+
+            return wrapper
+
+        return decorator
+
+    async def invalidate(self, namespace: str):
+        ns = self._namespaces.get(namespace)
+        if ns is None:
+            _logger.warning(f"Unknown response cache namespace: {namespace}")
+            return
+        ns.entries.clear()
+        if ns.redis:
+            await self._redis_clear(ns)
+
+    def stats_snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name: {**ns.stats, "size": len(ns.entries)}
+            for name, ns in self._namespaces.items()
+        }
+
+
+response_cache = ResponseCache()
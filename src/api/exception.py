@@ -679,6 +679,18 @@ class RouteExpiredException(ApiException):
         super().__init__(self.message)
 
 
+# ================================
+# 조회 대상이 없음을 뜻하는 예외 (응답 캐시의 negative caching 대상)
+# ================================
+NOT_FOUND_EXCEPTIONS = (
+    NoSuchTickerException,
+    NoSuchPoolException,
+    NoSuchDexException,
+    NoSuchDexProtocolException,
+    NoSuchSubscriptionException,
+)
+
+
 def get_exception_by_code(
     code: int, api_response: Optional[Any] = None
 ) -> ApiException:
@@ -0,0 +1,331 @@
+from hypurrquant.db.redis import get_redis_async
+from hypurrquant.logging_config import configure_logging
+from .loop_monitor import loop_monitor
+from .utils import send_request_for_external
+
+from array import array
+from typing import Any, Dict, Iterable, Optional
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+import uuid
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+GLIQUID_API = "https://api.gliquid.xyz"
+
+# GLiquid 포인트 표시 여부. 켜면 app 이 snapshot job 을 띄우고 lpvault 화면에 GLiquid 가 나온다
+GLIQUID_POINTS_ENABLED = os.getenv("GLIQUID_POINTS_ENABLED", "").lower() in (
+    "1",
+    "true",
+)
+# 초, leaderboard 전체를 다시 받는 주기
+GLIQUID_SNAPSHOT_INTERVAL = float(os.getenv("GLIQUID_SNAPSHOT_INTERVAL") or 300)
+# 초, leaderboard 다운로드 timeout (= 다운로드 lock 의 유지 시간)
+GLIQUID_SNAPSHOT_TIMEOUT = float(os.getenv("GLIQUID_SNAPSHOT_TIMEOUT") or 60)
+# 초, 다른 worker 가 다운로드 중일 때 Redis 를 다시 확인하는 간격
+GLIQUID_SNAPSHOT_RETRY = float(os.getenv("GLIQUID_SNAPSHOT_RETRY") or 10)
+
+REDIS_KEY_PREFIX = "telegram:gliquid-snapshot"
+
+ADDRESS_SIZE = 20  # EVM 주소 byte 수
+
+
+def _address_key(address: str) -> Optional[bytes]:
+    """
+    "0xAbC..." -> 20 byte. 주소가 아니면 None
+    """
+    if not isinstance(address, str):
+        return None
+    try:
+        key = bytes.fromhex(address.lower().removeprefix("0x"))
+    except ValueError:
+        return None
+    return key if len(key) == ADDRESS_SIZE else None
+
+
+# ================================
+# leaderboard index
+# ================================
+class LeaderboardIndex:
+    """
+    address -> points 의 compact index.
+
+    - 주소(20 byte)를 정렬해 이어 붙인 bytes 하나와 같은 순서의 float64 array 하나로 보관한다.
+      사용자 dict 를 통째로 들고 있는 것보다 메모리가 훨씬 작고, 그대로 Redis 에 올릴 수 있다
+    - lookup 은 이진 탐색 (O(log n))
+    """
+
+    __slots__ = ("addresses", "points", "fetched_at")
+
+    def __init__(self, addresses: bytes, points: array, fetched_at: float):
+        self.addresses = addresses
+        self.points = points
+        self.fetched_at = fetched_at  # epoch 초, worker 간 비교에 쓴다
+
+    @classmethod
+    def build(cls, users: Iterable[dict], fetched_at: float) -> "LeaderboardIndex":
+        by_address: Dict[bytes, float] = {}
+        for user in users:
+            key = _address_key(user.get("address"))
+            if key is None:
+                continue
+            try:
+                by_address[key] = float(user.get("points") or 0.0)
+            except (TypeError, ValueError):
+                continue
+        keys = sorted(by_address)
+        return cls(
+            b"".join(keys), array("d", (by_address[key] for key in keys)), fetched_at
+        )
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def lookup(self, address: str) -> Optional[float]:
+        """
+        leaderboard 에 없는 주소면 None
+        """
+        key = _address_key(address)
+        if key is None:
+            return None
+        addresses = self.addresses
+        lo, hi = 0, len(self.points)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = addresses[mid * ADDRESS_SIZE : (mid + 1) * ADDRESS_SIZE]
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return self.points[mid]
+        return None
+
+    def dumps(self) -> str:
+        """
+        Redis 에 올릴 형태. (decode_responses 설정과 관계없이 읽히도록 base64 JSON)
+        """
+        points = array("d", self.points)
+        if sys.byteorder != "little":
+            points.byteswap()
+        return json.dumps(
+            {
+                "fetched_at": self.fetched_at,
+                "addresses": base64.b64encode(self.addresses).decode(),
+                "points": base64.b64encode(points.tobytes()).decode(),
+            }
+        )
+
+    @classmethod
+    def loads(cls, payload: Any) -> "LeaderboardIndex":
+        data = json.loads(payload)
+        addresses = base64.b64decode(data["addresses"])
+        points = array("d")
+        points.frombytes(base64.b64decode(data["points"]))
+        if sys.byteorder != "little":
+            points.byteswap()
+        if len(addresses) != len(points) * ADDRESS_SIZE:
+            raise ValueError("corrupted gliquid snapshot")
+        return cls(addresses, points, float(data["fetched_at"]))
+
+
+def _parse_leaderboard(response: Any, fetched_at: float) -> LeaderboardIndex:
+    return LeaderboardIndex.build(response["users"], fetched_at)
+
+
+# ================================
+# snapshot job
+# ================================
+class GliquidSnapshot:
+    """
+    GLiquid leaderboard(getAllReferralUsersFast) 를 주기적으로 받아 LeaderboardIndex 로 들고 있는다.
+    사용자 요청은 다운로드를 기다리지 않고 메모리의 index 만 조회한다.
+
+    - 다운로드는 Redis lock 을 잡은 worker 하나만 하고, 결과를 Redis 에 올린다.
+      나머지 worker 는 version key 가 바뀌었을 때만 Redis 에서 index 를 받아온다
+    - Redis 를 쓸 수 없으면 worker 마다 직접 받는다 (기존과 같은 비용, 단 주기당 한 번)
+    - 다운로드가 실패하면 마지막 index 를 계속 쓴다
+    """
+
+    def __init__(self, interval: float = GLIQUID_SNAPSHOT_INTERVAL):
+        self.interval = interval
+        self._index: Optional[LeaderboardIndex] = None
+        self._redis_client = None
+        self._owner = uuid.uuid4().hex  # lock 소유자 구분
+        self._stats: Dict[str, float] = {
+            "lookups": 0,
+            "not_ready": 0,  # 아직 index 가 없어 None 으로 응답
+            "downloads": 0,
+            "download_failures": 0,
+            "redis_loads": 0,  # 다른 worker 가 올린 index 를 받음
+            "lock_waits": 0,  # 다른 worker 가 다운로드 중
+            "last_download_seconds": 0.0,
+        }
+
+    @property
+    def ready(self) -> bool:
+        return self._index is not None
+
+    def lookup(self, address: str) -> Optional[float]:
+        """
+        Returns:
+            Optional[float]: 포인트. leaderboard 에 없으면 0, snapshot 이 아직 없으면 None
+        """
+        self._stats["lookups"] += 1
+        index = self._index
+        if index is None:
+            self._stats["not_ready"] += 1
+            return None
+        points = index.lookup(address)
+        return 0.0 if points is None else points
+
+    # ================================
+    # 갱신
+    # ================================
+    async def run(self):
+        while True:
+            delay = self.interval
+            try:
+                if not await self.refresh():
+                    delay = min(GLIQUID_SNAPSHOT_RETRY, self.interval)
+            except Exception as e:
+                # 실패해도 다음 주기까지 기다린다 (마지막 index 는 계속 쓴다)
+                _logger.exception(f"gliquid snapshot refresh failed: {e}")
+            await asyncio.sleep(delay)
+
+    async def refresh(self) -> bool:
+        """
+        Returns:
+            bool: 이번 주기의 index 를 갖게 되었으면 True.
+                False 면 다른 worker 가 다운로드 중이므로 짧은 간격으로 Redis 를 다시 확인한다
+        """
+        client = self._redis()
+        if client is None:
+            await self._download()
+            return True
+
+        # 1. 다른 worker 가 이번 주기의 index 를 이미 올렸으면 그것을 쓴다
+        if await self._load_from_redis(client) and self._fresh():
+            return True
+
+        # 2. lock 을 잡은 worker 하나만 다운로드
+        try:
+            locked = await client.set(
+                f"{REDIS_KEY_PREFIX}:lock",
+                self._owner,
+                nx=True,
+                ex=max(int(GLIQUID_SNAPSHOT_TIMEOUT), 1),
+            )
+        except Exception as e:
+            _logger.warning(f"gliquid snapshot redis lock failed: {e}")
+            await self._download()
+            return True
+        if not locked:
+            self._stats["lock_waits"] += 1
+            return False
+
+        try:
+            index = await self._download()
+            await self._publish(client, index)
+        finally:
+            await self._release_lock(client)
+        return True
+
+    def _fresh(self) -> bool:
+        index = self._index
+        return index is not None and time.time() - index.fetched_at < self.interval
+
+    async def _download(self) -> LeaderboardIndex:
+        self._stats["downloads"] += 1
+        started_at = time.monotonic()
+        try:
+            response = await send_request_for_external(
+                "GET",
+                f"{GLIQUID_API}/api/referrals/getAllReferralUsersFast",
+                retry=False,
+                timeout=GLIQUID_SNAPSHOT_TIMEOUT,
+            )
+            # 수만 건 정렬은 thread pool 로 옮길 수 있다
+            index = await loop_monitor.offload(
+                _parse_leaderboard, response, time.time()
+            )
+        except Exception:
+            self._stats["download_failures"] += 1
+            raise
+        self._stats["last_download_seconds"] = time.monotonic() - started_at
+        self._index = index
+        _logger.info(
+            f"gliquid snapshot: {len(index)} users in "
+            f"{self._stats['last_download_seconds']:.2f}s"
+        )
+        return index
+
+    # ================================
+    # Redis
+    # ================================
+    def _redis(self):
+        if self._redis_client is None:
+            self._redis_client = get_redis_async()
+        return self._redis_client
+
+    async def _load_from_redis(self, client) -> bool:
+        try:
+            version = await client.get(f"{REDIS_KEY_PREFIX}:version")
+            if version is None:
+                return False
+            version = float(version)
+            if self._index is not None and self._index.fetched_at >= version:
+                return True
+            payload = await client.get(f"{REDIS_KEY_PREFIX}:data")
+            if payload is None:
+                return False
+            index = LeaderboardIndex.loads(payload)
+        except Exception as e:
+            _logger.warning(f"gliquid snapshot redis load failed: {e}")
+            return False
+        self._index = index
+        self._stats["redis_loads"] += 1
+        return True
+
+    async def _publish(self, client, index: LeaderboardIndex):
+        # 몇 주기 동안 갱신이 실패해도 새로 뜬 worker 가 마지막 index 를 쓸 수 있게 여유를 둔다
+        ttl = max(int(self.interval * 3), 1)
+        try:
+            await client.setex(f"{REDIS_KEY_PREFIX}:data", ttl, index.dumps())
+            # version 은 data 다음에 쓴다 (version 을 본 worker 는 항상 그 data 를 읽는다)
+            await client.setex(
+                f"{REDIS_KEY_PREFIX}:version", ttl, repr(index.fetched_at)
+            )
+        except Exception as e:
+            _logger.warning(f"gliquid snapshot redis publish failed: {e}")
+
+    async def _release_lock(self, client):
+        try:
+            owner = await client.get(f"{REDIS_KEY_PREFIX}:lock")
+            if isinstance(owner, bytes):
+                owner = owner.decode()
+            if owner == self._owner:
+                await client.delete(f"{REDIS_KEY_PREFIX}:lock")
+        except Exception as e:
+            _logger.warning(f"gliquid snapshot redis unlock failed: {e}")
+
+    def shutdown(self):
+        _logger.info(f"gliquid snapshot stats: {self.stats_snapshot()}")
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        index = self._index
+        return {
+            **self._stats,
+            "size": len(index) if index is not None else 0,
+            "age": time.time() - index.fetched_at if index is not None else None,
+        }
+
+
+gliquid_snapshot = GliquidSnapshot()
@@ -0,0 +1,256 @@
+from hypurrquant.logging_config import configure_logging
+
+from pydantic import BaseModel
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+import importlib.util
+import httpx
+import os
+import time
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+BASE_URL = os.getenv("BASE_URL")
+
+# h2 패키지가 설치된 경우에만 HTTP/2 를 사용할 수 있다.
+# h2 는 의존성에 없으므로 기본은 HTTP/1.1 (keep-alive 풀). HTTP/2 를 쓰려면 httpx[http2] 를 설치하고
+# HTTP_INTERNAL_HTTP2 / HTTP_EXTERNAL_HTTP2 를 true 로 설정한다
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+# ================================
+# 풀 설정 / 통계
+# ================================
+class PoolConfig(BaseModel):
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float  # 유휴 커넥션 유지 시간 (초)
+    http2: bool
+    timeout: float = 20.0
+
+    @classmethod
+    def from_env(cls, prefix: str, **defaults) -> "PoolConfig":
+        """
+        HTTP_{prefix}_MAX_CONNECTIONS, HTTP_{prefix}_MAX_KEEPALIVE,
+        HTTP_{prefix}_KEEPALIVE_EXPIRY, HTTP_{prefix}_HTTP2 환경 변수로 기본값을 덮어쓴다.
+        """
+        return cls(
+            max_connections=_env_int(
+                f"HTTP_{prefix}_MAX_CONNECTIONS", defaults["max_connections"]
+            ),
+            max_keepalive_connections=_env_int(
+                f"HTTP_{prefix}_MAX_KEEPALIVE", defaults["max_keepalive_connections"]
+            ),
+            keepalive_expiry=_env_float(
+                f"HTTP_{prefix}_KEEPALIVE_EXPIRY", defaults["keepalive_expiry"]
+            ),
+            http2=_env_bool(f"HTTP_{prefix}_HTTP2", defaults["http2"]),
+        )
+
+
+class PoolStats(BaseModel):
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_latency: float = 0.0  # 초
+    tcp_connects: int = 0  # 새로 맺은 TCP 커넥션 수
+    tls_handshakes: int = 0  # 새로 수행한 TLS handshake 수
+    http2_responses: int = 0
+
+    @property
+    def avg_latency(self) -> Optional[float]:
+        if not self.requests:
+            return None
+        return self.total_latency / self.requests
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        기존 커넥션을 재사용한 요청 비율.
+        """
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.tcp_connects / self.requests)
+
+
+INTERNAL_POOL_CONFIG = PoolConfig.from_env(
+    "INTERNAL",
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+    http2=False,
+)
+EXTERNAL_POOL_CONFIG = PoolConfig.from_env(
+    "EXTERNAL",
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+    http2=False,
+)
+
+
+# ================================
+# 풀
+# ================================
+class _Pool:
+    def __init__(self, name: str, config: PoolConfig):
+        self.name = name
+        self.config = config
+        self.stats = PoolStats()
+        http2 = config.http2 and HTTP2_AVAILABLE
+        if config.http2 and not HTTP2_AVAILABLE:
+            _logger.warning(
+                f"HTTP/2 is enabled for pool {name} but h2 is not installed "
+                "(pip install 'httpx[http2]'), falling back to HTTP/1.1"
+            )
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+        )
+
+    async def _trace(self, event_name: str, info: dict):
+        # httpcore trace 이벤트로 새 커넥션 / TLS handshake 를 센다
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.tcp_connects += 1
+        elif event_name == "connection.start_tls.complete":
+            self.stats.tls_handshakes += 1
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        stats = self.stats
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, extensions={"trace": self._trace}, **kwargs
+            )
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_latency += time.perf_counter() - start
+        if response.http_version == "HTTP/2":
+            stats.http2_responses += 1
+        return response
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats.model_dump(),
+            "avg_latency": self.stats.avg_latency,
+            "reuse_ratio": self.stats.reuse_ratio,
+            "limits": self.config.model_dump(),
+        }
+
+
+# ================================
+# 클라이언트 매니저
+# ================================
+class HttpClientManager:
+    """
+    봇이 소유하는 httpx 커넥션 풀 모음.
+
+    - BASE_URL(내부 백엔드) 전용 풀 1개와 외부 host 별 풀을 따로 유지한다
+    - 외부 host 풀은 처음 요청할 때 만들어진다
+    - start() 전이나 stop() 이후에는 client_for() 가 None 을 반환하고,
+      호출 측은 hypurrquant 의 기본 HTTP 클라이언트를 사용한다
+    """
+
+    INTERNAL = "internal"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = BASE_URL,
+        internal_config: PoolConfig = INTERNAL_POOL_CONFIG,
+        external_config: PoolConfig = EXTERNAL_POOL_CONFIG,
+    ):
+        self.base_url = base_url
+        self.internal_config = internal_config
+        self.external_config = external_config
+        self._host_configs: Dict[str, PoolConfig] = {}
+        self._pools: Dict[str, _Pool] = {}
+        self.started = False
+
+    def configure_host(self, host: str, config: PoolConfig):
+        """
+        특정 외부 host 의 풀 설정을 지정한다. 풀이 만들어지기 전에 호출해야 한다.
+        """
+        self._host_configs[host] = config
+
+    async def start(self):
+        if self.started:
+            return
+        self._pools[self.INTERNAL] = _Pool(self.INTERNAL, self.internal_config)
+        self.started = True
+        _logger.info(
+            f"http client manager started (http2 available: {HTTP2_AVAILABLE})"
+        )
+
+    async def stop(self):
+        if not self.started:
+            return
+        self.started = False
+        pools, self._pools = self._pools, {}
+        _logger.info(f"http client manager stopping: {self._snapshot(pools)}")
+        for pool in pools.values():
+            try:
+                await pool.client.aclose()
+            except Exception:
+                _logger.exception(f"failed to close http pool {pool.name}")
+
+    def client_for(self, url: str) -> Optional[_Pool]:
+        """
+        url 에 맞는 풀. BASE_URL 로 시작하면 내부 풀, 아니면 host 별 외부 풀.
+        """
+        if not self.started:
+            return None
+        if self.base_url and url.startswith(self.base_url):
+            return self._pools[self.INTERNAL]
+
+        host = urlsplit(url).netloc
+        pool = self._pools.get(host)
+        if pool is None:
+            pool = _Pool(host, self._host_configs.get(host, self.external_config))
+            self._pools[host] = pool
+        return pool
+
+    @staticmethod
+    def _snapshot(pools: Dict[str, _Pool]) -> Dict[str, dict]:
+        return {name: pool.snapshot() for name, pool in pools.items()}
+
+    def stats_snapshot(self) -> Dict[str, dict]:
+        """
+        풀 별 요청 수, 에러 수, 동시 요청 수, 평균 latency,
+        새 TCP 커넥션 / TLS handshake 수와 커넥션 재사용 비율.
+        """
+        return self._snapshot(self._pools)
+
+
+http_client_manager = HttpClientManager()
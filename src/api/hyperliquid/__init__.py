@@ -11,3 +11,10 @@ from .rebalance import RebalanceService
 from .models import *
 from .perp_market_data_cache import PerpMarketDataCache
 from .market_data_cache import MarketDataCache, periodic_task
+from .market_data_scheduler import MarketDataScheduler, market_data_scheduler
+from .market_snapshot import (
+    MarketSnapshot,
+    SnapshotView,
+    MarketSnapshotStore,
+    market_snapshot_store,
+)
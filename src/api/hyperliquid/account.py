@@ -8,13 +8,16 @@ from .models import (
 from ..models import BaseResponse, AccountDto
 from hypurrquant.logging_config import configure_logging
 
-from typing import List
+from pydantic import BaseModel
+from typing import List, Type, TypeVar
 
 # ================================
 # 설정 정보
 # ================================
 _logger = configure_logging(__name__)
 
+BalanceModelT = TypeVar("BalanceModelT", bound=BaseModel)
+
 
 # ================================
 # 계좌 정보 서비스
@@ -22,9 +25,14 @@ _logger = configure_logging(__name__)
 @singleton
 class HLAccountService:
     async def get_spot_balance(
-        self, telegram_id: str, nickname: str
-    ) -> SpotBalanceMappingDTO:
+        self,
+        telegram_id: str,
+        nickname: str,
+        model: Type[BalanceModelT] = SpotBalanceMappingDTO,
+    ) -> BalanceModelT:
         """
+        model 을 지정하면 응답 bytes 에서 해당 모델로 바로 검증한다. (기본: SpotBalanceMappingDTO)
+
         return: {balance, margin_summary}
             Name  Balance  hold  entryNtl  EntryPrice    Price     Value      PNL       PNL%
             0  BTC     0.5   0.0    20000    40000.0   45000.0  22500.0   2500.0   12.500000
@@ -36,8 +44,9 @@ class HLAccountService:
         response: BaseResponse = await send_request(
             "GET",
             f"{BASE_URL}/account/balance/spot?telegram_id={telegram_id}&nickname={nickname}",
+            response_model=model,
         )
-        return SpotBalanceMappingDTO(**(response.data))
+        return response.data
 
     async def get_spot_balance_by_public_key(
         self, public_key: str
@@ -49,13 +58,20 @@ class HLAccountService:
         return SpotBalanceMappingDTO(**(response.data))
 
     async def get_perp_balance(
-        self, telegram_id: str, nickname: str
-    ) -> PerpBalanceMappingDTO:
+        self,
+        telegram_id: str,
+        nickname: str,
+        model: Type[BalanceModelT] = PerpBalanceMappingDTO,
+    ) -> BalanceModelT:
+        """
+        model 을 지정하면 응답 bytes 에서 해당 모델로 바로 검증한다. (기본: PerpBalanceMappingDTO)
+        """
         response: BaseResponse = await send_request(
             "GET",
             f"{BASE_URL}/account/balance/perp?telegram_id={telegram_id}&nickname={nickname}",
+            response_model=model,
         )
-        return PerpBalanceMappingDTO(**(response.data))
+        return response.data
 
     async def spot_to_perp(self, telegram_id, value: float):
         """
@@ -1,5 +1,6 @@
 from hypurrquant.logging_config import configure_logging
 from ..utils import BASE_URL, send_request
+from ..cache import response_cache
 from hypurrquant.utils.singleton import Singleton
 from ..models import BaseResponse
 from .models import (
@@ -17,6 +18,7 @@ _logger = configure_logging(__name__)
 # 구매 주문 서비스
 # ================================
 class CopytradingService(metaclass=Singleton):
+    @response_cache.invalidates("subscription_count", "subscription_page")
     async def subscribe(self, public_key: str, target_public_key: str) -> OrderData:
 
         response: BaseResponse = await send_request(
@@ -27,6 +29,7 @@ class CopytradingService(metaclass=Singleton):
         _logger.info(f"subscribe response: {response}")
         return response.data
 
+    @response_cache.invalidates("subscription_count", "subscription_page")
     async def unsubscribe(self, public_key: str, target_public_key: str):
 
         response: BaseResponse = await send_request(
@@ -57,6 +60,7 @@ class CopytradingService(metaclass=Singleton):
         )
         return response.data
 
+    @response_cache.cached("subscription_count", ttl=30)
     async def count_subscription(self) -> SubscribersCountResponse:
         """
         구독자 목록 조회
@@ -67,6 +71,7 @@ class CopytradingService(metaclass=Singleton):
         )
         return response.data
 
+    @response_cache.cached("subscription_page", ttl=30)
     async def page_subscription(
         self, page: int = 1, page_size: int = 15
     ) -> ListSubscriptionsResponse:
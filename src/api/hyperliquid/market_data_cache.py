@@ -1,8 +1,10 @@
 from hypurrquant.models.market_data import MarketData
 from hypurrquant.logging_config import configure_logging
 from ..utils import send_request, BASE_URL
+from ..loop_monitor import loop_monitor
 
-from typing import List, Dict
+from pydantic import ValidationError
+from typing import Dict, List, Optional, Tuple
 import asyncio
 
 # ================================
@@ -28,6 +30,10 @@ class Singleton(type):
         return cls._instances[cls]
 
 
+def _parse_market_datas(raw_datas: List[dict]) -> List[MarketData]:
+    return [MarketData(**data) for data in raw_datas]
+
+
 # ================================
 # api 모듈
 # ================================
@@ -37,6 +43,12 @@ class MarketDataCache(metaclass=Singleton):
         self._coin_by_Tname: Dict[str, MarketData] = None
         self._Tname_by_coin: Dict[str, MarketData] = None
         self._coin_list: List[str] = None
+        # 직전 응답의 원본 dict. 다음 응답과 비교해 변경된 필드만 반영하는 데 사용
+        self._raw_by_Tname: Dict[str, dict] = {}
+        # False면 매 주기마다 전체를 다시 생성 (기존 동작)
+        self.incremental: bool = True
+        # MarketDataScheduler가 publish한 스냅샷 버전
+        self.version: int = 0
 
     @property
     def coin_list(self):
@@ -64,14 +76,111 @@ class MarketDataCache(metaclass=Singleton):
         return self._market_datas
 
     async def _build_data(self):
+        self._commit_update(*(await self._fetch_update()))
+
+    async def _fetch_update(self) -> Tuple[List[dict], Optional[List[MarketData]]]:
+        """
+        응답을 받아 반영할 준비만 한다. 캐시 상태는 바꾸지 않는다.
+
+        Returns:
+            (원본 응답, 전체 파싱 결과). incremental 로 반영할 수 있으면 파싱 결과는 None
+        """
         market_data = await send_request(
             "GET",
             f"{BASE_URL}/data/market-data",
         )
-        self._market_datas = [MarketData(**data) for data in market_data.data]
-        self._coin_by_Tname = {data.Tname: data for data in self.market_datas}
-        self._Tname_by_coin = {data.coin: data for data in self.market_datas}
-        self._coin_list = [spot_meta.coin for spot_meta in self.market_datas]
+        if self.incremental and self._raw_by_Tname:
+            return market_data.data, None
+        # 전체 파싱은 공유 상태를 건드리지 않으므로 thread pool 로 옮길 수 있다
+        market_datas = await loop_monitor.offload(_parse_market_datas, market_data.data)
+        return market_data.data, market_datas
+
+    def _commit_update(
+        self, raw_datas: List[dict], market_datas: Optional[List[MarketData]]
+    ):
+        """
+        _fetch_update 의 결과를 캐시에 반영한다. await 없이 동기적으로 실행된다.
+        """
+        if market_datas is not None:
+            self._rebuild(raw_datas, market_datas)
+        elif self.incremental and self._raw_by_Tname:
+            self._apply_changes(raw_datas)
+        else:
+            self._rebuild(raw_datas, _parse_market_datas(raw_datas))
+
+    def _rebuild(self, raw_datas: List[dict], market_datas: List[MarketData]):
+        """
+        응답 전체로 레코드와 인덱스를 새로 만든다. (최초 로딩 / incremental=False)
+        """
+        self._swap_indexes(market_datas)
+        self._raw_by_Tname = {data["Tname"]: data for data in raw_datas}
+
+    def _apply_changes(self, raw_datas: List[dict]):
+        """
+        직전 응답과 비교해 바뀐 종목의 MarketData 레코드만 새로 만든다. (copy-on-write)
+
+        - 값이 그대로인 종목은 기존 객체를 재사용하고, 바뀐 종목만 검증해서 새 객체로 교체
+        - 기존 레코드는 수정하지 않으므로 이미 publish 된 스냅샷이 복사 없이 레코드를 공유할 수 있다
+        - 변경이 있을 때만 리스트와 인덱스를 새로 만들어 한 번에 교체
+
+        await 없이 동기적으로 실행되므로 이벤트 루프 상의 다른 코루틴은 중간 상태를 볼 수 없다.
+        """
+        prev_raws = self._raw_by_Tname
+        records = self._coin_by_Tname
+        next_raws: Dict[str, dict] = {}
+        market_datas: List[MarketData] = []
+        changed = 0
+
+        for raw in raw_datas:
+            Tname = raw["Tname"]
+            prev = prev_raws.get(Tname)
+            record = records.get(Tname)
+            if prev is not None and record is not None and prev == raw:
+                next_raws[Tname] = prev
+                market_datas.append(record)
+                continue
+            try:
+                market_datas.append(MarketData(**raw))
+            except ValidationError as e:
+                _logger.warning(f"market data {Tname} is invalid: {e!r}")
+                if prev is None or record is None:
+                    continue  # 신규 상장이면 다음 주기에 다시 시도
+                # 직전 레코드를 유지하고, 다음 주기에 다시 비교하도록 직전 원본을 남긴다
+                next_raws[Tname] = prev
+                market_datas.append(record)
+                continue
+            next_raws[Tname] = raw
+            changed += 1
+
+        # 상장폐지 포함
+        if changed or next_raws.keys() != prev_raws.keys():
+            self._swap_indexes(market_datas)
+
+        self._raw_by_Tname = next_raws
+        _logger.debug(f"market data incremental refresh: changed={changed}")
+
+    def _swap_indexes(self, market_datas: List[MarketData]):
+        """
+        새 리스트/인덱스를 모두 만든 뒤 한 번에 교체한다.
+        """
+        coin_by_Tname = {data.Tname: data for data in market_datas}
+        Tname_by_coin = {data.coin: data for data in market_datas}
+        coin_list = [data.coin for data in market_datas]
+
+        (
+            self._market_datas,
+            self._coin_by_Tname,
+            self._Tname_by_coin,
+            self._coin_list,
+        ) = (market_datas, coin_by_Tname, Tname_by_coin, coin_list)
+
+    def mid_px(self, ticker: str) -> float:
+        """
+        ticker(Tname) 의 mid price. USDC 는 spot 마켓 데이터에 없는 quote 자산이므로 1
+        """
+        if ticker == "USDC":
+            return 1.0
+        return float(self.filter_by_Tname(ticker).midPx)
 
     def filter_by_Tname(self, ticker: str):
         Tname = self.coin_by_Tname[ticker]
@@ -0,0 +1,159 @@
+from hypurrquant.utils.singleton import singleton
+from hypurrquant.logging_config import configure_logging
+from .market_data_cache import MarketDataCache
+from .perp_market_data_cache import PerpMarketDataCache
+
+from pydantic import BaseModel
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import time
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+DEFAULT_INTERVAL = 30  # 초
+
+
+# ================================
+# 소스별 수집 통계
+# ================================
+class SourceStats(BaseModel):
+    name: str
+    fetch_count: int = 0
+    error_count: int = 0
+    last_latency: Optional[float] = None  # 마지막 fetch 소요 시간 (초)
+    last_success_at: Optional[float] = None  # 마지막 성공 시각 (epoch 초)
+    last_error: Optional[str] = None
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """
+        마지막으로 성공한 뒤 지난 시간 (초). 한 번도 성공하지 못했다면 None.
+        """
+        if self.last_success_at is None:
+            return None
+        return time.time() - self.last_success_at
+
+    def record_success(self, latency: float):
+        self.fetch_count += 1
+        self.last_latency = latency
+        self.last_success_at = time.time()
+        self.last_error = None
+
+    def record_failure(self, latency: float, error: Exception):
+        self.fetch_count += 1
+        self.error_count += 1
+        self.last_latency = latency
+        self.last_error = repr(error)
+
+
+# ================================
+# 마켓 데이터 통합 스케줄러
+# ================================
+@singleton
+class MarketDataScheduler:
+    """
+    spot / perp 마켓 데이터 캐시를 하나의 클럭으로 갱신한다.
+
+    - 매 주기마다 spot, perp fetch를 동시에 실행
+    - 두 소스가 모두 성공한 주기에만 version을 올리고 구독자에게 알림
+    - 소스별 fetch latency / staleness를 SourceStats로 노출
+    """
+
+    def __init__(self):
+        self.spot_cache = MarketDataCache()
+        self.perp_cache = PerpMarketDataCache()
+        self.version: int = 0
+        self.published_at: Optional[float] = None
+        self.stats: Dict[str, SourceStats] = {
+            "spot": SourceStats(name="spot"),
+            "perp": SourceStats(name="perp"),
+        }
+        self._listeners: List[Callable[[int], None]] = []
+
+    def add_listener(self, listener: Callable[[int], None]):
+        """
+        새 버전이 publish 될 때 호출될 콜백을 등록한다. 콜백은 version을 인자로 받는다.
+        """
+        self._listeners.append(listener)
+
+    def stats_snapshot(self) -> dict:
+        return {
+            "version": self.version,
+            "published_at": self.published_at,
+            "sources": {
+                name: {
+                    "latency": stats.last_latency,
+                    "staleness": stats.staleness,
+                    "fetch_count": stats.fetch_count,
+                    "error_count": stats.error_count,
+                    "last_error": stats.last_error,
+                }
+                for name, stats in self.stats.items()
+            },
+        }
+
+    async def _fetch(self, name: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        stats = self.stats[name]
+        start = time.perf_counter()
+        try:
+            update = await fetch()
+        except Exception as e:
+            stats.record_failure(time.perf_counter() - start, e)
+            raise
+        stats.record_success(time.perf_counter() - start)
+        return update
+
+    async def refresh_once(self) -> bool:
+        """
+        spot, perp 데이터를 동시에 가져온 뒤, 둘 다 성공했을 때만 두 캐시에 함께 반영한다.
+        (한쪽이 실패하면 어느 캐시도 바뀌지 않고 version 도 그대로)
+
+        Returns:
+            bool: 두 소스 모두 성공해 새 버전이 publish 되었으면 True
+        """
+        results = await asyncio.gather(
+            self._fetch("spot", self.spot_cache._fetch_update),
+            self._fetch("perp", self.perp_cache._fetch_update),
+            return_exceptions=True,
+        )
+
+        failed = False
+        for name, result in zip(("spot", "perp"), results):
+            if isinstance(result, Exception):
+                failed = True
+                _logger.error(
+                    f"{name} 마켓 데이터를 가져오던 중 예외가 발생했습니다: {result!r}"
+                )
+        if failed:
+            return False
+
+        # 반영부터 publish 까지 await 가 없으므로 다른 코루틴은 두 캐시가 어긋난 상태를 볼 수 없다
+        spot_update, perp_update = results
+        self.spot_cache._commit_update(*spot_update)
+        self.perp_cache._commit_update(perp_update)
+        self.version += 1
+        self.published_at = time.time()
+        self.spot_cache.version = self.version
+        self.perp_cache.version = self.version
+        for listener in self._listeners:
+            try:
+                listener(self.version)
+            except Exception:
+                _logger.exception("마켓 데이터 publish 콜백 실행 중 예외가 발생했습니다.")
+        return True
+
+    async def run(self, interval: float = DEFAULT_INTERVAL):
+        while True:
+            try:
+                await self.refresh_once()
+                _logger.debug(f"market data scheduler: {self.stats_snapshot()}")
+            except Exception:
+                _logger.exception("마켓 데이터 스케줄러 실행 중 예외가 발생했습니다.")
+            # 모든 소스가 같은 경계(interval의 배수 시각)에 맞춰 실행되도록 대기
+            await asyncio.sleep(interval - (time.time() % interval))
+
+
+market_data_scheduler = MarketDataScheduler()
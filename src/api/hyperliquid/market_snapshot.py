@@ -0,0 +1,238 @@
+from hypurrquant.utils.singleton import singleton
+from hypurrquant.logging_config import configure_logging
+from .market_data_cache import MarketDataCache
+from .perp_market_data_cache import PerpMarketDataCache
+from .market_data_scheduler import market_data_scheduler
+
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+import time
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+SPOT = "spot"
+PERP = "perp"
+SORT_KEYS = ("price", "volume", "funding")
+HISTORY_SIZE = 5  # kind별로 보관할 과거 스냅샷 개수
+
+
+# ================================
+# 불변 스냅샷
+# ================================
+class MarketSnapshot:
+    """
+    특정 버전의 마켓 데이터를 담는 불변 객체.
+
+    - 컬럼(names, coins, mid_px, funding, volume)은 tuple / array 로 보관
+    - name, coin 해시 인덱스와 price / volume / funding 정렬 순서를 생성 시점에 미리 만든다
+    - records 는 캐시 레코드를 그대로 공유한다. 캐시는 레코드를 수정하지 않고 바뀐 종목만 새로 만들기 때문에
+      이후 캐시 갱신의 영향을 받지 않는다
+    """
+
+    __slots__ = (
+        "kind",
+        "version",
+        "created_at",
+        "records",
+        "names",
+        "coins",
+        "mid_px",
+        "funding",
+        "volume",
+        "_row_by_name",
+        "_row_by_coin",
+        "_order_by",
+    )
+
+    def __init__(self, kind: str, version: int, rows: Iterable[Tuple[str, str, object]]):
+        """
+        Args:
+            kind (str): "spot" | "perp"
+            version (int): MarketDataScheduler가 publish한 버전
+            rows: (name, coin, record) 튜플. record 는 midPx, dayNtlVlm (, funding) 을 가진 모델
+        """
+        names, coins, records = [], [], []
+        mid_px, funding, volume = array("d"), array("d"), array("d")
+        for name, coin, record in rows:
+            names.append(name)
+            coins.append(coin)
+            records.append(record)
+            mid_px.append(float(record.midPx or 0.0))
+            funding.append(float(getattr(record, "funding", 0.0) or 0.0))
+            volume.append(float(record.dayNtlVlm or 0.0))
+
+        self.kind = kind
+        self.version = version
+        self.created_at = time.time()
+        self.records = tuple(records)
+        self.names = tuple(names)
+        self.coins = tuple(coins)
+        self.mid_px = mid_px
+        self.funding = funding
+        self.volume = volume
+        self._row_by_name: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._row_by_coin: Dict[str, int] = {coin: i for i, coin in enumerate(coins)}
+        self._order_by: Dict[str, Tuple[int, ...]] = {
+            "price": self._argsort(mid_px),
+            "volume": self._argsort(volume),
+            "funding": self._argsort(funding),
+        }
+
+    @staticmethod
+    def _argsort(column: array) -> Tuple[int, ...]:
+        return tuple(sorted(range(len(column)), key=column.__getitem__))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_order_by"):
+            raise AttributeError("MarketSnapshot is immutable")
+        object.__setattr__(self, name, value)
+
+    def by_name(self, name: str):
+        """
+        Tname(spot) 또는 name(perp) 으로 레코드를 조회한다. 없으면 None.
+        """
+        row = self._row_by_name.get(name)
+        return None if row is None else self.records[row]
+
+    def by_coin(self, coin: str):
+        row = self._row_by_coin.get(coin)
+        return None if row is None else self.records[row]
+
+    def order(self, sort_by: str) -> Tuple[int, ...]:
+        """
+        sort_by 컬럼 기준 오름차순 row index.
+        """
+        if sort_by not in self._order_by:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}")
+        return self._order_by[sort_by]
+
+
+# ================================
+# 스냅샷 뷰 (복사 없이 정렬된 레코드 접근)
+# ================================
+class SnapshotView(Sequence):
+    """
+    스냅샷의 정렬된 순서를 리스트처럼 보여주는 읽기 전용 Sequence.
+
+    pickle 시에는 (kind, version, sort_by, reverse) 만 저장되고,
+    복원 시 MarketSnapshotStore 에서 같은 버전을 다시 찾는다.
+    (버전이 이미 밀려났다면 최신 스냅샷을 사용)
+    """
+
+    def __init__(
+        self, snapshot: MarketSnapshot, sort_by: str = "volume", reverse: bool = True
+    ):
+        self.snapshot = snapshot
+        self.sort_by = sort_by
+        self.reverse = reverse
+        order = snapshot.order(sort_by)
+        self._order = order[::-1] if reverse else order
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index):
+        records = self.snapshot.records
+        if isinstance(index, slice):
+            return [records[row] for row in self._order[index]]
+        return records[self._order[index]]
+
+    def __reduce__(self):
+        return (
+            _restore_view,
+            (self.snapshot.kind, self.snapshot.version, self.sort_by, self.reverse),
+        )
+
+
+def _restore_view(kind: str, version: int, sort_by: str, reverse: bool) -> SnapshotView:
+    return market_snapshot_store.view(kind, sort_by, reverse, version=version)
+
+
+# ================================
+# 스냅샷 저장소
+# ================================
+@singleton
+class MarketSnapshotStore:
+    """
+    kind 별 최신 스냅샷을 참조 교체(atomic reference swap)로 publish 한다.
+    핸들러는 스냅샷 / 뷰 / 버전만 들고 있고, 레코드를 복사하지 않는다.
+    """
+
+    def __init__(self):
+        self.spot_cache = MarketDataCache()
+        self.perp_cache = PerpMarketDataCache()
+        self._current: Dict[str, Optional[MarketSnapshot]] = {SPOT: None, PERP: None}
+        self._history: Dict[str, "OrderedDict[int, MarketSnapshot]"] = {
+            SPOT: OrderedDict(),
+            PERP: OrderedDict(),
+        }
+
+    def _build(self, kind: str, version: int) -> MarketSnapshot:
+        if kind == SPOT:
+            rows = (
+                (data.Tname, data.coin, data)
+                for data in (self.spot_cache._market_datas or [])
+            )
+        elif kind == PERP:
+            rows = (
+                (name, name, data)
+                for name, data in self.perp_cache.market_datas.items()
+            )
+        else:
+            raise ValueError(f"Unknown snapshot kind: {kind}")
+        return MarketSnapshot(kind, version, rows)
+
+    def publish(self, version: int):
+        """
+        캐시의 현재 상태로 spot / perp 스냅샷을 만들어 교체한다.
+        MarketDataScheduler 의 publish 콜백으로 등록된다.
+        """
+        for kind in (SPOT, PERP):
+            snapshot = self._build(kind, version)
+            history = self._history[kind]
+            history[version] = snapshot
+            while len(history) > HISTORY_SIZE:
+                history.popitem(last=False)
+            self._current[kind] = snapshot
+        _logger.debug(f"market snapshot published: version={version}")
+
+    def current(self, kind: str) -> MarketSnapshot:
+        snapshot = self._current[kind]
+        if snapshot is None:
+            # 스케줄러가 아직 publish 하지 않았다면 캐시로 임시 스냅샷 생성
+            snapshot = self._build(kind, market_data_scheduler.version)
+        return snapshot
+
+    def get(self, kind: str, version: Optional[int] = None) -> MarketSnapshot:
+        """
+        지정한 버전의 스냅샷. 없거나 이미 밀려났다면 최신 스냅샷을 반환한다.
+        """
+        if version is not None:
+            snapshot = self._history[kind].get(version)
+            if snapshot is not None:
+                return snapshot
+        return self.current(kind)
+
+    def view(
+        self,
+        kind: str,
+        sort_by: str = "volume",
+        reverse: bool = True,
+        version: Optional[int] = None,
+    ) -> SnapshotView:
+        return SnapshotView(self.get(kind, version), sort_by, reverse)
+
+
+market_snapshot_store = MarketSnapshotStore()
+market_data_scheduler.add_listener(market_snapshot_store.publish)
@@ -20,6 +20,8 @@ class PerpMarketDataCache(GracefulShutdownMixin):
     def __init__(self):
         super().__init__()
         self.market_datas: Dict["str", PerpMarketData] = {}
+        # MarketDataScheduler가 publish한 스냅샷 버전
+        self.version: int = 0
 
     @force_coroutine_logging
     async def _fetch_market_data(self):
@@ -35,7 +37,16 @@ class PerpMarketDataCache(GracefulShutdownMixin):
         return market_data
 
     async def _build_data(self):
-        self.market_datas = await self._fetch_market_data()
+        self._commit_update(await self._fetch_update())
+
+    async def _fetch_update(self) -> Dict[str, PerpMarketData]:
+        """
+        응답을 받아 파싱까지만 한다. 캐시 상태는 바꾸지 않는다.
+        """
+        return await self._fetch_market_data()
+
+    def _commit_update(self, market_datas: Dict[str, PerpMarketData]):
+        self.market_datas = market_datas
 
     async def run_once(self):
         _logger.debug("PerpMarketDataCache run_once called")
@@ -2,6 +2,7 @@ from hypurrquant.logging_config import configure_logging
 from hypurrquant.utils.singleton import Singleton
 from hypurrquant.models.market_data import MarketData
 from ..utils import BASE_URL, send_request
+from ..cache import response_cache
 from ..models import BaseResponse
 from ..exception import NoDataWihtFilter
 from .models import StrategyMeta
@@ -44,6 +45,7 @@ class StrategyService(metaclass=Singleton):
 
         return data
 
+    @response_cache.cached("strategies", ttl=300)
     async def get_strategies(
         self, strategy_type: Optional[str] = None
     ) -> Dict[str, StrategyMeta]:
@@ -55,6 +57,7 @@ class StrategyService(metaclass=Singleton):
             method="GET",
             url=f"{BASE_URL}/strategy/general/strategies",
             params={"state": strategy_type} if strategy_type else None,
+            coalesce=True,
         )
 
         # response.data -> { "price_momentum": {...}, "smallcap_opportunity": {...}, ... }
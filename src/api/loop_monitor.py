@@ -0,0 +1,308 @@
+from hypurrquant.logging_config import configure_logging, coroutine_id
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+import asyncio
+import bisect
+import contextvars
+import functools
+import os
+import time
+import types
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL") or 0.25)  # 초
+LOOP_SLOW_THRESHOLD = float(os.getenv("LOOP_SLOW_THRESHOLD") or 0.1)  # 초
+LOOP_REPORT_INTERVAL = float(os.getenv("LOOP_REPORT_INTERVAL") or 300)  # 초
+# asyncio debug 모드의 slow callback 로그까지 켤지 여부 (오버헤드가 커서 기본은 꺼둔다)
+LOOP_ASYNCIO_DEBUG = os.getenv("LOOP_ASYNCIO_DEBUG", "").lower() in ("1", "true")
+# 무거운 render / parse 함수를 thread pool 에서 실행할지 여부
+LOOP_OFFLOAD_ENABLED = os.getenv("LOOP_OFFLOAD_ENABLED", "").lower() in ("1", "true")
+LOOP_OFFLOAD_WORKERS = int(os.getenv("LOOP_OFFLOAD_WORKERS") or 4)
+
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)  # 초
+RECENT_SLOW_SIZE = 50  # 최근 slow step 보관 개수
+
+# 이름을 붙일 때 우선하는 (봇 코드) 모듈 prefix
+_APP_MODULES = ("handler.", "api.")
+
+
+def _histogram(buckets: List[int]) -> Dict[str, int]:
+    return dict(zip([*map(str, LAG_BUCKETS), "inf"], buckets))
+
+
+def _describe(coro: Any) -> str:
+    """
+    await 체인을 따라 내려가며 가장 안쪽의 봇 코드 코루틴 이름을 찾는다.
+    """
+    name = getattr(coro, "__qualname__", repr(coro))
+    while coro is not None:
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        if code is None:
+            break
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        module = frame.f_globals.get("__name__", "") if frame else ""
+        if module.startswith(_APP_MODULES):
+            name = f"{module}.{code.co_qualname}"
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return name
+
+
+# ================================
+# 이벤트 루프 감시
+# ================================
+class EventLoopMonitor:
+    """
+    이벤트 루프 지연(lag)을 측정하고, 루프를 오래 붙잡은 코루틴을 찾아낸다.
+
+    - 주기적으로 sleep 한 뒤 실제로 깨어난 시각과의 차이를 lag 로 기록한다
+    - instrument() 로 감싼 코루틴은 한 번 실행될 때(step)마다 시간을 재고,
+      slow_threshold 를 넘으면 코루틴 이름과 coroutine_id 를 함께 남긴다
+    - offload() 로 지정한 동기 함수는 LOOP_OFFLOAD_ENABLED 일 때 thread pool 에서 실행한다.
+      GIL 때문에 CPU 시간이 줄지는 않지만, 그동안 다른 update 가 루프를 사용할 수 있다
+    - lag / slow step 분포와 함수별 실행 시간을 stats_snapshot() 으로 노출한다
+    """
+
+    def __init__(
+        self,
+        interval: float = LOOP_MONITOR_INTERVAL,
+        slow_threshold: float = LOOP_SLOW_THRESHOLD,
+        report_interval: float = LOOP_REPORT_INTERVAL,
+        offload_enabled: bool = LOOP_OFFLOAD_ENABLED,
+        offload_workers: int = LOOP_OFFLOAD_WORKERS,
+    ):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.report_interval = report_interval
+        self.offload_enabled = offload_enabled
+        self.offload_workers = offload_workers
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._lag_buckets: List[int] = [0] * (len(LAG_BUCKETS) + 1)
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._step_buckets: List[int] = [0] * (len(LAG_BUCKETS) + 1)
+        # 코루틴 이름 -> {"count", "total", "max"}
+        self._slow_by_name: Dict[str, Dict[str, float]] = {}
+        # (발생 시각, 코루틴 이름, coroutine_id, 소요 시간)
+        self._recent_slow: Deque[Tuple[float, str, Optional[str], float]] = deque(
+            maxlen=RECENT_SLOW_SIZE
+        )
+        # 함수 이름 -> {"calls", "offloaded", "total", "max"}
+        self._offload_stats: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        if LOOP_ASYNCIO_DEBUG:
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.slow_threshold
+        self._task = asyncio.create_task(self._sample())
+        _logger.info(
+            f"event loop monitor started (interval={self.interval}, "
+            f"slow_threshold={self.slow_threshold}, offload={self.offload_enabled})"
+        )
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        _logger.info(f"event loop monitor stats: {self.stats_snapshot()}")
+
+    # ================================
+    # lag 측정
+    # ================================
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        next_report = loop.time() + self.report_interval
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            lag = max(0.0, now - started - self.interval)
+            self._record_lag(lag)
+
+            if lag >= self.slow_threshold:
+                last = self._recent_slow[-1] if self._recent_slow else None
+                if last and time.time() - last[0] <= lag + self.interval:
+                    _logger.warning(
+                        f"event loop lag {lag:.3f}s, last slow step: "
+                        f"{last[1]} (coroutine_id={last[2]}, {last[3]:.3f}s)"
+                    )
+                else:
+                    _logger.warning(f"event loop lag {lag:.3f}s (unattributed)")
+
+            if now >= next_report:
+                next_report = now + self.report_interval
+                _logger.info(f"event loop monitor stats: {self.stats_snapshot()}")
+
+    def _record_lag(self, lag: float):
+        self._lag_buckets[bisect.bisect_left(LAG_BUCKETS, lag)] += 1
+        self._lag_total += lag
+        self._lag_max = max(self._lag_max, lag)
+
+    # ================================
+    # 코루틴 step 측정
+    # ================================
+    def instrument(self, coro: Awaitable[Any]) -> Awaitable[Any]:
+        """
+        coro 를 step 단위로 시간을 재는 awaitable 로 감싼다. 모니터가 꺼져 있으면 그대로 반환.
+        """
+        if not self.running:
+            return coro
+        return self._instrumented(coro)
+
+    async def _instrumented(self, coro: Awaitable[Any]) -> Any:
+        return await self._timed(coro)
+
+    def _record_step(self, coro: Any, elapsed: float):
+        self._step_buckets[bisect.bisect_left(LAG_BUCKETS, elapsed)] += 1
+        if elapsed < self.slow_threshold:
+            return
+        name = _describe(coro)
+        cor_id = coroutine_id.get(None)
+        stats = self._slow_by_name.setdefault(
+            name, {"count": 0, "total": 0.0, "max": 0.0}
+        )
+        stats["count"] += 1
+        stats["total"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+        self._recent_slow.append((time.time(), name, cor_id, elapsed))
+        _logger.warning(f"slow step {elapsed:.3f}s in {name} (coroutine_id={cor_id})")
+
+    @types.coroutine
+    def _timed(self, coro: Awaitable[Any]):
+        iterator = coro.__await__()
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            started = time.perf_counter()
+            try:
+                if error is not None:
+                    yielded = iterator.throw(error)
+                else:
+                    yielded = iterator.send(value)
+            except StopIteration as e:
+                self._record_step(coro, time.perf_counter() - started)
+                return e.value
+            except BaseException:
+                self._record_step(coro, time.perf_counter() - started)
+                raise
+            self._record_step(coro, time.perf_counter() - started)
+
+            value, error = None, None
+            try:
+                value = yield yielded
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as e:
+                error = e
+
+    # ================================
+    # thread pool offload
+    # ================================
+    def _record_call(self, func: Callable, elapsed: float, offloaded: bool):
+        name = getattr(func, "__qualname__", repr(func))
+        stats = self._offload_stats.setdefault(
+            name, {"calls": 0, "offloaded": 0, "total": 0.0, "max": 0.0}
+        )
+        stats["calls"] += 1
+        stats["offloaded"] += int(offloaded)
+        stats["total"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+
+    def _run_timed(self, func: Callable, args, kwargs, offloaded: bool) -> Any:
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._record_call(func, time.perf_counter() - started, offloaded)
+
+    async def offload(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        무거운 동기 함수(render / parse)를 실행한다.
+
+        LOOP_OFFLOAD_ENABLED 이면 thread pool 에서, 아니면 지금처럼 루프 위에서 바로 실행한다.
+        contextvars(coroutine_id 등)는 복사해서 넘기므로 로그 문맥이 유지된다.
+        func 는 공유 객체를 변경하지 않아야 한다.
+
+        Args:
+            func (Callable): 실행할 동기 함수
+            *args, **kwargs: func 에 그대로 전달
+
+        Returns:
+            Any: func 의 반환값
+        """
+        if not self.offload_enabled:
+            return self._run_timed(func, args, kwargs, False)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.offload_workers, thread_name_prefix="loop-offload"
+            )
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(context.run, self._run_timed, func, args, kwargs, True),
+        )
+
+    # ================================
+    # 통계
+    # ================================
+    def stats_snapshot(self) -> dict:
+        """
+        lag_histogram: 샘플링한 루프 지연 분포 (초 단위 상한 -> 개수)
+        step_histogram: instrument 한 코루틴의 step 당 실행 시간 분포
+        slow: slow_threshold 를 넘은 코루틴 이름별 count / avg / max
+        offload: offload() 로 실행한 함수별 호출 수 / thread pool 실행 수 / avg / max
+        """
+        samples = sum(self._lag_buckets)
+        return {
+            "lag_avg": self._lag_total / samples if samples else 0.0,
+            "lag_max": self._lag_max,
+            "lag_histogram": _histogram(self._lag_buckets),
+            "step_histogram": _histogram(self._step_buckets),
+            "slow": {
+                name: {
+                    "count": stats["count"],
+                    "avg": stats["total"] / stats["count"],
+                    "max": stats["max"],
+                }
+                for name, stats in self._slow_by_name.items()
+            },
+            "recent_slow": [
+                {"name": name, "coroutine_id": cor_id, "elapsed": elapsed}
+                for _, name, cor_id, elapsed in self._recent_slow
+            ],
+            "offload": {
+                name: {
+                    "calls": stats["calls"],
+                    "offloaded": stats["offloaded"],
+                    "avg": stats["total"] / stats["calls"],
+                    "max": stats["max"],
+                }
+                for name, stats in self._offload_stats.items()
+            },
+        }
+
+
+loop_monitor = EventLoopMonitor()
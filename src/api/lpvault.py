@@ -1,7 +1,9 @@
-from hypurrquant.api.async_http import send_request_for_external
 from hypurrquant.utils.singleton import Singleton
 from hypurrquant.logging_config import configure_logging
-from .utils import send_request, BASE_URL
+from .utils import send_request, send_request_for_external, BASE_URL
+from .cache import response_cache
+from .resilience import PROVIDER_TIMEOUT, provider_guards
+from .gliquid import GLIQUID_POINTS_ENABLED, gliquid_snapshot
 from .models import (
     LpVaultWithConfigDict,
     DexInforesponse,
@@ -12,8 +14,7 @@ from .models import (
 )
 import asyncio
 from dotenv import load_dotenv
-from typing import List
-import aiocache
+from typing import List, Optional
 
 # ================================
 # 설정 정보
@@ -21,12 +22,24 @@ import aiocache
 _logger = configure_logging(__name__)
 load_dotenv()
 
+# 포인트 provider (외부 API)
+HYBRA_API = "https://server.hybra.finance"
+PRJX_API = "https://api.prjx.com"
+HYPERBLOOM_API = "https://api.hyperbloom.xyz"
+
+# provider 별 circuit breaker / 마지막 값 / 지표. 화면은 PROVIDER_BUDGET 이상 기다리지 않는다
+# provider 가 모르는 지갑(4xx)은 기존처럼 0 포인트로 보여준다
+_hybra_points = provider_guards.guard("points.hybra", rejected_value=0.0)
+_prjx_points = provider_guards.guard("points.prjx", rejected_value=0.0)
+_hyperbloom_points = provider_guards.guard("points.hyperbloom", rejected_value=0.0)
+
 
 # ================================
 # 계좌 정보 서비스
 # ================================
 class LpVaultService(metaclass=Singleton):
 
+    @response_cache.invalidates("lp_list")
     async def register_defi_lp_vault_account(
         self, telegram_id: str, nickname: str
     ) -> AccountDto:
@@ -47,6 +60,7 @@ class LpVaultService(metaclass=Singleton):
         )
         return response.data
 
+    @response_cache.invalidates("lp_list")
     async def unregister_defi_lp_vault_account(self, public_key: str) -> bool:
         """
         Unregister a DeFi LP Vault account.
@@ -67,6 +81,7 @@ class LpVaultService(metaclass=Singleton):
     # ================================
     # Lpvault CURD
     # ================================
+    @response_cache.cached("dex_list", ttl=300, redis=True)
     async def dex_list(self, chain: str) -> List[DexInforesponse]:
         """
         사용 가능한 DEX 목록을 조회합니다.
@@ -75,10 +90,11 @@ class LpVaultService(metaclass=Singleton):
             List[str]: DEX 목록
         """
         response: BaseResponse = await send_request(
-            "GET", f"{BASE_URL}/dex/lp-vault/dex_list?chain={chain}"
+            "GET", f"{BASE_URL}/dex/lp-vault/dex_list?chain={chain}", coalesce=True
         )
         return response.data
 
+    @response_cache.cached("pool_list", ttl=300, redis=True)
     async def pool_list(self, chain: str, dex_type: str) -> dict:
         """
         사용 가능한 DEX의 풀 목록을 조회합니다.
@@ -92,9 +108,11 @@ class LpVaultService(metaclass=Singleton):
         response: BaseResponse = await send_request(
             "GET",
             f"{BASE_URL}/dex/lp-vault/pool_list?dex_type={dex_type}&chain={chain}",
+            coalesce=True,
         )
         return response.data
 
+    @response_cache.cached("aggregator_list", ttl=300, redis=True)
     async def aggregator_list(self, chain: str) -> List[str]:
         """
         사용 가능한 DEX의 Aggregator 목록을 조회합니다.
@@ -105,9 +123,11 @@ class LpVaultService(metaclass=Singleton):
         response: BaseResponse = await send_request(
             "GET",
             f"{BASE_URL}/dex/lp-vault/aggregator_list?chain={chain}",
+            coalesce=True,
         )
         return response.data
 
+    @response_cache.cached("lp_list", ttl=30, maxsize=1024)
     async def lp_list(self, public_key: str) -> List[LpVaultWithConfigDict]:
         """
         사용자의 Uniswap V3 유사형 NFT LP 포지션 정보를 조회합니다.
@@ -124,7 +144,7 @@ class LpVaultService(metaclass=Singleton):
         )
         return response.data
 
-    @aiocache.cached()
+    @response_cache.cached("address_by_ticker", ttl=3600, redis=True)
     async def get_address_by_ticker(self, chain: str, ticker: str) -> str:
         response: BaseResponse = await send_request(
             "GET",
@@ -132,11 +152,12 @@ class LpVaultService(metaclass=Singleton):
         )
         return response.data
 
-    @aiocache.cached()
+    @response_cache.cached("core_tokens", ttl=3600, redis=True)
     async def get_core_tokens(self, chain: str) -> CoreToken:
         response: BaseResponse = await send_request(
             "GET",
             f"{BASE_URL}/dex/core-tokens?chain={chain}",
+            coalesce=True,
         )
         return response.data
 
@@ -201,6 +222,7 @@ class LpVaultService(metaclass=Singleton):
         )
         return response.data
 
+    @response_cache.invalidates("lp_list")
     async def register(
         self,
         public_key,
@@ -245,6 +267,7 @@ class LpVaultService(metaclass=Singleton):
         )
         return response.data
 
+    @response_cache.invalidates("lp_list")
     async def unregister(self, lp_vault_id, *, remove_nft_positions=False):
         """
         계좌 정보를 삭제하는 메서드
@@ -277,20 +300,28 @@ class LpVaultService(metaclass=Singleton):
             #     "Hyperbloom": d,
             # }
 
+            # 값을 아직 모르는 provider 는 None (조회는 백그라운드에서 계속된다)
             a, b, d = await asyncio.gather(
-                self._get_hybra_points(public_key),
-                self._get_prjx_points(public_key),
-                self._get_hyperbloom_points(public_key),
+                _hybra_points.get(
+                    public_key, lambda: self._get_hybra_points(public_key)
+                ),
+                _prjx_points.get(public_key, lambda: self._get_prjx_points(public_key)),
+                _hyperbloom_points.get(
+                    public_key, lambda: self._get_hyperbloom_points(public_key)
+                ),
             )
-            return {
+            points = {
                 "Hybra": a,
                 "Prjx": b,
                 "Hyperbloom": d,
             }
+            if GLIQUID_POINTS_ENABLED:
+                # 백그라운드 snapshot 에서 조회하므로 기다리지 않는다
+                points["GLiquid"] = self._get_gliquid_points(public_key)
+            return points
 
         _logger.info(f"Unsupported chain for points: {chain}")
 
-    @aiocache.cached(ttl=300, cache=aiocache.SimpleMemoryCache)
     async def _get_hybra_points(self, public_key: str) -> float:
         """
         Get Hybra points for a specific account.
@@ -303,16 +334,15 @@ class LpVaultService(metaclass=Singleton):
         """
         response = await send_request_for_external(
             "GET",
-            f"https://server.hybra.finance/api/points/user/{public_key}",
+            f"{HYBRA_API}/api/points/user/{public_key}",
             retry=False,
-            timeout=20,
+            timeout=PROVIDER_TIMEOUT,
         )
         _logger.debug(f"Hybra points response: {response}")
         if not response or not isinstance(response, dict):
             return 0
         return float((response.get("data") or {}).get("totalPoints") or 0.0)
 
-    @aiocache.cached(ttl=300, cache=aiocache.SimpleMemoryCache)
     async def _get_prjx_points(self, public_key: str) -> float:
         """
         Get PRJX points for a specific account.
@@ -323,21 +353,16 @@ class LpVaultService(metaclass=Singleton):
         Returns:
             float: PRJX points value.
         """
-        try:
-            response = await send_request_for_external(
-                "GET",
-                f"https://api.prjx.com/scorecard/impersonate/{public_key}?format=json",
-                retry=False,
-                timeout=20,
-            )
-            if not response or not isinstance(response, dict):
-                return 0
-            return float((response.get("stats") or {}).get("totalPoints") or 0.0)
-        except Exception as e:
-            _logger.info(f"Error fetching PRJX points for {public_key}: {e}")
-            return 0.0
-
-    @aiocache.cached(ttl=300, cache=aiocache.SimpleMemoryCache)
+        response = await send_request_for_external(
+            "GET",
+            f"{PRJX_API}/scorecard/impersonate/{public_key}?format=json",
+            retry=False,
+            timeout=PROVIDER_TIMEOUT,
+        )
+        if not response or not isinstance(response, dict):
+            return 0
+        return float((response.get("stats") or {}).get("totalPoints") or 0.0)
+
     async def _get_hyperbloom_points(self, public_key: str) -> float:
         """
         Get Hyperbloom points for a specific account.
@@ -348,59 +373,28 @@ class LpVaultService(metaclass=Singleton):
         Returns:
             float: Hyperbloom points value.
         """
-        try:
-            response = await send_request_for_external(
-                "GET",
-                f"https://api.hyperbloom.xyz/points?address={public_key}",
-                retry=False,
-                timeout=20,
-            )
-            _logger.debug(f"Hyperbloom points response: {response}")
-            if not response or not isinstance(response, dict):
-                return 0
-            return float(response.get("points", 0.0))
-        except Exception as e:
-            _logger.info(f"Error fetching Hyperbloom points for {public_key}: {e}")
-            return 0.0
+        response = await send_request_for_external(
+            "GET",
+            f"{HYPERBLOOM_API}/points?address={public_key}",
+            retry=False,
+            timeout=PROVIDER_TIMEOUT,
+        )
+        _logger.debug(f"Hyperbloom points response: {response}")
+        if not response or not isinstance(response, dict):
+            return 0
+        return float(response.get("points", 0.0))
 
-    async def _get_gliquid_points(self, public_key: str) -> float:
+    def _get_gliquid_points(self, public_key: str) -> Optional[float]:
         """
-        Get GLiquid points for a specific account.
+        Get GLiquid points for a specific account from the leaderboard snapshot.
 
         Args:
             public_key (str): Public key of the account.
 
         Returns:
-            float: GLiquid points value.
+            Optional[float]: GLiquid points value, None until the first snapshot is loaded.
         """
-        try:
-            parsed = await self._get_gliquid_all_points()
-            user_data = parsed.get(public_key.lower(), {})
-            points = user_data.get("points", 0)
-            return float(points)
-        except Exception as e:
-            _logger.info(f"Error fetching GLiquid points for {public_key}: {e}")
-            return 0.0
-
-    @aiocache.cached(ttl=300, cache=aiocache.SimpleMemoryCache)
-    async def _get_gliquid_all_points(self) -> dict:
-        """
-        Get all GLiquid points for all accounts.
-
-        Returns:
-            dict: Dictionary of public keys and their GLiquid points.
-        """
-        try:
-            response = await send_request_for_external(
-                "GET",
-                "https://api.gliquid.xyz/api/referrals/getAllReferralUsersFast",
-                retry=False,
-                timeout=20,
-            )
-            return {data["address"].lower(): data for data in response["users"]}
-        except Exception as e:
-            _logger.exception(f"Error fetching GLiquid points: {e}")
-            return {}
+        return gliquid_snapshot.lookup(public_key)
 
     # ================================
     # Swap
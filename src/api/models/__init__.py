@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Any, Optional
+from typing import Any, Generic, Optional, TypeVar
 
 from ._lpvault import *
 from ._account import *
@@ -13,3 +13,17 @@ class BaseResponse(BaseModel):
     data: Any
     error_message: Optional[str] = None
     message: Optional[str] = None
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class TypedResponse(BaseResponse, Generic[ModelT]):
+    """
+    data 를 지정한 모델로 바로 검증하는 응답 DTO.
+
+    TypedResponse[Model].model_validate_json(raw_bytes) 한 번으로
+    JSON 파싱과 data 검증을 끝낸다. (중간 dict / DTO 를 만들지 않음)
+    """
+
+    data: Optional[ModelT] = None
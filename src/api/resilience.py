@@ -0,0 +1,302 @@
+from hypurrquant.logging_config import configure_logging
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import httpx
+import os
+import time
+
+# ================================
+# 설정 정보
+# ================================
+_logger = configure_logging(__name__)
+
+# 초, 마지막 값을 이 시간 동안은 다시 조회하지 않고 사용
+PROVIDER_TTL = float(os.getenv("PROVIDER_TTL") or 300)
+# 초, 마지막 값이 없을 때 화면이 기다리는 최대 시간
+PROVIDER_BUDGET = float(os.getenv("PROVIDER_BUDGET") or 1.0)
+# 초, 조회 자체의 timeout (budget 을 넘겨도 여기까지는 백그라운드에서 기다린다)
+PROVIDER_TIMEOUT = float(os.getenv("PROVIDER_TIMEOUT") or 5.0)
+# 연속 실패 횟수, 넘으면 circuit 이 open 된다
+PROVIDER_BREAKER_FAILURES = int(os.getenv("PROVIDER_BREAKER_FAILURES") or 3)
+PROVIDER_BREAKER_COOLDOWN = float(os.getenv("PROVIDER_BREAKER_COOLDOWN") or 60)  # 초
+PROVIDER_CACHE_SIZE = int(os.getenv("PROVIDER_CACHE_SIZE") or 10000)  # key 수
+
+
+# ================================
+# circuit breaker
+# ================================
+class CircuitBreaker:
+    """
+    연속 failure_threshold 번 실패(timeout 포함)하면 open 되어 cooldown 동안 호출을 막는다.
+    cooldown 이 지나면 half_open 으로 한 번만 시험 호출을 허용하고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = PROVIDER_BREAKER_FAILURES,
+        cooldown: float = PROVIDER_BREAKER_COOLDOWN,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened = 0  # open 된 횟수
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            _logger.info(f"circuit {self.name} closed")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self._probing = False
+        if (
+            self.state == self.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != self.OPEN:
+                self.opened += 1
+                _logger.warning(
+                    f"circuit {self.name} open for {self.cooldown}s "
+                    f"after {self.consecutive_failures} consecutive failures"
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self):
+        """
+        시험 호출이 결과 없이 취소된 경우. 다음 호출이 다시 시험할 수 있게 한다
+        """
+        self._probing = False
+
+
+def _rejected(e: BaseException) -> bool:
+    """
+    provider 는 정상이고 이 key 에 대한 요청만 거절한 경우 (모르는 지갑의 404 등 4xx).
+    429 는 provider 가 부하를 받고 있다는 뜻이므로 실패로 센다
+    """
+    if not isinstance(e, httpx.HTTPStatusError):
+        return False
+    status = e.response.status_code
+    return 400 <= status < 500 and status != 429
+
+
+class _Known:
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value: Any, fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+# ================================
+# 외부 provider 조회 보호
+# ================================
+class ProviderGuard:
+    """
+    느리거나 불안정한 외부 provider(포인트 API 등)의 조회를 감싼다.
+
+    - key 별 마지막 성공 값을 기억한다. ttl 이내면 조회하지 않고 그대로 돌려준다
+    - ttl 이 지났으면 마지막 값을 바로 돌려주고 백그라운드에서 갱신한다 (화면은 기다리지 않음)
+    - 마지막 값이 없으면 budget 까지만 기다린다. 넘으면 None 을 돌려주고 조회는 백그라운드에서
+      계속되어 다음 요청에 쓰인다
+    - 같은 key 의 조회는 동시에 하나만 보낸다
+    - timeout / 전송 오류 / 5xx / 429 는 CircuitBreaker 에 기록되고, open 상태에서는 조회하지 않고
+      마지막 값(또는 None)을 쓴다
+    - 그 밖의 4xx 는 그 key 만의 응답이므로 breaker 에 세지 않고 rejected_value 를 ttl 동안 값으로 쓴다
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float = PROVIDER_TTL,
+        budget: float = PROVIDER_BUDGET,
+        timeout: float = PROVIDER_TIMEOUT,
+        breaker: Optional[CircuitBreaker] = None,
+        maxsize: int = PROVIDER_CACHE_SIZE,
+        rejected_value: Any = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.budget = budget
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker(name)
+        self.maxsize = maxsize
+        self.rejected_value = rejected_value
+        self._known: "OrderedDict[Hashable, _Known]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "fresh": 0,  # ttl 이내 값으로 응답
+            "stale": 0,  # 지난 값으로 응답 (갱신은 백그라운드)
+            "empty": 0,  # 값 없이 응답 (None)
+            "over_budget": 0,  # budget 을 넘겨 기다리지 않음
+            "fetches": 0,
+            "successes": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "rejected": 0,  # 4xx, 해당 key 만 rejected_value 로 응답
+            "short_circuited": 0,  # breaker open 으로 조회하지 않음
+            "total_latency": 0.0,
+            "max_latency": 0.0,
+        }
+
+    async def get(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Optional[Any]:
+        """
+        Args:
+            key (Hashable): 조회 대상 (public_key 등)
+            fetch (Callable): 실제 조회 코루틴을 만드는 함수
+
+        Returns:
+            Optional[Any]: 조회 값, 마지막 값, 또는 None
+        """
+        self._stats["requests"] += 1
+        known = self._known.get(key)
+        if known is not None:
+            self._known.move_to_end(key)
+            if time.monotonic() - known.fetched_at < self.ttl:
+                self._stats["fresh"] += 1
+                return known.value
+
+        task = self._refresh(key, fetch)
+        if known is not None or task is None:
+            return self._fallback(known)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.budget)
+        except asyncio.TimeoutError:
+            self._stats["over_budget"] += 1
+        except Exception:
+            pass
+        return self._fallback(self._known.get(key))
+
+    def _fallback(self, known: Optional[_Known]) -> Optional[Any]:
+        if known is None:
+            self._stats["empty"] += 1
+            return None
+        self._stats["stale"] += 1
+        return known.value
+
+    def _refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Optional[asyncio.Task]:
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+        if not self.breaker.allow():
+            self._stats["short_circuited"] += 1
+            return None
+        task = asyncio.create_task(self._fetch(key, fetch))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._done(key, done))
+        return task
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 백그라운드 갱신의 예외는 _fetch 에서 이미 기록했다
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        self._stats["fetches"] += 1
+        started_at = time.monotonic()
+        try:
+            value = await asyncio.wait_for(fetch(), self.timeout)
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            self.breaker.record_failure()
+            _logger.info(f"{self.name} timed out after {self.timeout}s for {key}")
+            raise
+        except Exception as e:
+            if not _rejected(e):
+                self._stats["failures"] += 1
+                self.breaker.record_failure()
+                _logger.info(f"{self.name} failed for {key}: {e!r}")
+                raise
+            # provider 는 응답했다 -> breaker 에는 성공으로, 값은 이 key 의 negative entry 로
+            self._stats["rejected"] += 1
+            _logger.debug(f"{self.name} rejected {key}: {e!r}")
+            value = self.rejected_value
+        else:
+            latency = time.monotonic() - started_at
+            self._stats["successes"] += 1
+            self._stats["total_latency"] += latency
+            self._stats["max_latency"] = max(self._stats["max_latency"], latency)
+
+        self.breaker.record_success()
+        self._known[key] = _Known(value, time.monotonic())
+        self._known.move_to_end(key)
+        while len(self._known) > self.maxsize:
+            self._known.popitem(last=False)
+        return value
+
+    def shutdown(self):
+        for task in list(self._inflight.values()):
+            task.cancel()
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        successes = self._stats["successes"]
+        return {
+            **self._stats,
+            "avg_latency": (
+                self._stats["total_latency"] / successes if successes else None
+            ),
+            "state": self.breaker.state,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "opened": self.breaker.opened,
+            "in_flight": len(self._inflight),
+            "size": len(self._known),
+        }
+
+
+class ProviderGuards:
+    """
+    이름별 ProviderGuard 모음. provider 별 health 지표를 한 번에 노출한다
+    """
+
+    def __init__(self):
+        self._guards: Dict[str, ProviderGuard] = {}
+
+    def guard(self, name: str, **kwargs) -> ProviderGuard:
+        guard = self._guards.get(name)
+        if guard is None:
+            guard = self._guards[name] = ProviderGuard(name, **kwargs)
+        return guard
+
+    def stats_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: guard.stats_snapshot() for name, guard in self._guards.items()}
+
+    def shutdown(self):
+        for guard in self._guards.values():
+            guard.shutdown()
+        _logger.info(f"external provider stats: {self.stats_snapshot()}")
+
+
+provider_guards = ProviderGuards()
@@ -1,41 +1,334 @@
-from hypurrquant.api.async_http import send_request as send_request_core
+from hypurrquant.api.async_http import (
+    send_request as send_request_core,
+    send_request_for_external as send_request_for_external_core,
+)
 from hypurrquant.logging_config import (
     configure_logging,
 )
 from hypurrquant.api.exception import BaseOrderException
-from .exception import get_exception_by_code
-import os
+from .exception import ApiException, get_exception_by_code
+from .http_client import http_client_manager
+from .loop_monitor import loop_monitor
+from .models import BaseResponse, TypedResponse
 
+from pydantic import BaseModel, ValidationError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Type
+from urllib.parse import urlsplit
+import asyncio
+import httpx
+import os
+import time
 
 # ================================
 # 설정 정보
 # ================================
 _logger = configure_logging(__name__)
 DEFAULT_SLIPPAGE = 0.01
+EXTERNAL_RETRY_COUNT = 3
+EXTERNAL_RETRY_BACKOFF = 0.5  # 초, 시도마다 2배
 
 BASE_URL = os.getenv("BASE_URL")
 
 
-async def send_request(method: str, url: str, *, timeout: float = 20.0, **kwargs):
+# ================================
+# Single-flight (동일 요청 병합)
+# ================================
+class _Flight:
+    __slots__ = ("task", "started_at", "waiters", "detached", "abandoned")
+
+    def __init__(self, task: asyncio.Task, detached: bool = False):
+        self.task = task
+        self.started_at = time.time()
+        self.waiters = 0
+        self.detached = detached  # start() 로 시작한 백그라운드 실행은 취소하지 않음
+        self.abandoned = False  # 기다리는 호출이 모두 취소되어 task 도 취소함
+
+
+class SingleFlight:
     """
-    Send an HTTP request using the configured base URL.
+    같은 key로 동시에 들어온 요청을 하나의 in-flight task로 합친다.
 
-    Args:
-        method (str): HTTP method (GET, POST, etc.)
-        url (str): Endpoint URL
-        **kwargs: Additional parameters for the request
+    처음 들어온 호출이 fn 을 별도 task 로 시작하고, 모든 호출(처음 호출 포함)은
+    asyncio.shield 로 그 task 를 기다린다. 어느 호출이 취소되어도 나머지 호출은 영향을 받지 않으며,
+    기다리는 호출이 모두 취소되었을 때만 task 도 취소한다.
+    결과 객체는 공유되므로 읽기 전용으로 다뤄야 한다.
 
-    Returns:
-        Response: The response from the HTTP request.
+    - not_before 를 주면 (force 갱신) 그 시각 이후에 시작된 실행 결과만 인정한다.
+      더 일찍 시작된 실행이 진행 중이면 끝나길 기다린 뒤 새로 실행한다
+    - start() 는 기다리지 않고 백그라운드로 실행만 시작한다 (이미 진행 중이면 아무것도 하지 않음)
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Flight] = {}
+        # endpoint -> {"calls": 전체 호출 수, "executed": 실제 실행 수}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _stats_for(self, endpoint: str) -> Dict[str, int]:
+        return self._stats.setdefault(endpoint, {"calls": 0, "executed": 0})
+
+    def _current(self, key: Hashable) -> Optional[_Flight]:
+        flight = self._inflight.get(key)
+        if flight is None or flight.abandoned:
+            return None
+        return flight
+
+    def _launch(
+        self,
+        key: Hashable,
+        endpoint: str,
+        fn: Callable[[], Awaitable[Any]],
+        detached: bool = False,
+    ) -> _Flight:
+        self._stats_for(endpoint)["executed"] += 1
+        flight = _Flight(asyncio.create_task(fn()), detached)
+        self._inflight[key] = flight
+        flight.task.add_done_callback(lambda _: self._done(key, flight))
+        return flight
+
+    async def do(
+        self,
+        key: Hashable,
+        endpoint: str,
+        fn: Callable[[], Awaitable[Any]],
+        not_before: Optional[float] = None,
+    ) -> Any:
+        """
+        Args:
+            key (Hashable): 합칠 단위
+            endpoint (str): 통계를 모을 이름
+            fn (Callable): 실제 실행할 코루틴을 만드는 함수
+            not_before (Optional[float]): 이 시각(time.time()) 이전에 시작된 실행은 인정하지 않음
+        """
+        self._stats_for(endpoint)["calls"] += 1
+
+        while True:
+            flight = self._current(key)
+            if flight is None:
+                flight = self._launch(key, endpoint, fn)
+                break
+            if not_before is None or flight.started_at >= not_before:
+                break
+            # 호출 이전에 시작된 실행 -> 끝나길 기다린 뒤 (결과는 버리고) 다시 확인
+            try:
+                await asyncio.shield(flight.task)
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+            except Exception:
+                pass
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.detached and not flight.task.done():
+                # 이 호출이 취소되었고 더 기다리는 호출이 없음 -> 요청도 취소
+                flight.abandoned = True
+                flight.task.cancel()
+
+    def start(self, key: Hashable, endpoint: str, fn: Callable[[], Awaitable[Any]]):
+        """
+        같은 key 가 진행 중이 아니면 fn 을 백그라운드로 시작한다. 결과는 기다리지 않는다.
+        """
+        self._stats_for(endpoint)["calls"] += 1
+        if self._current(key) is None:
+            self._launch(key, endpoint, fn, detached=True)
+
+    def _done(self, key: Hashable, flight: _Flight):
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.task.cancelled():
+            flight.task.exception()  # 기다리는 호출이 없어도 "never retrieved" 경고가 나지 않도록
+
+    def stats_snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        endpoint 별 호출 수 / 실제 실행 수 / 병합 비율(collapse_ratio).
+        """
+        return {
+            endpoint: {
+                **stats,
+                "collapse_ratio": (
+                    1 - stats["executed"] / stats["calls"] if stats["calls"] else 0.0
+                ),
+            }
+            for endpoint, stats in self._stats.items()
+        }
+
+
+single_flight = SingleFlight()
+
+
+def _request_key(method: str, url: str, kwargs: dict) -> Hashable:
+    params = kwargs.get("params") or {}
+    return (method, url, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+
+def _decode_typed(
+    content: bytes, response_model: Type[BaseModel]
+) -> Optional[TypedResponse]:
+    """
+    응답 본문을 한 번에 TypedResponse[response_model] 로 검증한다.
+    검증에 실패하면 (에러 응답, envelope 가 아닌 응답 등) None 을 반환하고
+    호출 측은 일반 경로로 다시 파싱한다.
     """
     try:
-        return await send_request_core(method, url, timeout=timeout, **kwargs)
+        return TypedResponse[response_model].model_validate_json(content)
+    except ValidationError:
+        return None
+
+
+async def _send_pooled(
+    pool,
+    method: str,
+    url: str,
+    *,
+    timeout: float,
+    response_model: Optional[Type[BaseModel]] = None,
+    **kwargs,
+):
+    response = await pool.request(method, url, timeout=timeout, **kwargs)
+    result = None
+    if response_model is not None:
+        result = await loop_monitor.offload(
+            _decode_typed, response.content, response_model
+        )
+
+    if result is None:
+        try:
+            body = response.json()
+        except ValueError:
+            response.raise_for_status()
+            raise
+        if not isinstance(body, dict) or "code" not in body:
+            response.raise_for_status()
+            return BaseResponse(code=response.status_code, data=body)
+        result = BaseResponse(**body)
+
+    if not 200 <= result.code < 300:
+        if result.code == 422:
+            _logger.warning(
+                f"Request failed with code {result.code} {result.error_message}"
+            )
+        raise get_exception_by_code(result.code)
+    if response_model is not None and not isinstance(result, TypedResponse):
+        result.data = response_model.model_validate(result.data)
+    return result
+
+
+async def _send_request(
+    method: str,
+    url: str,
+    *,
+    timeout: float,
+    response_model: Optional[Type[BaseModel]] = None,
+    **kwargs,
+):
+    pool = http_client_manager.client_for(url)
+    try:
+        if pool is not None:
+            return await _send_pooled(
+                pool,
+                method,
+                url,
+                timeout=timeout,
+                response_model=response_model,
+                **kwargs,
+            )
+        result = await send_request_core(method, url, timeout=timeout, **kwargs)
+        if response_model is not None:
+            # 기본 클라이언트는 dict 로 돌려주므로 한 번만 검증한다
+            result.data = response_model.model_validate(result.data)
+        return result
     except BaseOrderException as e:
         if e.code == 422:
             _logger.warning(f"Request failed with code {e.code} {e.message}")
         filtered_error = get_exception_by_code(e.code)
         raise filtered_error
 
+    except ApiException:
+        # 풀 경로에서 이미 code 를 매핑한 예외
+        raise
+
     except Exception as e:
         _logger.exception("An error occurred while sending the request.")
         raise e
+
+
+async def send_request(
+    method: str,
+    url: str,
+    *,
+    timeout: float = 20.0,
+    coalesce: bool = False,
+    response_model: Optional[Type[BaseModel]] = None,
+    **kwargs,
+):
+    """
+    Send an HTTP request using the configured base URL.
+
+    Args:
+        method (str): HTTP method (GET, POST, etc.)
+        url (str): Endpoint URL
+        coalesce (bool): True면 동시에 들어온 동일한 GET 요청을 하나로 병합한다.
+            멱등한 조회 endpoint에서만 사용해야 한다.
+        response_model (Optional[Type[BaseModel]]): 지정하면 응답의 data 를
+            원본 bytes 에서 이 모델로 바로 검증한다. (dict / 중간 DTO 생략)
+        **kwargs: Additional parameters for the request
+
+    Returns:
+        Response: The response from the HTTP request.
+    """
+    if coalesce and method.upper() == "GET" and "json" not in kwargs:
+        return await single_flight.do(
+            (*_request_key(method, url, kwargs), response_model),
+            urlsplit(url).path,
+            lambda: _send_request(
+                method, url, timeout=timeout, response_model=response_model, **kwargs
+            ),
+        )
+    return await _send_request(
+        method, url, timeout=timeout, response_model=response_model, **kwargs
+    )
+
+
+async def send_request_for_external(
+    method: str,
+    url: str,
+    *,
+    retry: bool = True,
+    timeout: float = 20.0,
+    **kwargs,
+):
+    """
+    외부 서비스(Hybra, PRJX, Hyperbloom, GLiquid, HyperUnit 등)로 HTTP 요청을 보낸다.
+
+    Args:
+        method (str): HTTP method (GET, POST, etc.)
+        url (str): 요청 URL
+        retry (bool): True면 네트워크 오류 / 5xx 응답을 backoff 하며 재시도한다.
+        **kwargs: Additional parameters for the request
+
+    Returns:
+        Any: JSON 으로 파싱한 응답 본문
+    """
+    pool = http_client_manager.client_for(url)
+    if pool is None:
+        return await send_request_for_external_core(
+            method, url, retry=retry, timeout=timeout, **kwargs
+        )
+
+    attempts = EXTERNAL_RETRY_COUNT if retry else 1
+    for attempt in range(attempts):
+        try:
+            response = await pool.request(method, url, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retryable = not isinstance(e, httpx.HTTPStatusError) or (
+                e.response.status_code >= 500
+            )
+            if not retryable or attempt == attempts - 1:
+                raise
+            _logger.info(f"Retrying external request {method} {url}: {e!r}")
+            await asyncio.sleep(EXTERNAL_RETRY_BACKOFF * 2**attempt)
@@ -1,23 +1,23 @@
 from hypurrquant.db import init_db, close_db
-from hypurrquant.api.market_data import periodic_task as market_data_periodic_task2
 from hypurrquant.logging_config import configure_logging
 
-from api.hyperliquid import (
-    MarketDataCache,
-    PerpMarketDataCache,
-    periodic_task as market_data_periodic_task,
-)
-from handler.command import Command
-from handler.utils.exception_handler import exception_error_handler
+from api.hyperliquid import market_data_scheduler
+from api.http_client import http_client_manager
+from api.loop_monitor import loop_monitor
+from api.resilience import provider_guards
+from api.gliquid import GLIQUID_POINTS_ENABLED, gliquid_snapshot
+from handler.registry import BOT_COMMANDS, register_handlers
+from handler.utils.persistence import WriteBehindMongoPersistence
+from handler.utils.prefetch import balance_prefetcher
+from handler.utils.outbound import OutboundRateLimiter
+from handler.utils.update_processor import KeyedUpdateProcessor
 
 from telegram.warnings import PTBUserWarning
 
-from telegram import BotCommand
 from telegram.ext import (
     Application,
     PicklePersistence,
 )
-from mongopersistence import MongoPersistence
 from warnings import filterwarnings
 import asyncio
 import logging
@@ -33,7 +33,6 @@ filterwarnings(
 )
 
 _logger = configure_logging(__name__)
-perp_market_data_cache = PerpMarketDataCache()
 
 # NOTE -> this values have been removed for security reasons.
 username = os.getenv(...)
@@ -44,10 +43,13 @@ db_name = os.getenv(...)
 bot_token = os.getenv(...)
 profile = os.getenv(...)
 
+max_concurrent_updates = int(os.getenv("MAX_CONCURRENT_UPDATES") or 64)
+
 _logger.info(f"bot_token: {bot_token}")
 # MongoPersistence (prod 용)
-persistence_prod = MongoPersistence(
-    url=f"mongodb://{username}:{password}@{ip}:27017/",
+# 변경된 user_data key 만 write_interval 마다 bulk $set / $unset 으로 저장
+persistence_prod = WriteBehindMongoPersistence(
+    mongo_url=f"mongodb://{username}:{password}@{ip}:27017/",
     db_name=db_name,
     name_col_user_data="user-data",
     name_col_chat_data="chat-data",
@@ -55,6 +57,8 @@ persistence_prod = MongoPersistence(
     name_col_conversations_data="conversations",
     create_col_if_not_exist=True,
     ignore_general_data=["cache"],
+    update_interval=float(os.getenv("PERSISTENCE_UPDATE_INTERVAL") or 5),
+    write_interval=float(os.getenv("PERSISTENCE_WRITE_INTERVAL") or 10),
 )
 
 # PicklePersistence (dev 용)
@@ -63,63 +67,9 @@ persistence_dev = PicklePersistence("bot_data.pickle")
 
 async def common(application: Application) -> None:
     # 명령어 메뉴 설정
-
-    from handler.start.start import start_handler
-    from handler.hyperliquid.buy.buy import buy_conv_handler
-    from handler.hyperliquid.buy_one.buy_one import buy_one_conv_handler
-    from handler.hyperliquid.perp_one.perp_one import perp_one_conv_handler
-    from handler.hyperliquid.sell.sell import sell_conv
-    from handler.hyperliquid.close.close import close_conv
-    from handler.hyperliquid.copytrading.copytrading import copytrading_conv_handler
-    from handler.hyperliquid.dca.dca import dca_conv_handler
-    from handler.hyperliquid.grid.grid import grid_conv_handler
-    from handler.hyperliquid.delta.delta import delta_conv_handler
-    from handler.hyperliquid.balance.balacne import balance_conv_handler
-    from handler.hyperliquid.start.start import hyperliquid_core_start_handler
-    from handler.evm.lpvault.lpvault import lpvault_conv_handler
-    from handler.evm.balance.balance import (
-        balance_conv_handler as evm_balance_conv_handler,
-    )
-    from handler.wallet.wallet import wallet_handler
-    from handler.referral.referral import referral_conv_handler
-
-    commands = [
-        BotCommand(Command.START, "Start the bot"),
-        # BotCommand(Command.BUY, "Buy spot assets using a strategy"),
-        # BotCommand(Command.BUY_ONE, "Buy a spot asset"),
-        # BotCommand(Command.SELL, "Sell spot assets"),
-        # BotCommand(Command.PERP_ONE, "Open a perpetual position"),
-        # BotCommand(Command.CLOSE, "Close perpetual positions."),
-        # BotCommand(Command.WALLET, "Manage your wallet settings"),
-        # BotCommand(Command.BALANCE, "View account balance and P&L summary"),
-        # BotCommand(Command.REBALANCE, "PNL alarm features"),
-        # BotCommand(
-        #     Command.COPY_TRADING,
-        #     "Execute copy traidng",
-        # ),
-        # BotCommand(Command.REFERRAL, "referral"),
-    ]
-    await application.bot.set_my_commands(commands)
-
+    await application.bot.set_my_commands(BOT_COMMANDS)
     # 핸들러 등록
-    application.add_handler(start_handler)
-    # application.add_handler(buy_conv_handler)
-    application.add_handler(buy_one_conv_handler)
-    application.add_handler(perp_one_conv_handler)
-    application.add_handler(sell_conv)
-    application.add_handler(close_conv)
-    application.add_handler(wallet_handler)
-    application.add_handler(balance_conv_handler)
-    application.add_handler(evm_balance_conv_handler)
-    # application.add_handler(rebalance_conv_handler)
-    application.add_handler(copytrading_conv_handler)
-    application.add_handler(hyperliquid_core_start_handler)
-    application.add_handler(referral_conv_handler)
-    application.add_handler(dca_conv_handler)
-    application.add_handler(grid_conv_handler)
-    application.add_handler(delta_conv_handler)
-    application.add_handler(lpvault_conv_handler)
-    application.add_error_handler(exception_error_handler)
+    register_handlers(application)
 
 
 async def start_app_polling(application: Application) -> None:
@@ -129,6 +79,7 @@ async def start_app_polling(application: Application) -> None:
     await common(application)
     # 앱 시작
     await application.initialize()
+    await http_client_manager.start()
     await application.start()
     try:
         # Polling 시작
@@ -138,6 +89,7 @@ async def start_app_polling(application: Application) -> None:
     finally:
         await application.updater.stop()
         await application.stop()
+        await http_client_manager.stop()
         await application.shutdown()
 
 
@@ -148,30 +100,32 @@ async def start_app_webhook(application: Application) -> None:
     """
     await common(application)
     await application.initialize()
+    await http_client_manager.start()
 
-    # 여기서는 예시로 run_webhook 사용
-    # 실제로는 SSL 인증서, 도메인 설정 등 필요
-    await application.run_webhook(
-        listen="0.0.0.0",
-        port=8443,
-        webhook_url=f"https://YOUR_DOMAIN/bot{bot_token}",
-    )
+    try:
+        # 여기서는 예시로 run_webhook 사용
+        # 실제로는 SSL 인증서, 도메인 설정 등 필요
+        await application.run_webhook(
+            listen="0.0.0.0",
+            port=8443,
+            webhook_url=f"https://YOUR_DOMAIN/bot{bot_token}",
+        )
+    finally:
+        await http_client_manager.stop()
     # run_webhook가 종료되면 함수 끝 -> 종료 시그널 처리
 
 
 async def main_async():
     init_db()
+    # 이벤트 루프 지연 / slow handler 감시 (LOOP_OFFLOAD_ENABLED 면 무거운 함수는 thread pool 로)
+    await loop_monitor.start()
+    # GLiquid leaderboard snapshot (사용자 요청 중에는 다운로드하지 않음)
+    gliquid_task = (
+        asyncio.create_task(gliquid_snapshot.run()) if GLIQUID_POINTS_ENABLED else None
+    )
     try:
-        fetch = MarketDataCache()
-
-        async def combined_periodic_tasks():
-            await asyncio.gather(
-                market_data_periodic_task(fetch, 30),
-                perp_market_data_cache.run(30),
-                market_data_periodic_task2(30),
-            )
-
-        task = asyncio.create_task(combined_periodic_tasks())
+        # spot / perp 마켓 데이터를 하나의 클럭으로 갱신
+        task = asyncio.create_task(market_data_scheduler.run(30))
 
         # 2) profile에 따른 Application & 실행
         if profile == "prod":
@@ -180,6 +134,10 @@ async def main_async():
                 Application.builder()
                 .token(bot_token)
                 .persistence(persistence_prod)
+                # 사용자 간에는 동시에, 같은 사용자 안에서는 순서대로 update 처리
+                .concurrent_updates(KeyedUpdateProcessor(max_concurrent_updates))
+                # Bot API 발신 flood control (chat / 전역 token bucket, 대체된 edit 생략)
+                .rate_limiter(OutboundRateLimiter())
                 .build()
             )
             # Webhook 모드
@@ -197,6 +155,10 @@ async def main_async():
                 Application.builder()
                 .token(bot_token)
                 .persistence(persistence_dev)
+                # 사용자 간에는 동시에, 같은 사용자 안에서는 순서대로 update 처리
+                .concurrent_updates(KeyedUpdateProcessor(max_concurrent_updates))
+                # Bot API 발신 flood control (chat / 전역 token bucket, 대체된 edit 생략)
+                .rate_limiter(OutboundRateLimiter())
                 .build()
             )
 
@@ -210,6 +172,12 @@ async def main_async():
                 except asyncio.CancelledError:
                     logging.info("Periodic task cancelled.")
     finally:
+        if gliquid_task is not None:
+            gliquid_task.cancel()
+            gliquid_snapshot.shutdown()
+        balance_prefetcher.shutdown()
+        provider_guards.shutdown()
+        await loop_monitor.stop()
         await close_db()
 
 
@@ -0,0 +1,194 @@
+"""
+잔고 응답 디코딩 micro-benchmark.
+
+기존 경로 (json -> BaseResponse -> *DTO -> model_dump -> handler 모델 model_validate)와
+단일 경로 (TypedResponse[handler 모델].model_validate_json(raw bytes))를
+100 ~ 300 포지션 계좌 응답으로 비교한다.
+
+    cd src && python -m benchmarks.balance_decode [--positions 100 200 300] [--repeat 200]
+"""
+
+from api.models import BaseResponse, TypedResponse
+from api.hyperliquid.models import PerpBalanceMappingDTO, SpotBalanceMappingDTO
+from handler.models.perp_balance import PerpBalanceMapping
+from handler.models.spot_balance import SpotBalanceMapping
+
+from typing import Callable, List, Tuple
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+
+# ================================
+# 응답 생성
+# ================================
+def _envelope(data: dict) -> bytes:
+    return json.dumps(
+        {"code": 200, "data": data, "error_message": None, "message": None}
+    ).encode()
+
+
+def spot_payload(size: int, rng: random.Random) -> bytes:
+    balances = {}
+    for i in range(size):
+        balance = rng.uniform(0.01, 10_000)
+        entry_price = rng.uniform(0.001, 100)
+        price = entry_price * rng.uniform(0.5, 1.5)
+        entry_ntl = balance * entry_price
+        value = balance * price
+        balances[f"TOKEN{i}"] = {
+            "Name": f"TOKEN{i}",
+            "token": f"0x{i:032x}",
+            "Balance": balance,
+            "entryNtl": entry_ntl,
+            "EntryPrice": entry_price,
+            "Price": price,
+            "Value": value,
+            "PNL": value - entry_ntl,
+            "PNL_percent": (value / entry_ntl - 1) * 100,
+        }
+    return _envelope(
+        {
+            "balances": balances,
+            "usdc_balance": 1234.5,
+            "stock_total_balance": sum(b["Value"] for b in balances.values()),
+            "total_pnl": sum(b["PNL"] for b in balances.values()),
+            "total_pnl_percent": 3.2,
+        }
+    )
+
+
+def perp_payload(size: int, rng: random.Random) -> bytes:
+    def position(i: int) -> dict:
+        szi = rng.uniform(-100, 100)
+        entry = rng.uniform(0.01, 50_000)
+        mid = entry * rng.uniform(0.9, 1.1)
+        return {
+            "name": f"COIN{i}",
+            "szi": szi,
+            "leverage": rng.choice([1, 3, 5, 10, 20]),
+            "pos_type": rng.choice(["cross", "isolated"]),
+            "is_long": szi > 0,
+            "entryPx": entry,
+            "midPx": mid,
+            "positionValue": abs(szi) * mid,
+            "marginUsed": abs(szi) * mid / 5,
+            "unrealizedPnl": szi * (mid - entry),
+            "returnOnEquity": rng.uniform(-1, 1),
+            "liquidationPx": entry * rng.uniform(0.5, 1.5),
+        }
+
+    # 백엔드는 합계 필드를 문자열로 내려주기도 한다 (convert_to_float 경로)
+    summary = {
+        "accountValue": "10523.11",
+        "totalNtlPos": "88231.9",
+        "totalRawUsd": "10000.0",
+        "totalMarginUsed": "1764.6",
+    }
+    return _envelope(
+        {
+            "withdrawable": "8758.5",
+            "accountValue": 10523.11,
+            "invested": 1764.6,
+            "totalUnrealizedPnl": 523.11,
+            "pnlPercentage": 5.2,
+            "totalMarginUsed": 1764.6,
+            "crossMaintenanceMarginUsed": 412.3,
+            "time": 1_730_000_000_000,
+            "marginSummary": summary,
+            "crossMarginSummary": summary,
+            "position": {
+                "oneWay": {f"COIN{i}": position(i) for i in range(size // 2)},
+                "twoWay": {f"COIN{i}": position(i) for i in range(size // 2, size)},
+            },
+        }
+    )
+
+
+# ================================
+# 디코딩 경로
+# ================================
+def two_pass(raw: bytes, dto_cls, model_cls):
+    response = BaseResponse(**json.loads(raw))
+    dto = dto_cls(**response.data)
+    return model_cls.model_validate(dto.model_dump())
+
+
+def single_pass(raw: bytes, dto_cls, model_cls):
+    return TypedResponse[model_cls].model_validate_json(raw).data
+
+
+# ================================
+# 측정
+# ================================
+def _cpu(fn: Callable[[], object], repeat: int) -> float:
+    """
+    repeat 번 실행한 평균 시간 (ms). 5 번 측정해 가장 빠른 값.
+    """
+    best = float("inf")
+    for _ in range(5):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / repeat * 1000
+
+
+def _alloc(fn: Callable[[], object]) -> Tuple[int, int]:
+    """
+    한 번 실행할 때의 (할당 블록 수, peak 메모리 bytes).
+    """
+    fn()  # 스키마 / 캐시 워밍업
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(
+        stat.count_diff
+        for stat in after.compare_to(before, "filename")
+        if stat.count_diff > 0
+    )
+    del result
+    return blocks, peak
+
+
+def run(sizes: List[int], repeat: int):
+    rng = random.Random(42)
+    cases = [
+        ("spot", spot_payload, SpotBalanceMappingDTO, SpotBalanceMapping),
+        ("perp", perp_payload, PerpBalanceMappingDTO, PerpBalanceMapping),
+    ]
+    print(
+        f"{'case':<6}{'size':>6}{'two-pass ms':>14}{'single ms':>12}{'speedup':>9}"
+        f"{'two-pass peak KB':>18}{'single peak KB':>16}{'blocks':>16}"
+    )
+    for name, make_payload, dto_cls, model_cls in cases:
+        for size in sizes:
+            raw = make_payload(size, rng)
+            old = lambda: two_pass(raw, dto_cls, model_cls)
+            new = lambda: single_pass(raw, dto_cls, model_cls)
+            assert old() == new(), f"{name}/{size}: decoded models differ"
+
+            old_ms, new_ms = _cpu(old, repeat), _cpu(new, repeat)
+            (old_blocks, old_peak), (new_blocks, new_peak) = _alloc(old), _alloc(new)
+            print(
+                f"{name:<6}{size:>6}{old_ms:>14.3f}{new_ms:>12.3f}"
+                f"{old_ms / new_ms:>8.2f}x{old_peak / 1024:>18.1f}"
+                f"{new_peak / 1024:>16.1f}{f'{old_blocks}->{new_blocks}':>16}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, nargs="+", default=[100, 200, 300])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.positions, args.repeat)
@@ -0,0 +1,131 @@
+"""
+네트워크 없이 Bot API 를 흉내 내는 python-telegram-bot request 구현.
+
+Application.builder().request(FakeBotRequest(...)) 로 끼워 넣으면
+sendMessage / editMessageText 등은 실제 Bot API 와 같은 모양의 Message 를 돌려주고,
+채팅별 마지막 메시지(텍스트 + inline keyboard)를 기억해 둔다.
+replay 하네스는 이 메시지의 버튼을 눌러 다음 callback query 를 만든다.
+"""
+
+from telegram.request import BaseRequest, RequestData
+
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import itertools
+import json
+import time
+
+BOT_USER = {
+    "id": 1,
+    "is_bot": True,
+    "first_name": "HypurrQuant",
+    "username": "hypurrquant_bench_bot",
+    "can_join_groups": False,
+    "can_read_all_group_messages": False,
+    "supports_inline_queries": False,
+}
+
+# 결과로 Message 를 돌려주는 메소드
+_MESSAGE_METHODS = {
+    "sendMessage",
+    "editMessageText",
+    "editMessageReplyMarkup",
+    "sendPhoto",
+    "sendDocument",
+}
+
+
+class FakeBotRequest(BaseRequest):
+    """
+    - calls: Bot API 메소드별 호출 수
+    - last_messages: chat_id -> 마지막으로 보내거나 수정한 Message dict
+    - latency: 응답 전에 기다릴 시간 (초). 실제 Bot API 왕복 시간을 흉내 낼 때 사용
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.last_messages: Dict[int, dict] = {}
+        self._message_ids = itertools.count(1)
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return None
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def reset_stats(self):
+        self.calls.clear()
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout=None,
+        write_timeout=None,
+        connect_timeout=None,
+        pool_timeout=None,
+    ) -> Tuple[int, bytes]:
+        endpoint = url.rsplit("/", 1)[-1]
+        params = request_data.parameters if request_data else {}
+        self.calls[endpoint] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if endpoint == "getMe":
+            return self._ok(BOT_USER)
+        if endpoint in _MESSAGE_METHODS:
+            return self._message(endpoint, params)
+        return self._ok(True)
+
+    def _message(self, endpoint: str, params: Dict[str, Any]) -> Tuple[int, bytes]:
+        chat_id = int(params["chat_id"])
+        previous = self.last_messages.get(chat_id)
+        if endpoint == "sendMessage" or previous is None:
+            message = {
+                "message_id": next(self._message_ids),
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "from": BOT_USER,
+                "text": "",
+            }
+        else:
+            message = dict(previous)
+            changed = "text" in params and params["text"] != previous.get("text")
+            changed |= params.get("reply_markup") != previous.get("reply_markup")
+            if not changed:
+                # 실제 Bot API 와 같은 에러 -> send_or_edit 의 BadRequest 처리 경로를 탄다
+                return self._error(
+                    "Bad Request: message is not modified: specified new message "
+                    "content and reply markup are exactly the same as a current "
+                    "content and reply markup of the message"
+                )
+            message["edit_date"] = int(time.time())
+
+        if "text" in params:
+            message["text"] = params["text"]
+        if params.get("reply_markup") is not None:
+            message["reply_markup"] = params["reply_markup"]
+        else:
+            message.pop("reply_markup", None)
+        self.last_messages[chat_id] = message
+        return self._ok(message)
+
+    @staticmethod
+    def _ok(result: Any) -> Tuple[int, bytes]:
+        return 200, json.dumps({"ok": True, "result": result}).encode()
+
+    @staticmethod
+    def _error(description: str) -> Tuple[int, bytes]:
+        return (
+            400,
+            json.dumps(
+                {"ok": False, "error_code": 400, "description": description}
+            ).encode(),
+        )
@@ -0,0 +1,129 @@
+"""
+GLiquid leaderboard micro-benchmark.
+
+기존 경로 (cache miss 마다 응답 전체 -> {address: user dict})와
+snapshot 경로 (LeaderboardIndex: 정렬된 20 byte 주소 + float64 array, 이진 탐색)를
+leaderboard 크기별로 비교한다. 다른 worker 가 Redis 에서 받는 payload 크기와 복원 시간도 같이 본다.
+
+    cd src && python -m benchmarks.gliquid_snapshot [--users 10000 50000 200000] [--lookups 10000]
+"""
+
+from api.gliquid import LeaderboardIndex
+
+from typing import Callable, List, Tuple
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+
+# ================================
+# 응답 생성
+# ================================
+def leaderboard_payload(size: int, rng: random.Random) -> bytes:
+    users = [
+        {
+            "address": "0x" + rng.getrandbits(160).to_bytes(20, "big").hex(),
+            "points": round(rng.uniform(0, 100_000), 2),
+            "referralCode": f"code{i}",
+            "referredBy": None,
+            "totalVolume": round(rng.uniform(0, 1_000_000), 2),
+        }
+        for i in range(size)
+    ]
+    return json.dumps({"users": users}).encode()
+
+
+# ================================
+# 조회 경로
+# ================================
+def dict_build(raw: bytes) -> dict:
+    return {data["address"].lower(): data for data in json.loads(raw)["users"]}
+
+
+def dict_lookup(parsed: dict, address: str) -> float:
+    return float(parsed.get(address.lower(), {}).get("points", 0))
+
+
+def index_build(raw: bytes) -> LeaderboardIndex:
+    return LeaderboardIndex.build(json.loads(raw)["users"], time.time())
+
+
+def index_lookup(index: LeaderboardIndex, address: str) -> float:
+    points = index.lookup(address)
+    return 0.0 if points is None else points
+
+
+# ================================
+# 측정
+# ================================
+def _best(fn: Callable[[], object], rounds: int = 3) -> float:
+    """
+    한 번 실행 시간 (ms). rounds 번 측정해 가장 빠른 값.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _retained(fn: Callable[[], object]) -> Tuple[object, int]:
+    """
+    fn 이 돌려준 객체가 계속 잡고 있는 메모리 (bytes).
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def run(sizes: List[int], lookups: int):
+    rng = random.Random(42)
+    print(
+        f"{'users':>8}{'dict build ms':>15}{'index build ms':>16}"
+        f"{'dict MB':>9}{'index MB':>10}{'redis KB':>10}{'restore ms':>12}"
+        f"{'dict lookup us':>16}{'index lookup us':>17}"
+    )
+    for size in sizes:
+        raw = leaderboard_payload(size, rng)
+        users = json.loads(raw)["users"]
+        addresses = [rng.choice(users)["address"] for _ in range(lookups // 2)]
+        addresses += [
+            "0x" + rng.getrandbits(160).to_bytes(20, "big").hex()
+            for _ in range(lookups - len(addresses))
+        ]
+        del users
+
+        parsed, dict_bytes = _retained(lambda: dict_build(raw))
+        index, index_bytes = _retained(lambda: index_build(raw))
+        for address in addresses:
+            assert dict_lookup(parsed, address) == index_lookup(index, address)
+        payload = index.dumps()
+
+        dict_ms = _best(lambda: dict_build(raw))
+        index_ms = _best(lambda: index_build(raw))
+        restore_ms = _best(lambda: LeaderboardIndex.loads(payload))
+        dict_us = _best(lambda: [dict_lookup(parsed, a) for a in addresses])
+        index_us = _best(lambda: [index_lookup(index, a) for a in addresses])
+        print(
+            f"{size:>8}{dict_ms:>15.1f}{index_ms:>16.1f}"
+            f"{dict_bytes / 2**20:>9.1f}{index_bytes / 2**20:>10.2f}"
+            f"{len(payload) / 1024:>10.0f}{restore_ms:>12.2f}"
+            f"{dict_us * 1000 / lookups:>16.2f}{index_us * 1000 / lookups:>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, nargs="+", default=[10000, 50000, 200000])
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+    run(args.users, args.lookups)
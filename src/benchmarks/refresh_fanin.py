@@ -0,0 +1,153 @@
+"""
+잔고 refresh fan-in 하네스.
+
+hlAccountService 의 잔고 조회(get_spot_balance / get_perp_balance)를 호출 수를 세는 가짜 upstream 으로 바꾼 뒤,
+여러 화면 콜백이 동시에 refresh_all / refresh_spot_balance / refresh_perp_balance 를
+호출하는 상황을 재현하고 upstream 호출 수를 검증한다.
+
+    cd src && python -m benchmarks.refresh_fanin [--taps 20] [--latency 0.05]
+"""
+
+from api.utils import single_flight
+from handler.models.perp_balance import MarginSummary, PerpBalanceMapping
+from handler.models.spot_balance import SpotBalanceMapping
+from handler.utils import account_manager as account_manager_module
+from handler.utils.account_manager import AccountManager
+from handler.utils.balance_cache import balance_cache
+from hypurrquant.models.account import Account
+
+from collections import Counter
+from typing import Awaitable, Callable, List
+import argparse
+import asyncio
+import random
+
+
+# ================================
+# 가짜 upstream
+# ================================
+class CountingUpstream:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls: Counter = Counter()
+
+    async def _wait(self):
+        # 실제 네트워크처럼 응답 시간이 조금씩 다르게
+        await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+
+    async def get_spot_balance(self, telegram_id, nickname, model=None):
+        self.calls["spot"] += 1
+        await self._wait()
+        return self._spot()
+
+    async def get_perp_balance(self, telegram_id, nickname, model=None):
+        self.calls["perp"] += 1
+        await self._wait()
+        return self._perp()
+
+    def _spot(self) -> SpotBalanceMapping:
+        return SpotBalanceMapping(
+            balances={},
+            usdc_balance=float(self.calls["spot"]),
+            stock_total_balance=0.0,
+            total_pnl=0.0,
+            total_pnl_percent=0.0,
+        )
+
+    def _perp(self) -> PerpBalanceMapping:
+        summary = MarginSummary(
+            accountValue=0.0, totalNtlPos=0.0, totalRawUsd=0.0, totalMarginUsed=0.0
+        )
+        return PerpBalanceMapping(
+            withdrawable=float(self.calls["perp"]),
+            accountValue=0.0,
+            invested=0.0,
+            totalUnrealizedPnl=0.0,
+            pnlPercentage=0.0,
+            totalMarginUsed=0.0,
+            crossMaintenanceMarginUsed=0.0,
+            time=0,
+            marginSummary=summary,
+            crossMarginSummary=summary,
+        )
+
+
+# ================================
+# 시나리오
+# ================================
+ACCOUNT = Account(
+    nickname="default", public_key="0x0", is_active=True, is_approved_builder_fee=True
+)
+
+
+def _manager(shared: AccountManager, fresh_instance: bool) -> AccountManager:
+    # pagination 처럼 새 AccountManager 인스턴스로 들어오는 호출도 섞는다
+    if fresh_instance:
+        return AccountManager(telegram_id=shared.telegram_id, active_account=ACCOUNT)
+    return shared
+
+
+def _taps(shared: AccountManager, count: int, force: bool) -> List[Awaitable]:
+    calls: List[Callable[[AccountManager], Awaitable]] = [
+        lambda manager: manager.refresh_all(force=force),
+        lambda manager: manager.refresh_spot_balance(force=force),
+        lambda manager: manager.refresh_perp_balance(force=force),
+        lambda manager: manager.get_spot_balance_mapping(),
+        lambda manager: manager.get_perp_balance_mapping(),
+    ]
+    return [
+        calls[i % len(calls)](_manager(shared, fresh_instance=i % 2 == 1))
+        for i in range(count)
+    ]
+
+
+async def scenario(
+    name: str,
+    upstream: CountingUpstream,
+    taps: int,
+    force: bool,
+    max_per_kind: int,
+    warm: bool = False,
+):
+    balance_cache.invalidate("1")
+    shared = AccountManager(telegram_id="1", active_account=ACCOUNT)
+    if warm:
+        await shared.refresh_all(force=True)
+    upstream.calls.clear()
+
+    await asyncio.gather(*_taps(shared, taps, force))
+
+    spot, perp = upstream.calls["spot"], upstream.calls["perp"]
+    status = "ok" if spot <= max_per_kind and perp <= max_per_kind else "FAIL"
+    print(
+        f"{name:<34} taps={taps:<4} spot={spot:<3} perp={perp:<3} "
+        f"(expected <= {max_per_kind}) {status}"
+    )
+    assert status == "ok", f"{name}: upstream called spot={spot}, perp={perp}"
+
+
+async def main(taps: int, latency: float):
+    upstream = CountingUpstream(latency)
+    service = account_manager_module.hlAccountService
+    service.get_spot_balance = upstream.get_spot_balance
+    service.get_perp_balance = upstream.get_perp_balance
+
+    # 캐시가 비어 있을 때 동시에 들어온 화면 콜백은 종류별로 한 번만 조회
+    await scenario("cold cache, mixed callers", upstream, taps, False, 1)
+    # 캐시가 신선하면 upstream 을 부르지 않음
+    await scenario("warm cache, mixed callers", upstream, taps, False, 0, warm=True)
+    # force 는 호출 이후에 시작된 조회만 인정 -> 첫 조회 + 나머지가 합류한 조회 하나
+    await scenario("forced taps", upstream, taps, True, 2)
+
+    stats = single_flight.stats_snapshot()
+    print(
+        f"single flight stats: spot={stats['balance.spot']} perp={stats['balance.perp']}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--taps", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.taps, args.latency))
@@ -0,0 +1,423 @@
+"""
+Telegram update replay 부하 테스트 하네스.
+
+app.common() 과 같은 handler graph(handler.registry)를 만들고,
+실제 대화 경로(/hl_start -> Balance -> Spot Detail -> Next 등)를 따르는 가상 사용자를
+정해진 속도로 시작시켜 update 를 흘려 넣는다.
+
+- BASE_URL 은 로컬 stub 백엔드(benchmarks.stub_backend), Bot API 는 FakeBotRequest 로 대체하므로
+  네트워크 없이 (CI 의 Linux runner 에서) 실행된다
+- 버튼은 callback_data 를 하드코딩하지 않고, 봇이 마지막으로 보낸 메시지의 버튼을 이름으로 찾아 누른다
+- 결과: 단계별 / 전체 handler latency p50 / p95 / p99, updates/sec,
+  update 당 백엔드 호출 수와 Bot API 호출 수
+
+    cd src && python -m benchmarks.replay [--rate 20] [--duration 30] [--users 200]
+        [--paths hl_balance_spot=3,hl_balance_perp=1] [--think 0.5]
+        [--backend-latency 0.02] [--backend-latency order=lognormal:0.2,0.4]
+        [--backend-errors balance=0.05:500] [--backend-rate-limit 100]
+        [--bot-latency 0.03] [--json report.json]
+
+  --backend-* 옵션은 python -m benchmarks.stub_backend 의 --latency / --errors / --rate-limit 과 같다
+"""
+
+from benchmarks.fake_bot import FakeBotRequest
+from benchmarks.stub_backend import (
+    EXTERNAL_PREFIX,
+    StubBackend,
+    add_backend_arguments,
+    backend_from_args,
+)
+
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import time
+
+# ================================
+# 대화 경로
+# ================================
+# ("command", 명령어) 또는 ("tap", 버튼 이름)
+Step = Tuple[str, str]
+
+PATHS: Dict[str, List[Step]] = {
+    "hl_balance_spot": [
+        ("command", "hl_start"),
+        ("tap", "📊 Balance"),
+        ("tap", "Spot Detail"),
+        ("tap", "Next ▶️"),
+    ],
+    "hl_balance_perp": [
+        ("command", "hl_start"),
+        ("tap", "📊 Balance"),
+        ("tap", "Perp Detail"),
+    ],
+    "hl_balance_refresh": [
+        ("command", "hl_start"),
+        ("tap", "📊 Balance"),
+        ("tap", "Refresh"),
+    ],
+    "hl_copytrading": [
+        ("command", "hl_start"),
+        ("tap", "Copy Trading"),
+        ("tap", "Follow the others"),
+        ("tap", "Next ▶️"),
+    ],
+    "lpvault": [("command", "lpvault_auto")],
+    "start": [("command", "start")],
+}
+DEFAULT_PATHS = "hl_balance_spot=3,hl_balance_perp=1,hl_balance_refresh=1"
+
+USER_ID_BASE = 10_000_000
+
+
+def _parse_paths(spec: str) -> Dict[str, float]:
+    weights = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        if name not in PATHS:
+            raise SystemExit(f"unknown path {name!r}, choose from {sorted(PATHS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(values: List[float]) -> dict:
+    return {
+        "count": len(values),
+        "p50": _percentile(values, 50),
+        "p95": _percentile(values, 95),
+        "p99": _percentile(values, 99),
+        "max": max(values, default=0.0),
+    }
+
+
+# ================================
+# replay
+# ================================
+class Replay:
+    """
+    가상 사용자 세션을 open-loop 로 시작시키고 update 별 처리 시간을 기록한다.
+    같은 세션 안의 update 는 앞 update 의 처리가 끝난 뒤 think 초 후에 보낸다. (실제 사용자처럼)
+    """
+
+    def __init__(
+        self,
+        application,
+        bot_request: FakeBotRequest,
+        backend: StubBackend,
+        think: float = 0.0,
+    ):
+        self.application = application
+        self.bot_request = bot_request
+        self.backend = backend
+        self.think = think
+        self._update_ids = itertools.count(1)
+        self._message_ids = itertools.count(1)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Counter = Counter()
+        self.sessions = 0
+        self.updates = 0
+
+    # ================================
+    # update 생성
+    # ================================
+    def _user(self, user_id: int) -> dict:
+        return {"id": user_id, "is_bot": False, "first_name": f"load{user_id}"}
+
+    def _command(self, user_id: int, command: str) -> dict:
+        text = f"/{command}"
+        return {
+            "update_id": next(self._update_ids),
+            "message": {
+                "message_id": next(self._message_ids),
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private"},
+                "from": self._user(user_id),
+                "text": text,
+                "entities": [{"type": "bot_command", "offset": 0, "length": len(text)}],
+            },
+        }
+
+    def _tap(self, user_id: int, label: str) -> Optional[dict]:
+        message = self.bot_request.last_messages.get(user_id)
+        keyboard = (message or {}).get("reply_markup", {}).get("inline_keyboard", [])
+        for button in itertools.chain.from_iterable(keyboard):
+            if button.get("text") == label and "callback_data" in button:
+                return {
+                    "update_id": next(self._update_ids),
+                    "callback_query": {
+                        "id": str(next(self._update_ids)),
+                        "from": self._user(user_id),
+                        "chat_instance": str(user_id),
+                        "data": button["callback_data"],
+                        "message": message,
+                    },
+                }
+        return None
+
+    # ================================
+    # 실행
+    # ================================
+    async def _process(self, data: dict):
+        from telegram import Update
+
+        application = self.application
+        update = Update.de_json(data, application.bot)
+        # Application 이 update_queue 에서 꺼낸 update 를 처리하는 것과 같은 경로
+        await application.update_processor.process_update(
+            update, application.process_update(update)
+        )
+
+    async def session(self, user_id: int, path: str):
+        self.sessions += 1
+        for kind, value in PATHS[path]:
+            data = (
+                self._command(user_id, value)
+                if kind == "command"
+                else self._tap(user_id, value)
+            )
+            if data is None:
+                self.failures[f"{path}: button {value!r} not found"] += 1
+                return
+            started = time.perf_counter()
+            try:
+                await self._process(data)
+            except Exception as e:
+                self.failures[f"{path}: {value}: {e!r}"] += 1
+                return
+            self.latencies[f"{path}:{value}"].append(time.perf_counter() - started)
+            self.updates += 1
+            if self.think:
+                await asyncio.sleep(self.think * random.uniform(0.5, 1.5))
+
+    async def run(
+        self, rate: float, duration: float, users: int, weights: Dict[str, float]
+    ) -> float:
+        """
+        rate (세션/초) 로 duration 초 동안 세션을 시작하고, 모든 세션이 끝날 때까지 기다린다.
+
+        Returns:
+            float: 첫 세션 시작부터 마지막 update 처리까지 걸린 시간 (초)
+        """
+        names, path_weights = zip(*weights.items())
+        user_ids = itertools.cycle(range(USER_ID_BASE, USER_ID_BASE + users))
+        busy: Dict[int, asyncio.Task] = {}
+        tasks: List[asyncio.Task] = []
+
+        async def chained(previous: Optional[asyncio.Task], user_id: int, path: str):
+            # 같은 사용자의 세션은 겹치지 않게 (마지막 메시지 버튼을 눌러야 하므로)
+            if previous is not None:
+                await asyncio.wait({previous})
+            await self.session(user_id, path)
+
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        next_start = loop.time()
+        while next_start < deadline:
+            await asyncio.sleep(max(0.0, next_start - loop.time()))
+            user_id = next(user_ids)
+            path = random.choices(names, path_weights)[0]
+            task = asyncio.create_task(chained(busy.get(user_id), user_id, path))
+            busy[user_id] = task
+            tasks.append(task)
+            next_start += random.expovariate(rate)  # Poisson 도착
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+    def report(self, elapsed: float) -> dict:
+        all_latencies = list(itertools.chain.from_iterable(self.latencies.values()))
+        updates = max(self.updates, 1)
+        # 외부 API(stub 의 EXTERNAL_PREFIX) 호출은 백엔드 호출 수에서 뺀다
+        backend_paths = {
+            path: count
+            for path, count in self.backend.calls.most_common()
+            if not path.startswith(EXTERNAL_PREFIX)
+        }
+        backend_calls = sum(backend_paths.values())
+        bot_calls = sum(self.bot_request.calls.values())
+        rate_limiter = self.application.bot.rate_limiter
+        from api.resilience import provider_guards
+        from handler.utils.fetch_plan import fetch_plan_stats
+        from handler.utils.render_cache import render_cache
+
+        return {
+            "elapsed": elapsed,
+            "sessions": self.sessions,
+            "updates": self.updates,
+            "updates_per_sec": self.updates / elapsed if elapsed else 0.0,
+            "latency": _summary(all_latencies),
+            "steps": {
+                name: _summary(values) for name, values in self.latencies.items()
+            },
+            "backend_calls": backend_calls,
+            "backend_calls_per_update": backend_calls / updates,
+            "backend_calls_by_path": backend_paths,
+            "external_calls": sum(self.backend.calls.values()) - backend_calls,
+            "backend_injected_errors": dict(self.backend.injected),
+            "backend_throttled": dict(self.backend.throttled),
+            "bot_api_calls_per_update": bot_calls / updates,
+            "bot_api_calls": dict(self.bot_request.calls.most_common()),
+            "bot_outbound": rate_limiter.stats_snapshot() if rate_limiter else {},
+            "render_cache": render_cache.stats_snapshot(),
+            "screen_fetch": fetch_plan_stats.stats_snapshot(),
+            "external_providers": provider_guards.stats_snapshot(),
+            "failures": dict(self.failures),
+        }
+
+
+def _print_report(report: dict):
+    def row(name: str, stats: dict):
+        print(
+            f"{name:<40} n={stats['count']:<6} p50={stats['p50'] * 1000:8.1f}ms "
+            f"p95={stats['p95'] * 1000:8.1f}ms p99={stats['p99'] * 1000:8.1f}ms"
+        )
+
+    print(
+        f"\nsessions={report['sessions']} updates={report['updates']} "
+        f"elapsed={report['elapsed']:.1f}s updates/sec={report['updates_per_sec']:.1f}"
+    )
+    row("all updates", report["latency"])
+    for name, stats in sorted(report["steps"].items()):
+        row(f"  {name}", stats)
+    print(
+        f"backend calls/update={report['backend_calls_per_update']:.2f} "
+        f"bot api calls/update={report['bot_api_calls_per_update']:.2f}"
+    )
+    outbound = report["bot_outbound"]
+    if outbound:
+        print(
+            f"bot api deferred={outbound['deferred']} "
+            f"(max {outbound['max_deferred_seconds'] * 1000:.0f}ms) "
+            f"dropped edits={outbound['dropped']} 429={outbound['rate_limited']}"
+        )
+    print(f"no-op edits skipped={report['render_cache']['avoided']}")
+    degraded = {
+        node: stats["failed"]
+        for node, stats in report["screen_fetch"].items()
+        if stats["failed"]
+    }
+    if degraded:
+        print(f"screen fetch nodes degraded / failed={degraded}")
+    for name, stats in report["external_providers"].items():
+        print(
+            f"  {name:<20} {stats['state']:<9} fetches={stats['fetches']} "
+            f"failures={stats['failures'] + stats['timeouts']} "
+            f"short_circuited={stats['short_circuited']} "
+            f"stale={stats['stale']} empty={stats['empty']}"
+        )
+    for path, count in report["backend_calls_by_path"].items():
+        print(f"  {path:<50} {count}")
+    if report["backend_injected_errors"] or report["backend_throttled"]:
+        print(
+            f"backend injected errors={report['backend_injected_errors']} "
+            f"throttled={report['backend_throttled']}"
+        )
+    if report["failures"]:
+        print("failures:")
+        for failure, count in report["failures"].items():
+            print(f"  {count:>5} {failure}")
+
+
+# ================================
+# 환경 구성
+# ================================
+async def main(args):
+    backend = backend_from_args(args, prefix="backend-", seed=args.seed)
+    await backend.start()
+    # api 모듈은 BASE_URL 을 import 시점에 읽으므로 stub 을 띄운 다음에 봇 코드를 import 한다
+    os.environ["BASE_URL"] = backend.url
+    os.environ.setdefault("BOT_NAME", "hypurrquant_bench_bot")
+
+    from api import bridge, lpvault
+    from api.http_client import http_client_manager
+    from api.hyperliquid import market_data_scheduler
+    from handler.registry import BOT_COMMANDS, register_handlers
+    from handler.utils.outbound import OutboundRateLimiter
+    from handler.utils.prefetch import balance_prefetcher
+    from handler.utils.update_processor import KeyedUpdateProcessor
+    from telegram.ext import Application
+
+    # 외부 API 도 stub 으로 (HyperUnit 입금 주소 / 수수료, 포인트 provider)
+    bridge.UNIT_API = f"{backend.external_url}/hyperunit"
+    lpvault.HYBRA_API = f"{backend.external_url}/hybra"
+    lpvault.PRJX_API = f"{backend.external_url}/prjx"
+    lpvault.HYPERBLOOM_API = f"{backend.external_url}/hyperbloom"
+
+    bot_request = FakeBotRequest(latency=args.bot_latency)
+    application = (
+        Application.builder()
+        .token("0:replay")
+        .request(bot_request)
+        .get_updates_request(FakeBotRequest())
+        .updater(None)
+        .concurrent_updates(KeyedUpdateProcessor(args.max_concurrent_updates))
+        .rate_limiter(OutboundRateLimiter())
+        .build()
+    )
+    replay = Replay(application, bot_request, backend, think=args.think)
+
+    async def count_error(update, context):
+        replay.failures[f"handler error: {context.error!r}"[:200]] += 1
+
+    register_handlers(application)
+    application.add_error_handler(count_error)
+    await application.initialize()
+    await application.bot.set_my_commands(BOT_COMMANDS)
+    await http_client_manager.start()
+    try:
+        if not await market_data_scheduler.refresh_once():
+            raise SystemExit("failed to load market data from the stub backend")
+        backend.reset_stats()
+        bot_request.reset_stats()
+
+        elapsed = await replay.run(
+            args.rate, args.duration, args.users, _parse_paths(args.paths)
+        )
+        report = replay.report(elapsed)
+    finally:
+        balance_prefetcher.shutdown()
+        await application.shutdown()
+        await http_client_manager.stop()
+        await backend.stop()
+
+    _print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if args.fail_on_error and report["failures"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=float, default=20.0, help="세션 시작 / 초")
+    parser.add_argument("--duration", type=float, default=30.0, help="초")
+    parser.add_argument("--users", type=int, default=200, help="가상 사용자 수")
+    parser.add_argument("--paths", default=DEFAULT_PATHS, help="경로=가중치,...")
+    parser.add_argument("--think", type=float, default=0.5, help="탭 사이 대기 (초)")
+    add_backend_arguments(parser, prefix="backend-", default_latency="0.02")
+    parser.add_argument("--bot-latency", type=float, default=0.03)
+    parser.add_argument("--max-concurrent-updates", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON 으로 저장할 경로")
+    parser.add_argument(
+        "--fail-on-error",
+        action="store_true",
+        help="실패한 단계가 있으면 exit 1 (CI 용)",
+    )
+    args = parser.parse_args()
+    random.seed(args.seed)
+    asyncio.run(main(args))
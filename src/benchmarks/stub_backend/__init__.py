@@ -0,0 +1,36 @@
+"""
+BASE_URL 백엔드를 흉내 내는 로컬 stub 서버.
+
+엔드포인트 family(market_data, account, balance, order, lpvault, copytrading, dca,
+external) 마다 route 모듈이 있고, family 별로 latency 분포 / 에러 주입 / rate limit 을
+설정할 수 있다. api/ 서비스는 BASE_URL 만 stub 의 url 로 바꾸면 그대로 동작한다.
+
+    cd src && python -m benchmarks.stub_backend [--port 8765] \\
+        [--latency 0.02] [--latency order=lognormal:0.2,0.4] \\
+        [--errors balance=0.05:500,3000] [--rate-limit market_data=20:5]
+"""
+
+from .cli import add_backend_arguments, backend_from_args
+from .fixtures import Fixtures
+from .routes import EXTERNAL_PREFIX
+from .server import (
+    ALL_FAMILIES,
+    FaultPolicy,
+    Latency,
+    StubBackend,
+    TokenBucket,
+    parse_family_specs,
+)
+
+__all__ = [
+    "ALL_FAMILIES",
+    "EXTERNAL_PREFIX",
+    "FaultPolicy",
+    "Fixtures",
+    "Latency",
+    "StubBackend",
+    "TokenBucket",
+    "add_backend_arguments",
+    "backend_from_args",
+    "parse_family_specs",
+]
@@ -0,0 +1,67 @@
+"""
+커맨드라인 옵션. replay 등 다른 하네스도 같은 옵션으로 stub 백엔드를 설정한다.
+"""
+
+from .server import StubBackend, parse_family_specs
+
+import argparse
+import asyncio
+
+
+def add_backend_arguments(
+    parser: argparse.ArgumentParser, prefix: str = "", default_latency: str = "0"
+):
+    """
+    stub 백엔드 설정 옵션을 parser 에 추가한다. 모두 여러 번 줄 수 있고 "[family=]spec" 형식.
+    같은 family 를 여러 번 주면 마지막 값이 쓰인다.
+    replay 등 다른 하네스는 prefix="backend-" 로 같은 옵션을 쓴다.
+    """
+    parser.add_argument(
+        f"--{prefix}latency",
+        action="append",
+        default=[default_latency],
+        help="latency 분포. 0.02 | uniform:0.01,0.05 | lognormal:0.02,0.5 | exp:0.02",
+    )
+    parser.add_argument(
+        f"--{prefix}errors",
+        action="append",
+        help="에러 주입 확률과 코드. 0.05 | 0.05:1002,1006 (get_exception_by_code 코드)",
+    )
+    parser.add_argument(
+        f"--{prefix}rate-limit",
+        action="append",
+        help="초당 요청 수와 burst. 50 | 50:10 (초과하면 code 3000)",
+    )
+
+
+def backend_from_args(args, prefix: str = "", **kwargs) -> StubBackend:
+    attr = prefix.replace("-", "_")
+    return StubBackend(
+        latency=parse_family_specs(getattr(args, f"{attr}latency")),
+        errors=parse_family_specs(getattr(args, f"{attr}errors")),
+        rate_limits=parse_family_specs(getattr(args, f"{attr}rate_limit")),
+        **kwargs,
+    )
+
+
+async def _serve_forever(args):
+    backend = backend_from_args(args, port=args.port, seed=args.seed)
+    await backend.start()
+    print(f"stub backend listening on {backend.url} (BASE_URL={backend.url})")
+    print(f"families: {', '.join(backend.families)}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await backend.stop()
+
+
+def main():
+    from . import __doc__ as doc
+
+    parser = argparse.ArgumentParser(
+        description=doc, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int)
+    add_backend_arguments(parser)
+    asyncio.run(_serve_forever(parser.parse_args()))
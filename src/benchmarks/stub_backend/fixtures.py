@@ -0,0 +1,541 @@
+"""
+handler / api 모델과 같은 모양의 fixture.
+
+telegram_id / public_key 별로 seed 를 고정하므로 같은 사용자는 항상 같은 응답을 받는다.
+크기는 실제 운영 응답에 가깝게 맞춘다. (마켓 데이터 수백 종목, 잔고 수십 종목 등)
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+import random
+import time
+
+# ================================
+# 설정 정보
+# ================================
+CORE_TICKERS = ("USDC", "HYPE", "USOL", "UBTC", "UETH")
+DEFAULT_TOKENS = 200  # 마켓 데이터 종목 수
+DEFAULT_PERP_MARKETS = 150
+DEFAULT_SPOT_HOLDINGS = 30  # 페이지 크기(15) 보다 많아야 Next 버튼이 생긴다
+DEFAULT_PERP_POSITIONS = 20
+DEFAULT_ACCOUNTS = 3  # 사용자당 지갑 수
+DEFAULT_OPEN_ORDERS = 25
+DEFAULT_DCA_JOBS = 5  # 사용자당 time-slice DCA 수
+DEFAULT_COPY_TARGETS = (
+    120  # 구독 중인 전체 타겟 수 (subscription/list 페이지 수를 정한다)
+)
+DEFAULT_POOLS_PER_DEX = 40
+DEFAULT_LP_POSITIONS = 3  # 사용자당 DEX 별 NFT 포지션 수
+
+COPYTRADING_MAX_SUBSCRIPTIONS = 1000
+DEXES = (
+    {"name": "HYPERSWAP", "protocol": "uniswap_v3", "is_ve33": False},
+    {"name": "PRJX", "protocol": "uniswap_v3", "is_ve33": False},
+    {"name": "HYBRA", "protocol": "algebra", "is_ve33": True},
+    {"name": "KITTENSWAP", "protocol": "algebra", "is_ve33": True},
+)
+AGGREGATORS = ("__auto__", "GLUEX", "LIQUIDSWAP", "HYPERBLOOM")
+LP_STABLE = {"ticker": "USDT0", "address": "0xB8CE59FC3717ada4C02eaDF9682A9e934F625ebb"}
+LP_WRAPPED = {
+    "ticker": "WHYPE",
+    "address": "0x5555555555555555555555555555555555555555",
+}
+
+
+def _address(*seed: Any) -> str:
+    return f"0x{random.Random('|'.join(map(str, seed))).getrandbits(160):040x}"
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat()
+
+
+class Fixtures:
+    """
+    엔드포인트 family 별 응답 fixture.
+
+    - market data / 잔고: seed 로 매번 같은 값을 만든다
+    - DCA / copytrading / LP vault 등록 정보: 등록 / 삭제 요청이 반영되도록 메모리에 상태를 둔다
+    """
+
+    def __init__(
+        self,
+        tokens: int = DEFAULT_TOKENS,
+        perp_markets: int = DEFAULT_PERP_MARKETS,
+        spot_holdings: int = DEFAULT_SPOT_HOLDINGS,
+        perp_positions: int = DEFAULT_PERP_POSITIONS,
+        accounts: int = DEFAULT_ACCOUNTS,
+        open_orders: int = DEFAULT_OPEN_ORDERS,
+        dca_jobs: int = DEFAULT_DCA_JOBS,
+        copy_targets: int = DEFAULT_COPY_TARGETS,
+        pools_per_dex: int = DEFAULT_POOLS_PER_DEX,
+        lp_positions: int = DEFAULT_LP_POSITIONS,
+    ):
+        self.spot_holdings = spot_holdings
+        self.perp_positions = perp_positions
+        self.accounts = accounts
+        self.open_orders_count = open_orders
+        self.dca_jobs = dca_jobs
+        self.pools_per_dex = pools_per_dex
+        self.lp_position_count = lp_positions
+        rng = random.Random(0)
+        tickers = [*CORE_TICKERS, *(f"TKN{i}" for i in range(tokens))]
+        self.prices: Dict[str, float] = {
+            ticker: (1.0 if ticker == "USDC" else round(rng.uniform(0.01, 500), 6))
+            for ticker in tickers
+        }
+        self.market_data = [
+            {
+                "Tname": ticker,
+                "coin": "PURR/USDC" if i == 0 else f"@{i}",
+                "tokenId": f"0x{i:032x}",
+                "midPx": price,
+                "markPx": price,
+                "prevDayPx": round(price * rng.uniform(0.9, 1.1), 6),
+                "dayNtlVlm": round(rng.uniform(1e3, 1e8), 2),
+                "circulatingSupply": round(rng.uniform(1e6, 1e9), 2),
+                "totalSupply": round(rng.uniform(1e9, 2e9), 2),
+                "szDecimals": rng.randint(0, 5),
+            }
+            for i, (ticker, price) in enumerate(self.prices.items())
+        ]
+        self.perp_market_data = {
+            f"PERP{i}": {
+                "name": f"PERP{i}",
+                "midPx": round(rng.uniform(0.01, 50000), 6),
+                "markPx": round(rng.uniform(0.01, 50000), 6),
+                "funding": round(rng.uniform(-0.001, 0.001), 8),
+                "openInterest": round(rng.uniform(1e3, 1e7), 2),
+                "dayNtlVlm": round(rng.uniform(1e3, 1e9), 2),
+                "maxLeverage": rng.choice([3, 5, 10, 20, 40, 50]),
+                "szDecimals": rng.randint(0, 5),
+            }
+            for i in range(perp_markets)
+        }
+        self.pools: Dict[str, List[dict]] = {
+            dex["name"]: [
+                self._pool_config(rng, dex["name"], index)
+                for index in range(pools_per_dex)
+            ]
+            for dex in DEXES
+        }
+        # copytrading 타겟 -> 구독자 public_key 목록
+        self.subscriptions: Dict[str, List[dict]] = {
+            _address("target", index): [
+                {
+                    "subscriber_id": _address("subscriber", index, n),
+                    "created_at": _iso(datetime(2025, 1, 1, tzinfo=timezone.utc)),
+                }
+                for n in range(rng.randint(1, 8))
+            ]
+            for index in range(copy_targets)
+        }
+        # 사용자별로 등록 / 삭제한 상태. 처음 조회할 때 seed 로 채운다
+        self._dca: Dict[str, List[dict]] = {}
+        self._lp_vaults: Dict[str, List[dict]] = {}
+        self._lp_settings: Dict[str, dict] = {}
+
+    @staticmethod
+    def _rng(*seed: Any) -> random.Random:
+        return random.Random("|".join(map(str, seed)))
+
+    # ================================
+    # 계정 / 잔고
+    # ================================
+    @staticmethod
+    def public_key(telegram_id: str, index: int) -> str:
+        return f"0x{random.Random(f'{telegram_id}|{index}').getrandbits(160):040x}"
+
+    def account_list(self, telegram_id: str) -> List[dict]:
+        return [
+            {
+                "nickname": f"wallet{index}",
+                "public_key": self.public_key(telegram_id, index),
+                "is_active": index == 0,
+                "is_approved_builder_fee": True,
+            }
+            for index in range(self.accounts)
+        ]
+
+    def account_detail(self, public_key: str) -> dict:
+        rng = self._rng("detail", public_key)
+        return {
+            "public_key": public_key,
+            "copy_trading_details": {
+                "target_pnl_percent": rng.choice((10, 20, 50)),
+                "close_strategy": "COPY",
+                "order_details": {
+                    "order_value_usdc": str(rng.choice((10, 50, 100))),
+                    "leverage": rng.choice((1, 3, 5)),
+                },
+            },
+        }
+
+    def spot_balance(self, *seed: Any) -> dict:
+        rng = self._rng("spot", *seed)
+        balances = {}
+        tickers = [t for t in self.prices if t != "USDC"][: self.spot_holdings]
+        for ticker in tickers:
+            price = self.prices[ticker]
+            amount = round(rng.uniform(1, 1000), 6)
+            entry_ntl = round(amount * price * rng.uniform(0.7, 1.3), 6)
+            value = amount * price
+            balances[ticker] = {
+                "Name": ticker,
+                "token": ticker,
+                "Balance": amount,
+                "entryNtl": entry_ntl,
+                "EntryPrice": entry_ntl / amount,
+                "Price": price,
+                "Value": value,
+                "PNL": value - entry_ntl,
+                "PNL_percent": (value - entry_ntl) / entry_ntl * 100,
+            }
+        total = sum(item["Value"] for item in balances.values())
+        pnl = sum(item["PNL"] for item in balances.values())
+        return {
+            "balances": balances,
+            "usdc_balance": round(rng.uniform(10, 10000), 2),
+            "stock_total_balance": total,
+            "total_pnl": pnl,
+            "total_pnl_percent": pnl / (total - pnl) * 100 if total != pnl else 0.0,
+        }
+
+    def perp_balance(self, *seed: Any) -> dict:
+        rng = self._rng("perp", *seed)
+        positions = {}
+        for name, market in list(self.perp_market_data.items())[: self.perp_positions]:
+            size = round(rng.uniform(0.01, 100), 4)
+            is_long = rng.random() < 0.5
+            entry = market["midPx"] * rng.uniform(0.9, 1.1)
+            value = size * market["midPx"]
+            pnl = (market["midPx"] - entry) * size * (1 if is_long else -1)
+            leverage = rng.choice([1, 2, 5, 10])
+            positions[name] = {
+                "name": name,
+                "szi": size if is_long else -size,
+                "leverage": leverage,
+                "pos_type": "cross",
+                "is_long": is_long,
+                "entryPx": entry,
+                "midPx": market["midPx"],
+                "positionValue": value,
+                "marginUsed": value / leverage,
+                "unrealizedPnl": pnl,
+                "returnOnEquity": pnl / (value / leverage),
+                "liquidationPx": entry * (0.5 if is_long else 1.5),
+            }
+        margin_used = sum(p["marginUsed"] for p in positions.values())
+        unrealized = sum(p["unrealizedPnl"] for p in positions.values())
+        withdrawable = round(rng.uniform(10, 10000), 2)
+        summary = {
+            "accountValue": str(withdrawable + margin_used + unrealized),
+            "totalNtlPos": str(sum(p["positionValue"] for p in positions.values())),
+            "totalRawUsd": str(withdrawable + margin_used),
+            "totalMarginUsed": str(margin_used),
+        }
+        return {
+            "withdrawable": withdrawable,
+            "accountValue": withdrawable + margin_used + unrealized,
+            "invested": margin_used,
+            "totalUnrealizedPnl": unrealized,
+            "pnlPercentage": unrealized / margin_used * 100 if margin_used else 0.0,
+            "totalMarginUsed": margin_used,
+            "crossMaintenanceMarginUsed": margin_used / 10,
+            "time": int(time.time() * 1000),
+            "marginSummary": summary,
+            "crossMarginSummary": summary,
+            "position": {"oneWay": positions, "twoWay": {}},
+        }
+
+    def usdc_balance(self, telegram_id: str, nickname: str) -> dict:
+        index = int(nickname.removeprefix("wallet") or 0)
+        return {
+            "public_key": self.public_key(telegram_id, index),
+            "nickname": nickname,
+            "spot_usdc": self.spot_balance(telegram_id, nickname)["usdc_balance"],
+            "withdrawable": self.perp_balance(telegram_id, nickname)["withdrawable"],
+        }
+
+    def spot_tokens(self, public_key: str, tickers: List[str]) -> Dict[str, float]:
+        rng = self._rng("tokens", public_key)
+        return {ticker: round(rng.uniform(0, 100), 6) for ticker in tickers}
+
+    def withdrawable(self, public_key: str) -> float:
+        return round(self._rng("withdrawable", public_key).uniform(10, 10000), 2)
+
+    def evm_balance(self, kind: str, public_key: str) -> float:
+        return round(self._rng("evm", kind, public_key).uniform(0, 50), 6)
+
+    # ================================
+    # 주문
+    # ================================
+    def order_result(self, *seed: Any, orders: int = 1) -> dict:
+        """
+        OrderData: {"type": "order", "filled": [{"totalSz", "avgPx", "oid"}]}
+        """
+        rng = self._rng("order", *seed, time.time_ns())
+        return {
+            "type": "order",
+            "filled": [
+                {
+                    "totalSz": round(rng.uniform(0.01, 100), 4),
+                    "avgPx": round(rng.uniform(0.01, 500), 6),
+                    "oid": rng.getrandbits(40),
+                }
+                for _ in range(orders)
+            ],
+        }
+
+    def open_orders(self, telegram_id: str) -> List[dict]:
+        rng = self._rng("open_orders", telegram_id)
+        tickers = list(self.prices)[1:]
+        return [
+            {
+                "coin": rng.choice(tickers),
+                "limitPx": str(round(rng.uniform(0.01, 500), 6)),
+                "oid": rng.getrandbits(40),
+                "side": rng.choice(["A", "B"]),
+                "sz": str(round(rng.uniform(0.01, 100), 4)),
+                "timestamp": int(time.time() * 1000) - rng.randint(0, 86_400_000),
+            }
+            for _ in range(self.open_orders_count)
+        ]
+
+    # ================================
+    # DCA
+    # ================================
+    def dca_list(self, public_key: str) -> List[dict]:
+        if public_key not in self._dca:
+            rng = self._rng("dca", public_key)
+            tickers = list(self.prices)[1:]
+            now = datetime.now(timezone.utc)
+            self._dca[public_key] = [
+                {
+                    "id": f"{rng.getrandbits(96):024x}",
+                    "public_key": public_key,
+                    "symbol": rng.choice(tickers),
+                    "type": "spot",
+                    "is_buy": rng.random() < 0.7,
+                    "amount": round(rng.uniform(10, 1000), 2),
+                    "interval_seconds": rng.choice([60, 300, 3600, 86400]),
+                    "next_time": _iso(now + timedelta(seconds=rng.randint(1, 3600))),
+                    "remaining_count": rng.randint(1, 100),
+                }
+                for _ in range(self.dca_jobs)
+            ]
+        return self._dca[public_key]
+
+    def add_dca(self, body: dict) -> dict:
+        jobs = self.dca_list(body["public_key"])
+        job = {
+            "id": f"{random.getrandbits(96):024x}",
+            "public_key": body["public_key"],
+            "symbol": body["ticker"],
+            "type": "spot",
+            "is_buy": body["is_buy"],
+            "amount": body["amount"],
+            "interval_seconds": body["interval_seconds"],
+            "next_time": _iso(
+                datetime.now(timezone.utc) + timedelta(seconds=body["interval_seconds"])
+            ),
+            "remaining_count": body["remaining_count"],
+        }
+        jobs.append(job)
+        return job
+
+    def delete_dca(self, dca_id: str) -> bool:
+        for jobs in self._dca.values():
+            for index, job in enumerate(jobs):
+                if job["id"] == dca_id:
+                    del jobs[index]
+                    return True
+        return False
+
+    # ================================
+    # copytrading
+    # ================================
+    def subscription_page(self, page: int, page_size: int) -> dict:
+        targets = list(self.subscriptions.items())
+        start = (page - 1) * page_size
+        return {
+            "total": len(targets),
+            "page": page,
+            "page_size": page_size,
+            "items": [
+                {"target_id": target, "subscribers": subscribers}
+                for target, subscribers in targets[start : start + page_size]
+            ],
+        }
+
+    def subscription_count(self) -> dict:
+        return {
+            "count": sum(len(items) for items in self.subscriptions.values()),
+            "max": COPYTRADING_MAX_SUBSCRIPTIONS,
+        }
+
+    def targets_by_subscriber(self, public_key: str) -> List[str]:
+        return [
+            target
+            for target, subscribers in self.subscriptions.items()
+            if any(item["subscriber_id"] == public_key for item in subscribers)
+        ]
+
+    def subscribe(self, subscriber: str, target: str) -> bool:
+        subscribers = self.subscriptions.setdefault(target, [])
+        if all(item["subscriber_id"] != subscriber for item in subscribers):
+            subscribers.append(
+                {
+                    "subscriber_id": subscriber,
+                    "created_at": _iso(datetime.now(timezone.utc)),
+                }
+            )
+        return True
+
+    def unsubscribe(self, subscriber: str, target: str) -> bool:
+        subscribers = self.subscriptions.get(target, [])
+        self.subscriptions[target] = [
+            item for item in subscribers if item["subscriber_id"] != subscriber
+        ]
+        if not self.subscriptions[target]:
+            del self.subscriptions[target]
+        return True
+
+    # ================================
+    # 외부 포인트 API
+    # ================================
+    def points(self, provider: str, *seed: Any) -> float:
+        return round(self._rng("points", provider, *seed).uniform(0, 50000), 2)
+
+    # ================================
+    # DEX / LP vault
+    # ================================
+    def _pool_config(self, rng: random.Random, dex_type: str, index: int) -> dict:
+        token = f"TKN{index}"
+        quote = LP_STABLE if index % 2 else LP_WRAPPED
+        return {
+            "id": f"{dex_type.lower()}-{index}",
+            "chain": "HYPERLIQUID",
+            "dex_type": dex_type,
+            "pool_name": f"{token}/{quote['ticker']}",
+            "fee": rng.choice([100, 500, 3000, 10000]),
+            "token0_address": _address("token", token),
+            "token1_address": quote["address"],
+            "address": _address("pool", dex_type, index),
+        }
+
+    def pool_list(self, dex_type: str) -> List[dict]:
+        return self.pools.get(dex_type, [])
+
+    def lp_list(self, public_key: str) -> List[dict]:
+        if public_key not in self._lp_vaults:
+            rng = self._rng("lp_vault", public_key)
+            created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+            self._lp_vaults[public_key] = [
+                self._lp_vault(public_key, rng.choice(self.pools[dex["name"]]), created)
+                for dex in DEXES[:2]
+            ]
+        return self._lp_vaults[public_key]
+
+    @staticmethod
+    def _lp_vault(public_key: str, pool_config: dict, created: datetime) -> dict:
+        return {
+            "id": _address("vault", public_key, pool_config["id"])[2:26],
+            "public_key": public_key,
+            "pool_config_id": pool_config["id"],
+            "range_pct": 5.0,
+            "created_at": _iso(created),
+            "last_updated_at": _iso(created),
+            "pool_config": pool_config,
+        }
+
+    def add_lp_vault(self, body: dict) -> dict:
+        pools = self.pool_list(body["dex_type"]) or self.pools[DEXES[0]["name"]]
+        pool_config = next(
+            (
+                pool
+                for pool in pools
+                if {pool["token0_address"], pool["token1_address"]}
+                == {body.get("token0"), body.get("token1")}
+            ),
+            pools[0],
+        )
+        vault = self._lp_vault(
+            body["public_key"], pool_config, datetime.now(timezone.utc)
+        )
+        self.lp_list(body["public_key"]).append(vault)
+        return vault
+
+    def delete_lp_vault(self, vault_id: str) -> bool:
+        for vaults in self._lp_vaults.values():
+            for index, vault in enumerate(vaults):
+                if vault["id"] == vault_id:
+                    del vaults[index]
+                    return True
+        return False
+
+    def lp_positions(self, public_key: str, dex_type: str) -> List[dict]:
+        rng = self._rng("lp_positions", public_key, dex_type)
+        positions = []
+        for pool_config in rng.sample(
+            self.pool_list(dex_type), min(self.lp_position_count, self.pools_per_dex)
+        ):
+            current = rng.uniform(0.1, 100)
+            positions.append(
+                {
+                    "token_id": rng.getrandbits(32),
+                    "is_managed": True,
+                    "pool_config": pool_config,
+                    "tickLower_price": current * 0.95,
+                    "tickUpper_price": current * 1.05,
+                    "current_price": current,
+                    "token0_amount": rng.uniform(1, 1000),
+                    "token1_amount": rng.uniform(1, 1000),
+                    "token0_price": current,
+                    "token1_price": 1.0,
+                }
+            )
+        return positions
+
+    def lp_profits(self, positions: List[dict]) -> List[dict]:
+        profits = []
+        for position in positions:
+            rng = self._rng("lp_profit", position.get("token_id"))
+            token0, token1 = position["pool_config"]["pool_name"].split("/")
+            profits.append(
+                {
+                    "token_id": position.get("token_id"),
+                    "token0_info": {
+                        "ticker": token0,
+                        "amount": rng.uniform(0, 10),
+                        "price": position.get("token0_price"),
+                    },
+                    "token1_info": {
+                        "ticker": token1,
+                        "amount": rng.uniform(0, 10),
+                        "price": position.get("token1_price"),
+                    },
+                }
+            )
+        return profits
+
+    def lp_settings(self, public_key: str, chain: str) -> dict:
+        return self._lp_settings.setdefault(
+            f"{public_key}|{chain}",
+            {
+                "public_key": public_key,
+                "chain": chain,
+                "aggregator": AGGREGATORS[0],
+                "auto_claim": True,
+            },
+        )
+
+    def swap_tokens(self, public_key: str) -> Dict[str, dict]:
+        rng = self._rng("swap_tokens", public_key)
+        return {
+            token["ticker"]: {
+                "address": token["address"],
+                "amount": round(rng.uniform(0, 1000), 6),
+            }
+            for token in (LP_WRAPPED, LP_STABLE)
+        }
@@ -0,0 +1,40 @@
+"""
+엔드포인트 family 별 route.
+
+각 모듈은 register(backend) 로 자기 family 의 route 를 StubBackend 에 등록한다.
+family 이름은 latency / 에러 주입 / rate limit 설정의 key 로 쓰인다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# ================================
+# 설정 정보
+# ================================
+# 외부 API(HyperUnit 등)를 흉내 낼 때 쓰는 prefix. envelope 없이 원본 JSON 을 돌려준다
+EXTERNAL_PREFIX = "/_external"
+
+Query = Dict[str, List[str]]
+Handler = Callable[[Query, Any], Awaitable[Any]]
+
+
+def query_param(query: Query, name: str, default: Optional[str] = None):
+    values = query.get(name)
+    return values[0] if values else default
+
+
+def register_all(backend):
+    from . import account, balance, copytrading, dca, external, lpvault
+    from . import market_data, order, points
+
+    for module in (
+        market_data,
+        account,
+        balance,
+        order,
+        lpvault,
+        copytrading,
+        dca,
+        external,
+        points,
+    ):
+        module.register(backend)
@@ -0,0 +1,23 @@
+"""
+/account/* : 계정 서버 (잔고 제외)
+"""
+
+from . import query_param
+
+FAMILY = "account"
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route("GET", "/account/all", FAMILY)
+    async def account_all(query, body):
+        return fixtures.account_list(query_param(query, "telegram_id"))
+
+    @backend.route("GET", "/account/detail", FAMILY)
+    async def account_detail(query, body):
+        return fixtures.account_detail(query_param(query, "public_key"))
+
+    @backend.route("POST", "/account/chat_id", FAMILY)
+    async def chat_id(query, body):
+        return True
@@ -0,0 +1,51 @@
+"""
+/account/balance/* , /account/evm/balance/* : 잔고 조회
+"""
+
+from . import query_param
+
+FAMILY = "balance"
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route("GET", "/account/balance/spot", FAMILY)
+    async def spot(query, body):
+        return fixtures.spot_balance(
+            query_param(query, "telegram_id"), query_param(query, "nickname")
+        )
+
+    @backend.route("GET", "/account/balance/perp", FAMILY)
+    async def perp(query, body):
+        return fixtures.perp_balance(
+            query_param(query, "telegram_id"), query_param(query, "nickname")
+        )
+
+    @backend.route("GET", "/account/balance/usdc", FAMILY)
+    async def usdc(query, body):
+        return fixtures.usdc_balance(
+            query_param(query, "telegram_id"), query_param(query, "nickname")
+        )
+
+    @backend.route("GET", "/account/balance/usdc/all", FAMILY)
+    async def usdc_all(query, body):
+        telegram_id = query_param(query, "telegram_id")
+        return [
+            fixtures.usdc_balance(telegram_id, account["nickname"])
+            for account in fixtures.account_list(telegram_id)
+        ]
+
+    @backend.route("GET", "/account/balance/withdrawable/precompile", FAMILY)
+    async def withdrawable(query, body):
+        return fixtures.withdrawable(query_param(query, "public_key"))
+
+    @backend.route("GET", "/account/balance/spot/precompile", FAMILY)
+    async def spot_tokens(query, body):
+        return fixtures.spot_tokens(query_param(query, "public_key"), query["tickers"])
+
+    for kind in ("native", "wrapped"):
+
+        @backend.route("GET", f"/account/evm/balance/{kind}", FAMILY)
+        async def evm_balance(query, body, kind=kind):
+            return fixtures.evm_balance(kind, query_param(query, "public_key"))
@@ -0,0 +1,62 @@
+"""
+/copytrading/* , /account/copytrading/* : copy trading 서버
+"""
+
+from . import query_param
+
+FAMILY = "copytrading"
+
+DETAIL_FIELDS = ("target_pnl_percent", "sell_type", "order_value_usdc", "leverage")
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route("POST", "/copytrading/subscription/subscribe", FAMILY)
+    async def subscribe(query, body):
+        return fixtures.subscribe(body["subscriber"], body["target"])
+
+    @backend.route("POST", "/copytrading/subscription/unsubscribe", FAMILY)
+    async def unsubscribe(query, body):
+        return fixtures.unsubscribe(body["subscriber"], body["target"])
+
+    @backend.route("GET", "/copytrading/subscription/subscribe", FAMILY)
+    async def targets(query, body):
+        return fixtures.targets_by_subscriber(query_param(query, "public_key"))
+
+    @backend.route("GET", "/copytrading/subscription/subscribers", FAMILY)
+    async def subscribers(query, body):
+        target = query_param(query, "subscriber")
+        return [
+            item["subscriber_id"] for item in fixtures.subscriptions.get(target, [])
+        ]
+
+    @backend.route("GET", "/copytrading/subscription/count", FAMILY)
+    async def count(query, body):
+        return fixtures.subscription_count()
+
+    @backend.route("GET", "/copytrading/subscription/list", FAMILY)
+    async def page(query, body):
+        return fixtures.subscription_page(
+            int(query_param(query, "page", "1")),
+            int(query_param(query, "page_size", "15")),
+        )
+
+    @backend.route("GET", "/account/copytrading", FAMILY)
+    async def copytrading_account(query, body):
+        # 활성 계정을 copy trading 계정으로 등록해 둔 것으로 본다
+        return fixtures.account_list(query_param(query, "telegram_id"))[0]
+
+    @backend.route("POST", "/account/copytrading/register", FAMILY)
+    async def register_account(query, body):
+        return True
+
+    @backend.route("POST", "/account/copytrading/unregister", FAMILY)
+    async def unregister_account(query, body):
+        return True
+
+    for field in DETAIL_FIELDS:
+
+        @backend.route("POST", f"/account/copytrading/detail/{field}", FAMILY)
+        async def update_detail(query, body):
+            return True
@@ -0,0 +1,24 @@
+"""
+/dca/* : DCA 서버
+"""
+
+from . import query_param
+
+FAMILY = "dca"
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route("POST", "/dca/time-slice/spot", FAMILY)
+    async def register_spot(query, body):
+        fixtures.add_dca(body)
+        return True
+
+    @backend.route("GET", "/dca/time-slice/spot", FAMILY)
+    async def list_spot(query, body):
+        return fixtures.dca_list(query_param(query, "public_key"))
+
+    @backend.route("DELETE", "/dca/time-slice/spot", FAMILY)
+    async def delete_spot(query, body):
+        return fixtures.delete_dca(query_param(query, "id"))
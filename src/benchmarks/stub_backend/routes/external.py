@@ -0,0 +1,33 @@
+"""
+외부 API (HyperUnit 등). api.bridge.UNIT_API 를 external_url + "/hyperunit" 로 바꿔서 사용한다.
+"""
+
+from . import EXTERNAL_PREFIX
+
+FAMILY = "external"
+
+CHAIN_PREFIXES = {"solana": "sol", "bitcoin": "btc", "ethereum": "eth"}
+
+
+def register(backend):
+    for chain, prefix in CHAIN_PREFIXES.items():
+
+        @backend.route(
+            "GET",
+            f"{EXTERNAL_PREFIX}/hyperunit/gen/{chain}/hyperliquid/{prefix}/",
+            FAMILY,
+            raw=True,
+            prefix=True,
+        )
+        async def bridge_address(query, body):
+            return {"status": "OK", "address": "stub-deposit-address"}
+
+    @backend.route(
+        "GET", f"{EXTERNAL_PREFIX}/hyperunit/v2/estimate-fees", FAMILY, raw=True
+    )
+    async def estimate_fees(query, body):
+        return {
+            "solana": {"depositFee": 5000, "depositEta": "1m"},
+            "ethereum": {"depositEta": "3m"},
+            "bitcoin": {"depositEta": "20m"},
+        }
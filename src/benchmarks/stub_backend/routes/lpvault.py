@@ -0,0 +1,106 @@
+"""
+/dex/lp-vault/* , /dex/* , /account/lp-vault/* : DEX / LP vault 서버
+"""
+
+from ..fixtures import AGGREGATORS, DEXES, LP_STABLE, LP_WRAPPED
+from . import query_param
+
+FAMILY = "lpvault"
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route("POST", "/account/lp-vault/register", FAMILY)
+    async def register_account(query, body):
+        return {"telegram_id": body["telegram_id"], "nickname": body["nickname"]}
+
+    @backend.route("POST", "/account/lp-vault/unregister", FAMILY)
+    async def unregister_account(query, body):
+        return True
+
+    @backend.route("GET", "/dex/lp-vault/dex_list", FAMILY)
+    async def dex_list(query, body):
+        return list(DEXES)
+
+    @backend.route("GET", "/dex/lp-vault/pool_list", FAMILY)
+    async def pool_list(query, body):
+        return fixtures.pool_list(query_param(query, "dex_type"))
+
+    @backend.route("GET", "/dex/lp-vault/aggregator_list", FAMILY)
+    async def aggregator_list(query, body):
+        return list(AGGREGATORS)
+
+    @backend.route("GET", "/dex/lp-vault/list", FAMILY)
+    async def lp_list(query, body):
+        return fixtures.lp_list(query_param(query, "public_key"))
+
+    @backend.route("GET", "/dex/lp-vault/positions", FAMILY)
+    async def positions(query, body):
+        return fixtures.lp_positions(
+            query_param(query, "public_key"), query_param(query, "dex_type")
+        )
+
+    @backend.route("POST", "/dex/lp-vault/profit", FAMILY)
+    async def profit(query, body):
+        return fixtures.lp_profits(body["positions"])
+
+    @backend.route("POST", "/dex/lp-vault/mint", FAMILY)
+    async def mint(query, body):
+        return True
+
+    @backend.route("POST", "/dex/lp-vault", FAMILY)
+    async def register_vault(query, body):
+        return fixtures.add_lp_vault(body)
+
+    @backend.route("DELETE", "/dex/lp-vault/", FAMILY, prefix=True)
+    async def unregister_vault(query, body):
+        return True
+
+    @backend.route("GET", "/dex/lp-vault/settings", FAMILY)
+    async def settings(query, body):
+        return fixtures.lp_settings(
+            query_param(query, "public_key"), query_param(query, "chain")
+        )
+
+    @backend.route("POST", "/dex/lp-vault/settings/auto-claim", FAMILY)
+    async def auto_claim(query, body):
+        settings = fixtures.lp_settings(body["public_key"], body["chain"])
+        settings["auto_claim"] = body["value"]
+        return settings
+
+    @backend.route("POST", "/dex/lp-vault/settings/aggregator", FAMILY)
+    async def change_aggregator(query, body):
+        settings = fixtures.lp_settings(body["public_key"], body["chain"])
+        settings["aggregator"] = body["aggregator"]
+        return settings
+
+    @backend.route("GET", "/dex/core-tokens", FAMILY)
+    async def core_tokens(query, body):
+        return {"wrapped": LP_WRAPPED, "stable": LP_STABLE}
+
+    @backend.route("GET", "/dex/ticker-to-address", FAMILY)
+    async def ticker_to_address(query, body):
+        ticker = query_param(query, "ticker")
+        for token in (LP_WRAPPED, LP_STABLE):
+            if token["ticker"] == ticker:
+                return token["address"]
+        return fixtures.pools[DEXES[0]["name"]][0]["token0_address"]
+
+    @backend.route("GET", "/dex/swap/tokens", FAMILY)
+    async def swap_tokens(query, body):
+        return fixtures.swap_tokens(query_param(query, "public_key"))
+
+    @backend.route("POST", "/dex/swap/routes", FAMILY)
+    async def swap_routes(query, body):
+        return {
+            "ctx_id": f"{body['token_in']}-{body['token_out']}",
+            "routes": [
+                {"aggregator": aggregator, "amount_out": body["amount"]}
+                for aggregator in AGGREGATORS[1:]
+            ],
+        }
+
+    @backend.route("POST", "/dex/swap/routes/execute/", FAMILY, prefix=True)
+    async def execute_swap(query, body):
+        return {"tx_hash": f"0x{'0' * 64}"}
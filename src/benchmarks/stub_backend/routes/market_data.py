@@ -0,0 +1,17 @@
+"""
+/data/* : 마켓 데이터 서버
+"""
+
+FAMILY = "market_data"
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route("GET", "/data/market-data", FAMILY)
+    async def market_data(query, body):
+        return fixtures.market_data
+
+    @backend.route("GET", "/data/perp-market-data", FAMILY)
+    async def perp_market_data(query, body):
+        return fixtures.perp_market_data
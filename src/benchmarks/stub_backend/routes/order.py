@@ -0,0 +1,65 @@
+"""
+/order/* : 주문 서버 (spot / perp / 취소 / delta-neutral)
+"""
+
+from . import query_param
+
+FAMILY = "order"
+
+ORDER_PATHS = (
+    "/order/buy/market",
+    "/order/buy/limit",
+    "/order/sell/limit",
+    "/order/sell/market",
+    "/order/perp/open/market",
+    "/order/perp/close",
+)
+# 여러 주문을 한 번에 내는 경로 (grid / 전량 청산)
+MULTI_ORDER_PATHS = (
+    "/order/buy/grid",
+    "/order/sell/grid",
+    "/order/sell/market/all",
+    "/order/perp/open/grid",
+    "/order/perp/close/grid",
+    "/order/perp/close/all",
+)
+GRID_ORDERS = 10
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    def order_handler(orders: int):
+        async def handler(query, body):
+            return fixtures.order_result((body or {}).get("telegram_id"), orders=orders)
+
+        return handler
+
+    for path in ORDER_PATHS:
+        backend.route("POST", path, FAMILY)(order_handler(1))
+    for path in MULTI_ORDER_PATHS:
+        backend.route("POST", path, FAMILY)(order_handler(GRID_ORDERS))
+
+    @backend.route("GET", "/order/cancel/open_orders", FAMILY)
+    async def open_orders(query, body):
+        return fixtures.open_orders(query_param(query, "telegram_id"))
+
+    @backend.route("POST", "/order/cancel/cancel_orders", FAMILY)
+    async def cancel_orders(query, body):
+        return {"cancelled": body["oids"]}
+
+    @backend.route("POST", "/order/cancel/cancel_all_orders", FAMILY)
+    async def cancel_all_orders(query, body):
+        return {
+            "cancelled": [
+                order["oid"] for order in fixtures.open_orders(body["telegram_id"])
+            ]
+        }
+
+    @backend.route("POST", "/order/delta-neutral/open/market", FAMILY)
+    async def delta_open(query, body):
+        return True
+
+    @backend.route("POST", "/order/delta-neutral/close/market", FAMILY)
+    async def delta_close(query, body):
+        return True
@@ -0,0 +1,36 @@
+"""
+외부 포인트 API (Hybra, PRJX, Hyperbloom). api.lpvault 의 *_API 를 external_url + "/<provider>" 로
+바꿔서 사용한다. provider 마다 family 가 달라서 latency / 에러를 따로 주입할 수 있다.
+"""
+
+from . import EXTERNAL_PREFIX, query_param
+
+
+def register(backend):
+    fixtures = backend.fixtures
+
+    @backend.route(
+        "GET",
+        f"{EXTERNAL_PREFIX}/hybra/api/points/user/",
+        "hybra",
+        raw=True,
+        prefix=True,
+    )
+    async def hybra(query, body):
+        return {"data": {"totalPoints": fixtures.points("hybra")}}
+
+    @backend.route(
+        "GET",
+        f"{EXTERNAL_PREFIX}/prjx/scorecard/impersonate/",
+        "prjx",
+        raw=True,
+        prefix=True,
+    )
+    async def prjx(query, body):
+        return {"stats": {"totalPoints": fixtures.points("prjx")}}
+
+    @backend.route(
+        "GET", f"{EXTERNAL_PREFIX}/hyperbloom/points", "hyperbloom", raw=True
+    )
+    async def hyperbloom(query, body):
+        return {"points": fixtures.points("hyperbloom", query_param(query, "address"))}
@@ -0,0 +1,386 @@
+"""
+BASE_URL 백엔드를 흉내 내는 로컬 HTTP 서버.
+
+표준 라이브러리(asyncio)만으로 HTTP/1.1 keep-alive 서버를 띄우고,
+route 가 돌려준 값을 {"code", "data"} envelope 로 감싸서 보낸다.
+route 는 엔드포인트 family(market_data, balance, order, ...) 단위로 등록되고,
+family 마다 latency 분포 / 에러 주입 / rate limit 을 따로 설정할 수 있다.
+
+- 에러 주입: {"code": <에러 코드>, "data": null} 을 돌려주므로
+  api/ 의 send_request 가 get_exception_by_code 로 실제와 같은 예외를 던진다
+- rate limit: family 별 token bucket. 초과하면 429 + code 3000(ApiLimitExceededException)
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+import asyncio
+import json
+import math
+import random
+import time
+
+from .fixtures import Fixtures
+from .routes import EXTERNAL_PREFIX, Handler, register_all
+
+# ================================
+# 설정 정보
+# ================================
+# family 를 지정하지 않은 설정이 적용되는 key
+ALL_FAMILIES = "*"
+RATE_LIMIT_CODE = 3000  # ApiLimitExceededException
+UNHANDLED_ERROR_CODE = 9999  # UnhandledErrorException
+
+
+# ================================
+# latency 분포
+# ================================
+class Latency:
+    """
+    응답 지연 분포. spec 문자열로 만든다. (단위: 초)
+
+    - "0.02" / "fixed:0.02": 고정
+    - "uniform:0.01,0.05": 균등 분포
+    - "lognormal:0.02,0.5": 중앙값 0.02, sigma 0.5 의 로그 정규 분포 (긴 꼬리)
+    - "exp:0.02": 평균 0.02 의 지수 분포
+    """
+
+    KINDS = ("fixed", "uniform", "lognormal", "exp")
+
+    def __init__(self, kind: str = "fixed", *params: float):
+        if kind not in self.KINDS:
+            raise ValueError(f"unknown latency distribution: {kind}")
+        self.kind = kind
+        self.params = params or (0.0,)
+
+    @classmethod
+    def parse(cls, spec: Union[str, float, "Latency"]) -> "Latency":
+        if isinstance(spec, Latency):
+            return spec
+        if isinstance(spec, (int, float)):
+            return cls("fixed", float(spec))
+        kind, _, params = spec.partition(":")
+        if not params:
+            return cls("fixed", float(kind))
+        return cls(kind, *(float(value) for value in params.split(",")))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(self.params[0], self.params[1])
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+        return rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.kind}:{','.join(map(str, self.params))}"
+
+
+# ================================
+# 에러 주입
+# ================================
+class FaultPolicy:
+    """
+    rate 확률로 codes 중 하나를 에러 응답으로 돌려준다.
+
+    spec: "0.05" (code 500) / "0.05:1002,1006" (주문 서버 slippage, margin 에러)
+    """
+
+    def __init__(self, rate: float, codes: Tuple[int, ...] = (500,)):
+        self.rate = rate
+        self.codes = codes
+
+    @classmethod
+    def parse(cls, spec: Union[str, "FaultPolicy"]) -> "FaultPolicy":
+        if isinstance(spec, FaultPolicy):
+            return spec
+        rate, _, codes = spec.partition(":")
+        if not codes:
+            return cls(float(rate))
+        return cls(float(rate), tuple(int(code) for code in codes.split(",")))
+
+    def pick(self, rng: random.Random) -> Optional[int]:
+        if self.rate and rng.random() < self.rate:
+            return rng.choice(self.codes)
+        return None
+
+    def __repr__(self) -> str:
+        return f"{self.rate}:{','.join(map(str, self.codes))}"
+
+
+# ================================
+# rate limit
+# ================================
+class TokenBucket:
+    """
+    초당 rate 개, 최대 burst 개까지 쌓이는 token bucket.
+
+    spec: "50" (초당 50, burst 50) / "50:10" (초당 50, burst 10)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+
+    @classmethod
+    def parse(cls, spec: Union[str, "TokenBucket"]) -> "TokenBucket":
+        if isinstance(spec, TokenBucket):
+            return spec
+        rate, _, burst = spec.partition(":")
+        return cls(float(rate), float(burst) if burst else None)
+
+    def acquire(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def __repr__(self) -> str:
+        return f"{self.rate}:{self.burst}"
+
+
+def parse_family_specs(specs: Optional[List[str]]) -> Dict[str, str]:
+    """
+    ["0.02", "order=lognormal:0.2,0.4"] -> {"*": "0.02", "order": "lognormal:0.2,0.4"}
+    """
+    result = {}
+    for spec in specs or []:
+        family, sep, value = spec.partition("=")
+        result[family if sep else ALL_FAMILIES] = value if sep else family
+    return result
+
+
+# ================================
+# stub 서버
+# ================================
+class StubBackend:
+    """
+    BASE_URL 로 지정할 수 있는 로컬 HTTP 서버.
+
+    - routes: (method, path) -> (family, async handler(query, json_body) -> data, raw)
+    - calls: path 별 요청 수. 벤치마크에서 update 당 백엔드 호출 수를 계산하는 데 쓴다
+    - injected / throttled: family 별 에러 주입 / rate limit 응답 수
+    - latency / errors / rate_limits: family -> 설정. "*" 는 모든 family 의 기본값
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[Fixtures] = None,
+        latency: Union[float, str, Latency, Dict[str, Any]] = 0.0,
+        errors: Optional[Dict[str, Any]] = None,
+        rate_limits: Optional[Dict[str, Any]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+    ):
+        self.fixtures = fixtures or Fixtures()
+        self.host = host
+        self.port = port
+        self.latency: Dict[str, Latency] = {}
+        self.errors: Dict[str, FaultPolicy] = {}
+        self.rate_limits: Dict[str, TokenBucket] = {}
+        self.calls: Counter = Counter()
+        self.injected: Counter = Counter()
+        self.throttled: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._routes: Dict[Tuple[str, str], Tuple[str, Handler, bool]] = {}
+        self._prefix_routes: Dict[Tuple[str, str], Tuple[str, Handler, bool]] = {}
+
+        if not isinstance(latency, dict):
+            latency = {ALL_FAMILIES: latency}
+        for family, spec in latency.items():
+            self.configure(family, latency=spec)
+        for family, spec in (errors or {}).items():
+            self.configure(family, errors=spec)
+        for family, spec in (rate_limits or {}).items():
+            self.configure(family, rate_limit=spec)
+        register_all(self)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def external_url(self) -> str:
+        return f"{self.url}{EXTERNAL_PREFIX}"
+
+    @property
+    def families(self) -> List[str]:
+        return sorted(
+            {family for family, _, _ in self._routes.values()}
+            | {family for family, _, _ in self._prefix_routes.values()}
+        )
+
+    def configure(
+        self,
+        family: str = ALL_FAMILIES,
+        *,
+        latency: Union[None, float, str, Latency] = None,
+        errors: Union[None, str, FaultPolicy] = None,
+        rate_limit: Union[None, str, TokenBucket] = None,
+    ):
+        """
+        family 의 latency 분포 / 에러 주입 / rate limit 을 바꾼다.
+        실행 중에도 호출할 수 있다. (예: 벤치마크 중간에 장애 구간 만들기)
+        """
+        if latency is not None:
+            self.latency[family] = Latency.parse(latency)
+        if errors is not None:
+            self.errors[family] = FaultPolicy.parse(errors)
+        if rate_limit is not None:
+            self.rate_limits[family] = TokenBucket.parse(rate_limit)
+
+    def route(
+        self,
+        method: str,
+        path: str,
+        family: str,
+        raw: bool = False,
+        prefix: bool = False,
+    ):
+        """
+        handler 를 family 에 등록한다.
+        raw=True 면 envelope 없이 반환값을 그대로 JSON 으로 보내고,
+        prefix=True 면 path 로 시작하는 모든 요청을 받는다. (path parameter 용)
+        """
+
+        def decorator(handler: Handler) -> Handler:
+            routes = self._prefix_routes if prefix else self._routes
+            routes[(method.upper(), path)] = (family, handler, raw)
+            return handler
+
+        return decorator
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # keep-alive 연결이 남아 있으면 wait_closed 가 끝나지 않는다
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def reset_stats(self):
+        self.calls.clear()
+        self.injected.clear()
+        self.throttled.clear()
+
+    def _setting(self, table: Dict[str, Any], family: str):
+        return table.get(family) or table.get(ALL_FAMILIES)
+
+    # ================================
+    # HTTP 처리
+    # ================================
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._dispatch(method, target, body)
+                content = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    "Connection: keep-alive\r\n\r\n".encode() + content
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str, body: bytes):
+        parts = urlsplit(target)
+        self.calls[parts.path] += 1
+        entry = self._routes.get((method.upper(), parts.path)) or self._match_prefix(
+            method.upper(), parts.path
+        )
+        if entry is None:
+            return 404, {"code": 404, "data": None, "error_message": "not found"}
+        family, handler, raw = entry
+
+        # rate limit 은 지연 전에 판정한다 (실제 서버도 큐에 넣기 전에 거절한다)
+        bucket = self._setting(self.rate_limits, family)
+        if bucket is not None and not bucket.acquire():
+            self.throttled[family] += 1
+            return 429, self._error_payload(RATE_LIMIT_CODE, "rate limited", raw)
+
+        latency = self._setting(self.latency, family)
+        if latency is not None:
+            delay = latency.sample(self._rng)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        policy = self._setting(self.errors, family)
+        code = policy.pick(self._rng) if policy is not None else None
+        if code is not None:
+            self.injected[family] += 1
+            return (
+                code if code < 600 else 400,
+                self._error_payload(code, "injected error", raw),
+            )
+
+        query = parse_qs(parts.query)
+        json_body = json.loads(body) if body else None
+        try:
+            data = await handler(query, json_body)
+        except Exception as e:
+            # fixture 에 없는 요청 등. 연결을 끊지 않고 서버 에러로 돌려준다
+            return 500, self._error_payload(UNHANDLED_ERROR_CODE, repr(e), raw)
+        return 200, data if raw else {"code": 200, "data": data}
+
+    @staticmethod
+    def _error_payload(code: int, message: str, raw: bool):
+        if raw:
+            return {"status": "error", "error": message}
+        return {"code": code, "data": None, "error_message": message}
+
+    def _match_prefix(self, method: str, path: str):
+        matches = [
+            (len(prefix), entry)
+            for (route_method, prefix), entry in self._prefix_routes.items()
+            if route_method == method and path.startswith(prefix)
+        ]
+        return max(matches, key=lambda match: match[0])[1] if matches else None
+
+    def stats_snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": sum(self.calls.values()),
+            "injected": dict(self.injected),
+            "throttled": dict(self.throttled),
+            "latency": {family: repr(value) for family, value in self.latency.items()},
+            "errors": {family: repr(value) for family, value in self.errors.items()},
+            "rate_limits": {
+                family: repr(value) for family, value in self.rate_limits.items()
+            },
+        }
@@ -7,8 +7,11 @@ from hypurrquant.logging_config import (
     force_coroutine_logging,
 )
 from api import AccountService, LpVaultService
-from handler.utils.utils import answer, send_or_edit
+from api.loop_monitor import loop_monitor
+from handler.utils.utils import answer
 from handler.utils.account_helpers import fetch_active_account
+from handler.utils.fetch_plan import FetchPlan, FetchResult
+from handler.utils.progressive import ProgressiveMessage
 from handler.utils.cancel import (
     create_cancel_inline_button,
     initialize_handler,
@@ -20,8 +23,9 @@ from .settings import LpvaultSetting
 from .states import *
 from .utils import build_pair_table
 from tabulate import tabulate
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
+import functools
 
 logger = configure_logging(__name__)
 
@@ -36,91 +40,195 @@ CHAIN = "HYPERLIQUID"  # TODO 추후엔 LpVaultSetting으로 넘어가야함.
 async def lpvault_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.info(f"triggerred by user: {context._user_id}")
     await answer(update)
-    await send_or_edit(
-        update,
-        context,
-        "Loading 🔄",
-        parse_mode="Markdown",
-    )
 
     # 1. 계정 정보(토큰, 포인트, LP NFT) 가져오기
     setting: LpvaultSetting = LpvaultSetting.get_setting(context)
+    dashboard = _LpDashboard(setting)
+    progress = ProgressiveMessage(update, context, dashboard.render)
+    dashboard.progress = progress
+    await progress.start("Loading 🔄", parse_mode="Markdown")
+
     account = await fetch_active_account(context)
     setting.account = account
     logger.debug(f"lp_vault_account: {account}")
 
-    (
-        user_lp_list,
-        whype,
-        evm_hype,
-        point_dict,
-    ) = await asyncio.gather(
-        lp_vault_service.lp_list(
-            account.public_key
-        ),  # 유저가 등록한 Lp Vault 리스트 조회, 현재는 체인별 1개가 최대
-        account_service.get_native_wrapped(
-            account.public_key
-        ),  # TODO 추후에 native, erc20 tokens는 한 번에 chain 값에 따라서 가져오게 해야함.
-        account_service.get_evm_native(account.public_key),
-        lp_vault_service.get_points(account.public_key, CHAIN),
+    public_key = account.public_key
+    plan = FetchPlan("lpvault")
+    # 유저가 등록한 Lp Vault 리스트 조회, 현재는 체인별 1개가 최대
+    # 2. lp_list 가 도착하면 DEX 별 포지션 / 수익 조회가 바로 시작된다 (_LpDashboard.on_ready)
+    plan.add("lp_list", lambda: lp_vault_service.lp_list(public_key))
+    # TODO 추후에 native, erc20 tokens는 한 번에 chain 값에 따라서 가져오게 해야함.
+    plan.add(
+        "whype", lambda: account_service.get_native_wrapped(public_key), fallback=None
     )
-
-    # 2. 유저 LP Vault 등록 정보 및 수익 조회
-    logger.debug(f"user_lp_list: {user_lp_list}")
-    lp_dex_set = set()
-    # 2-1. 사용자가 선택한 체인의 포지션 조회
-    for lp in user_lp_list:
-        if lp["pool_config"]["chain"] == CHAIN:
-            lp_dex_set.add(lp["pool_config"]["dex_type"])
-    positions = await asyncio.gather(
-        *[
-            lp_vault_service.get_positions(account.public_key, CHAIN, dex)
-            for dex in lp_dex_set
-        ]
+    plan.add(
+        "evm_hype", lambda: account_service.get_evm_native(public_key), fallback=None
     )
-    logger.debug(f"positions: {positions}")
-    positions_dict: dict[str, list[dict]] = {}
-    for dex, position in zip(lp_dex_set, positions):
-        positions_dict[dex] = position
-
-    # 3. 기본 정보 메시지 작성
-    text = (
-        f"*Auto LP Manager*({CHAIN})\n"
-        f"👤 *{account.nickname}* | `{account.public_key}`\n\n"
+    plan.add(
+        "points", lambda: lp_vault_service.get_points(public_key, CHAIN), fallback={}
     )
+    try:
+        await plan.run(on_ready=dashboard.on_ready)
+        await dashboard.wait()
+    except BaseException:
+        dashboard.cancel()
+        progress.cancel()
+        raise
+    await progress.finish()
 
-    # 4. Lp Vaults 메시지 작성, 사용자가 선택한 체인의 데이터만 추출
-    if user_lp_list:
-        text += "You register\n"
-        for lp_list in user_lp_list:
-            text += f"- {lp_list['pool_config']['pool_name']} ({lp_list['pool_config']['dex_type']})\n"
-
-    # TODO 자산 추후에 체인에 따라서 다르게 가져와야 함. -> point는 잘 가져옴
-    # 5. 자산 및 포인트 메시지 작성
-    text += f"\nYou have\n```"
-    text += tabulate(
-        [["WHYPE", f"{whype:.4f}"], ["HYPE(gas)", f"{evm_hype:.4f}"]], tablefmt="grid"
-    )
-    text += "\nPoints\n"
+    return LpvaultState.SELECT_ACTION
+
+
+_PENDING = object()
+
+
+def _fmt_amount(amount: Any) -> str:
+    if amount is _PENDING:
+        return "⏳"
+    return "fail to fetch" if amount is None else f"{amount:.4f}"
 
-    _table = []
-    for key, value in point_dict.items():
-        _table.append([key, f"{int(value):,}"])
 
-    if _table:
+def _chain_dexes(user_lp_list: List[Dict[str, Any]]) -> List[str]:
+    dexes: List[str] = []
+    for lp in user_lp_list:
+        dex = lp["pool_config"]["dex_type"]
+        if lp["pool_config"]["chain"] == CHAIN and dex not in dexes:
+            dexes.append(dex)
+    return dexes
+
+
+# ================================
+# Auto LP Manager 화면
+# ================================
+class _LpDashboard:
+    """
+    Auto LP Manager 화면의 데이터와 렌더링.
+
+    - lp_list 가 도착하면 DEX 마다 positions -> profits -> 표 렌더링을 따로 진행한다.
+      DEX 끼리는 서로 기다리지 않으므로 가장 느린 DEX 만큼만 걸린다
+    - 데이터가 도착할 때마다 progress.changed() 로 화면을 다시 그린다.
+      아직 도착하지 않은 부분은 ⏳ 로 표시된다
+    - 한 DEX 의 조회가 실패해도 다른 DEX 와 나머지 화면은 그린다
+    """
+
+    def __init__(self, setting: LpvaultSetting):
+        self.setting = setting
+        self.progress: Optional[ProgressiveMessage] = None
+        self._values: Dict[str, Any] = {}
+        self._sections: Dict[str, Optional[str]] = (
+            {}
+        )  # DEX -> 포지션 표, None 이면 조회 중
+        self._tasks: List[asyncio.Task] = []
+
+    def on_ready(self, name: str, value: Any):
+        self._values[name] = value
+        if name == "lp_list":
+            logger.debug(f"user_lp_list: {value}")
+            for dex in _chain_dexes(value):
+                self._sections[dex] = None
+                self._tasks.append(asyncio.create_task(self._load_dex(dex)))
+        if "lp_list" in self._values:
+            self.progress.changed()
+
+    async def wait(self):
+        await asyncio.gather(*self._tasks)
+
+    def cancel(self):
+        for task in self._tasks:
+            task.cancel()
+
+    async def _load_dex(self, dex: str):
+        public_key = self.setting.account.public_key
+        plan = FetchPlan("lpvault_dex")
+        plan.add(
+            "positions",
+            lambda: lp_vault_service.get_positions(public_key, CHAIN, dex),
+            fallback=None,
+        )
+        plan.add(
+            "profits",
+            functools.partial(_fetch_profits, public_key),
+            after=("positions",),
+            fallback=[],
+        )
+        result = await plan.run()
+        self._sections[dex] = await _create_position_text(dex, result)
+        self.progress.changed()
+
+    def render(self) -> Tuple[str, Dict[str, Any]]:
+        account = self.setting.account
+        user_lp_list = self._values["lp_list"]
+
+        # 3. 기본 정보 메시지 작성
+        text = (
+            f"*Auto LP Manager*({CHAIN})\n"
+            f"👤 *{account.nickname}* | `{account.public_key}`\n\n"
+        )
+
+        # 4. Lp Vaults 메시지 작성, 사용자가 선택한 체인의 데이터만 추출
+        if user_lp_list:
+            text += "You register\n"
+            for lp_list in user_lp_list:
+                text += f"- {lp_list['pool_config']['pool_name']} ({lp_list['pool_config']['dex_type']})\n"
+
+        # TODO 자산 추후에 체인에 따라서 다르게 가져와야 함. -> point는 잘 가져옴
+        # 5. 자산 및 포인트 메시지 작성
+        text += f"\nYou have\n```"
         text += tabulate(
-            _table,
+            [
+                ["WHYPE", _fmt_amount(self._values.get("whype", _PENDING))],
+                ["HYPE(gas)", _fmt_amount(self._values.get("evm_hype", _PENDING))],
+            ],
             tablefmt="grid",
         )
+        text += "\nPoints\n"
+
+        point_dict = self._values.get("points", _PENDING)
+        if point_dict is _PENDING:
+            text += "⏳"
+        else:
+            _table = []
+            for key, value in point_dict.items():
+                # 아직 값을 모르는 provider (조회 중이거나 장애)
+                _table.append([key, "-" if value is None else f"{int(value):,}"])
+
+            if _table:
+                text += tabulate(
+                    _table,
+                    tablefmt="grid",
+                )
+
+        text += "```\n\n"
 
-    text += "```\n\n"
+        # 6-1. NFT position 메시지 작성
+        if self._sections:
+            messages_parts = [
+                f"⏳ Loading {dex} positions…" if section is None else section
+                for dex, section in self._sections.items()
+                if section != ""
+            ]
+            message = "\n".join(messages_parts)
+            if not message:
+                message = "⏳ Minting Your Position…"
+            text += f"```\n{message}\n```"
 
-    # 6-1. NFT position 메시지 작성
-    if positions_dict:
-        message = await _create_position_text(account, positions_dict)
+        # 7-2. 포지션이 없을 경우
+        else:
+            text += "You don't have any Auto LP Manager registered yet.\n\n"
 
-        text += f"```\n{message}\n```"
+        text += "💡 Tip: Register a `Create LP Manager` to auto-generate and rebalance LPs within your set pool range. If you prefer to add it later, first open a position with `Manual Mint`, then register it with `Create LP Manager`."
 
+        # text += "🚀 Hyperbloom Boost\n"
+        # text += "Earn extra Hyperbloom points when swapping via Hypurrquant."
+
+        return text, {
+            "reply_markup": _create_keyboard(self.setting, bool(self._sections)),
+            "parse_mode": "Markdown",
+        }
+
+
+def _create_keyboard(setting: LpvaultSetting, has_positions: bool):
+    if has_positions:
         kb = [
             [
                 InlineKeyboardButton(
@@ -135,10 +243,7 @@ async def lpvault_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 )
             ],
         ]
-
-    # 7-2. 포지션이 없을 경우
     else:
-        logger.debug(f"have not positions_dict: {positions_dict}")
         kb = [
             [
                 InlineKeyboardButton(
@@ -154,8 +259,6 @@ async def lpvault_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             ],
         ]
 
-        text += "You don't have any Auto LP Manager registered yet.\n\n"
-
     kb += [
         [
             InlineKeyboardButton(
@@ -202,50 +305,46 @@ async def lpvault_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         ],
     ]
 
-    text += "💡 Tip: Register a `Create LP Manager` to auto-generate and rebalance LPs within your set pool range. If you prefer to add it later, first open a position with `Manual Mint`, then register it with `Create LP Manager`."
+    return InlineKeyboardMarkup(kb)
 
-    # text += "🚀 Hyperbloom Boost\n"
-    # text += "Earn extra Hyperbloom points when swapping via Hypurrquant."
 
-    await send_or_edit(
-        update,
-        context,
-        text,
-        reply_markup=InlineKeyboardMarkup(kb),
-        parse_mode="Markdown",
+async def _fetch_profits(
+    public_key: str, positions: List[dict]
+) -> List[Dict[str, Any]]:
+    # is_managed 필터
+    filtered_positions = [pos for pos in positions if pos.get("is_managed")]
+    if not filtered_positions:
+        return []
+    return (
+        await lp_vault_service.get_profits(public_key, CHAIN, filtered_positions) or []
     )
 
-    return LpvaultState.SELECT_ACTION
 
+async def _create_position_text(dex: str, result: FetchResult) -> str:
+    """
+    DEX 하나의 포지션 표. 관리 중인 포지션이 없으면 빈 문자열
+    """
+    if not result.ok("positions"):
+        return f"{dex}: fail to fetch positions"
 
-async def _create_position_text(account, positions_dict):
-    logger.debug(f"have positions_dict: {positions_dict}")
-    for _, position_item in positions_dict.items():
-        # is_managed 필터
-        filtered_positions = [pos for pos in position_item if pos.get("is_managed")]
-        logger.debug(f"filtered_positions: {filtered_positions}")
+    # is_managed 필터
+    filtered_positions = [pos for pos in result["positions"] if pos.get("is_managed")]
+    logger.debug(f"filtered_positions: {filtered_positions}")
 
-        # profits 길이 안전 처리: get_profits가 포지션 순서대로 반환된다는 전제
-        profits: List[Dict[str, Any]] = (
-            await lp_vault_service.get_profits(
-                account.public_key, CHAIN, filtered_positions
-            )
-            or []
+    # profits 길이 안전 처리: get_profits가 포지션 순서대로 반환된다는 전제
+    profits: List[Dict[str, Any]] = result["profits"]
+    if result.ok("profits") and len(profits) != len(filtered_positions):
+        logger.warning(
+            "profits length %d != filtered_positions length %d",
+            len(profits),
+            len(filtered_positions),
         )
-        if len(profits) != len(filtered_positions):
-            logger.warning(
-                "profits length %d != filtered_positions length %d",
-                len(profits),
-                len(filtered_positions),
-            )
 
-        messages_parts: List[str] = []
-        for idx, filter_position in enumerate(filtered_positions):
-            profit = profits[idx] if idx < len(profits) else {}
-            table_str = build_pair_table(filter_position, profit)
-            messages_parts.append(table_str)
-
-        messages = "\n".join(messages_parts)
-        if not messages:
-            messages = "⏳ Minting Your Position…"
-    return messages
+    messages_parts: List[str] = []
+    for idx, filter_position in enumerate(filtered_positions):
+        profit = profits[idx] if idx < len(profits) else {}
+        table_str = await loop_monitor.offload(
+            build_pair_table, filter_position, profit
+        )
+        messages_parts.append(table_str)
+    return "\n".join(messages_parts)
@@ -24,6 +24,7 @@ from handler.utils.cancel import create_cancel_inline_button
 from handler.utils.utils import send_or_edit, answer
 from handler.utils.account_helpers import fetch_account_manager
 from handler.utils.account_manager import AccountManager
+from handler.utils.balance_cache import BALANCE_STALE_LIMIT
 from handler.command import Command
 
 from hypurrquant.logging_config import (
@@ -48,11 +49,10 @@ async def balance_perp_detail_start(update: Update, context: ContextTypes.DEFAUL
 
     # 데이터 셋팅
     account_manager: AccountManager = await fetch_account_manager(context)
-    perp_balance_mapping: PerpBalanceMapping = (
-        await account_manager.refresh_perp_balance()
-    )
-    logger.debug(f"Perp balance mapping: {type(perp_balance_mapping)}")
-    perp_detail_pagination = PerpDetailPagination(data=perp_balance_mapping)
+    account = await account_manager.get_active_account()
+    # 다시 들어온 경우 캐시된 잔고로 바로 보여주고, 오래됐으면 백그라운드에서 갱신
+    await account_manager.refresh_perp_balance(account, stale_ok=BALANCE_STALE_LIMIT)
+    perp_detail_pagination = PerpDetailPagination(account_manager.telegram_id, account)
     perp_detail_setting: PerpDetailSetting = PerpDetailSetting.get_setting(context)
     perp_detail_setting.perp_detail_pagination = perp_detail_pagination
 
@@ -72,6 +72,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     perp_detail_setting: PerpDetailSetting = PerpDetailSetting.get_setting(context)
     pagination = perp_detail_setting.perp_detail_pagination
+    await pagination.load()
 
     # 메시지 텍스트
     info_text = pagination.generate_info_text()  # 각 종목 정보를 문자열로 만듦
@@ -102,6 +103,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     perp_detail_setting: PerpDetailSetting = PerpDetailSetting.get_setting(context)
     pagination = perp_detail_setting.perp_detail_pagination
+    await pagination.load()
 
     if data.startswith(f"{CALLBACK_PREFIX}_TOGGLE_"):
         await show_more_detail(update, context)
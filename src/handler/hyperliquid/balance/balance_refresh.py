@@ -26,7 +26,7 @@ async def balance_refresh_start(update: Update, context: ContextTypes.DEFAULT_TY
     await answer(update)
 
     account_holder: AccountManager = await fetch_account_manager(context)
-    await account_holder.refresh_all()
+    await account_holder.refresh_all(force=True)
 
     await send_or_edit(update, context, "Success")
     await balance_start(update, context)
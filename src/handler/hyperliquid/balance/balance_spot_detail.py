@@ -18,6 +18,7 @@ from handler.utils.cancel import initialize_handler
 from handler.models.spot_balance import SpotBalance, SpotBalanceMapping
 from handler.utils.account_helpers import fetch_account_manager
 from handler.utils.account_manager import AccountManager
+from handler.utils.balance_cache import BALANCE_STALE_LIMIT
 
 from hypurrquant.logging_config import (
     configure_logging,
@@ -41,10 +42,10 @@ async def balance_spot_detail_start(update: Update, context: ContextTypes.DEFAUL
     await answer(update)
     # 데이터 셋팅
     account_manager: AccountManager = await fetch_account_manager(context)
-    spot_balance_mapping: SpotBalanceMapping = (
-        await account_manager.refresh_spot_balance()
-    )
-    spot_detail_pagination = SpotDetailPagination(data=spot_balance_mapping)
+    account = await account_manager.get_active_account()
+    # 다시 들어온 경우 캐시된 잔고로 바로 보여주고, 오래됐으면 백그라운드에서 갱신
+    await account_manager.refresh_spot_balance(account, stale_ok=BALANCE_STALE_LIMIT)
+    spot_detail_pagination = SpotDetailPagination(account_manager.telegram_id, account)
     spot_detail_setting: SpotDetailSetting = SpotDetailSetting.get_setting(context)
     spot_detail_setting.spot_detail_pagination = spot_detail_pagination
 
@@ -64,6 +65,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     spot_detail_setting: SpotDetailSetting = SpotDetailSetting.get_setting(context)
     pagination = spot_detail_setting.spot_detail_pagination
+    await pagination.load()
 
     # 메시지 텍스트
     info_text = pagination.generate_info_text()  # 각 종목 정보를 문자열로 만듦
@@ -93,6 +95,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     spot_detail_setting: SpotDetailSetting = SpotDetailSetting.get_setting(context)
     pagination = spot_detail_setting.spot_detail_pagination
+    await pagination.load()
 
     if data.startswith(f"{CALLBACK_PREFIX}_TOGGLE_"):
         await show_more_detail(update, context)
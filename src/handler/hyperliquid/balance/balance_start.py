@@ -10,6 +10,7 @@ from .utils import generate_summary
 from .states import *
 from handler.utils.account_helpers import fetch_account_manager
 from handler.utils.account_manager import AccountManager
+from handler.utils.prefetch import balance_prefetcher
 from handler.utils.cancel import create_cancel_inline_button
 from hypurrquant.logging_config import (
     configure_logging,
@@ -37,8 +38,10 @@ async def balance_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # IMPORTANT 잔액 다시 가져오기
     account_hodler: AccountManager = await fetch_account_manager(context)
+    # 메뉴에서 미리 가져온 잔고가 있으면 다시 요청하지 않는다
+    prefetched = await balance_prefetcher.claim(account_hodler)
     spot_balance_mapping, perp_balance_mapping = await account_hodler.refresh_all(
-        force=True
+        force=not prefetched
     )
 
     reply_text = generate_summary(spot_balance_mapping, perp_balance_mapping)
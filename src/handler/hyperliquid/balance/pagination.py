@@ -2,22 +2,45 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from handler.models.spot_balance import SpotBalance, SpotBalanceMapping
 from handler.models.perp_balance import PositionDetail, PerpBalanceMapping
-from handler.utils.pagenation import Pagenation
+from handler.utils.pagenation import CursorPagenation
+from handler.utils.account_manager import AccountManager
+from handler.utils.balance_cache import BALANCE_STALE_LIMIT
+from handler.utils.utils import TimeUtils
+from hypurrquant.models.account import Account
 from hypurrquant.logging_config import configure_logging
 
-from typing import List
+from typing import List, Optional
+import time
 
 logger = configure_logging(__name__)
 
 
-class SpotDetailPagination(Pagenation):
-    def __init__(self, data: SpotBalanceMapping, page_size=15):
-
-        # 상위 생성자 호출
-        data: List[SpotBalance] = list(data.balances.values())
+class SpotDetailPagination(CursorPagenation):
+    def __init__(self, telegram_id: str, account: Account, page_size=15):
+        """
+        Args:
+            telegram_id (str): 사용자 telegram id.
+            account (Account): 잔고를 보여줄 계정. 잔고는 balance_cache 에서 다시 채운다.
+        """
+        self.account = account
+        self.as_of: Optional[float] = None  # 보여주는 잔고를 가져온 시각
+        super().__init__(source_id=(telegram_id, account.nickname), page_size=page_size)
+
+    async def _fetch(self) -> List[SpotBalance]:
+        telegram_id, _ = self.source_id
+        account_manager = AccountManager(telegram_id=telegram_id)
+        # BALANCE_STALE_LIMIT 이내의 캐시는 바로 쓰고, 오래됐으면 백그라운드에서 갱신
+        spot_balance_mapping: SpotBalanceMapping = (
+            await account_manager.refresh_spot_balance(
+                self.account, stale_ok=BALANCE_STALE_LIMIT
+            )
+        )
+        self.as_of = time.time() - (
+            account_manager.balance_age("spot", self.account) or 0.0
+        )
+        data: List[SpotBalance] = list(spot_balance_mapping.balances.values())
         sort_key_func = lambda x: x.Value
-        data = sorted(data, key=sort_key_func, reverse=True)
-        super().__init__(data=data, page_size=page_size)
+        return sorted(data, key=sort_key_func, reverse=True)
 
     def generate_info_text(self) -> str:
 
@@ -39,6 +62,7 @@ class SpotDetailPagination(Pagenation):
 
         message += "+---------+-----------+-----------+\n"
         message += "```\n"
+        message += TimeUtils.format_as_of(self.as_of)
 
         return message
 
@@ -87,14 +111,32 @@ class SpotDetailPagination(Pagenation):
         return InlineKeyboardMarkup(buttons)
 
 
-class PerpDetailPagination(Pagenation):
-    def __init__(self, data: PerpBalanceMapping, page_size=15):
-
-        # 상위 생성자 호출
-        data: List[PositionDetail] = list(data.position.oneWay.values())
+class PerpDetailPagination(CursorPagenation):
+    def __init__(self, telegram_id: str, account: Account, page_size=15):
+        """
+        Args:
+            telegram_id (str): 사용자 telegram id.
+            account (Account): 포지션을 보여줄 계정. 잔고는 balance_cache 에서 다시 채운다.
+        """
+        self.account = account
+        self.as_of: Optional[float] = None  # 보여주는 잔고를 가져온 시각
+        super().__init__(source_id=(telegram_id, account.nickname), page_size=page_size)
+
+    async def _fetch(self) -> List[PositionDetail]:
+        telegram_id, _ = self.source_id
+        account_manager = AccountManager(telegram_id=telegram_id)
+        # BALANCE_STALE_LIMIT 이내의 캐시는 바로 쓰고, 오래됐으면 백그라운드에서 갱신
+        perp_balance_mapping: PerpBalanceMapping = (
+            await account_manager.refresh_perp_balance(
+                self.account, stale_ok=BALANCE_STALE_LIMIT
+            )
+        )
+        self.as_of = time.time() - (
+            account_manager.balance_age("perp", self.account) or 0.0
+        )
+        data: List[PositionDetail] = list(perp_balance_mapping.position.oneWay.values())
         sort_key_func = lambda x: x.returnOnEquity
-        data = sorted(data, key=sort_key_func, reverse=True)
-        super().__init__(data=data, page_size=page_size)
+        return sorted(data, key=sort_key_func, reverse=True)
 
     def generate_info_text(self) -> str:
 
@@ -116,6 +158,7 @@ class PerpDetailPagination(Pagenation):
 
         message += "+---------+-----------+-----------+\n"
         message += "```\n"
+        message += TimeUtils.format_as_of(self.as_of)
 
         return message
 
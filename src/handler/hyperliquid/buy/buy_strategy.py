@@ -68,7 +68,10 @@ async def start_strategy(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return ConversationHandler.END
 
-    strategy_setting.strategies = all_strategies
+    # 캐시된 응답은 사용자 간에 공유되므로, update_params 로 수정하기 전에 복사해 둔다
+    strategy_setting.strategies = {
+        key: meta.model_copy(deep=True) for key, meta in all_strategies.items()
+    }
 
     # 전략 목록 표시
     keyboard = []
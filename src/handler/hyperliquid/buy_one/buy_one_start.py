@@ -11,7 +11,7 @@ from telegram.ext import (
     filters,
 )
 from api import AccountService
-from api.hyperliquid import BuyOrderService, MarketDataCache
+from api.hyperliquid import BuyOrderService, MarketDataCache, market_snapshot_store
 from hypurrquant.models.market_data import MarketData
 from hypurrquant.logging_config import (
     force_coroutine_logging,
@@ -53,7 +53,8 @@ async def buy_one_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await answer(update)
     BuyOneSetting.clear_setting(context)
     buy_one_setting: BuyOneSetting = BuyOneSetting.get_setting(context)
-    market_datas: List[MarketData] = fetcher._market_datas
+    # 거래대금 순으로 정렬된 스냅샷 뷰 (레코드 복사 없음)
+    market_datas = market_snapshot_store.view("spot", sort_by="volume")
     current_balance = await fetch_active_wallet_usdc_balance(context)
     market_data_pagination = MarketDataPagination(
         market_data=market_datas, current_balance=current_balance
@@ -76,6 +77,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.debug("show_current_page")
     buy_one_setting: BuyOneSetting = BuyOneSetting.get_setting(context)
     pagination = buy_one_setting.market_data_pagination
+    await pagination.load()
 
     # 메시지 텍스트
     info_text = pagination.generate_info_text()  # 각 종목 정보를 문자열로 만듦
@@ -104,6 +106,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     buy_one_setting: BuyOneSetting = BuyOneSetting.get_setting(context)
     pagination = buy_one_setting.market_data_pagination
+    await pagination.load()
 
     if data.startswith(f"{CALLBACK_PREFIX}_TOGGLE_"):
         await information(update, context)
@@ -1,8 +1,9 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from hypurrquant.models.market_data import MarketData
+from api.hyperliquid import SnapshotView
 from hypurrquant.logging_config import configure_logging
-from handler.utils.pagenation import Pagenation
+from handler.utils.pagenation import SnapshotPagenation
 from handler.utils.cancel import create_cancel_inline_button
 from handler.command import Command
 from typing import List
@@ -12,10 +13,10 @@ logger = configure_logging(__name__)
 MINIMUM_PER_ORDER = 20  # 최소 주문 금액 (USDC)
 
 
-class MarketDataPagination(Pagenation):
+class MarketDataPagination(SnapshotPagenation):
     def __init__(
         self,
-        market_data: List[MarketData],
+        market_data: SnapshotView,
         current_balance: float,
         page_size=15,
     ):
@@ -23,13 +24,12 @@ class MarketDataPagination(Pagenation):
         MarketDataPagination 초기화.
 
         Args:
-            market_data (list): Market Data 리스트.
+            market_data (SnapshotView): 거래대금 순으로 정렬된 spot 스냅샷 뷰.
             page_size (int): 한 페이지에 표시할 데이터 개수. 기본값은 4.
         """
         self.current_balance = current_balance
 
-        market_data = sorted(market_data, key=lambda x: x.dayNtlVlm, reverse=True)
-        # 상위 생성자 호출
+        # 상위 생성자 호출 (스냅샷 버전과 정렬 기준만 cursor 로 보관)
         super().__init__(market_data, page_size)
 
     def generate_info_text(self) -> str:
@@ -13,6 +13,7 @@ from .utils import (
 from .states import *
 from handler.utils.account_helpers import fetch_account_manager
 from handler.utils.account_manager import AccountManager
+from handler.utils.prefetch import balance_prefetcher
 from handler.command import Command
 from handler.utils.cancel import create_cancel_inline_button
 from hypurrquant.logging_config import (
@@ -45,7 +46,9 @@ async def close_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # IMPORTANT 잔액 다시 가져오기
     account_hodler: AccountManager = await fetch_account_manager(context)
-    await account_hodler.refresh_perp_balance(force=True)
+    # 메뉴에서 미리 가져온 잔고가 있으면 다시 요청하지 않는다
+    prefetched = await balance_prefetcher.claim(account_hodler)
+    await account_hodler.refresh_perp_balance(force=not prefetched)
 
     # balance 가져와서 및 설정값 저장
     perp_balance_mapping: PerpBalanceMapping = (
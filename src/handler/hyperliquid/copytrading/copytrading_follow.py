@@ -6,7 +6,7 @@ from telegram.ext import (
 )
 
 from api.hyperliquid import CopytradingService
-from .pagination import SubscriptionPagination
+from .pagination import SubscriptionPagination, subscription_pages
 from .settings import *
 from .states import (
     FollowStates,
@@ -37,7 +37,7 @@ async def follow_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # 데이터 셋팅
     page_size = 15
-    data = await copytrading_service.page_subscription(page_size=page_size)
+    data = await subscription_pages.get(1, page_size)
     logger.info(f"page_subscription {data}")
     pagination = SubscriptionPagination(data=data)
     follow_setting: FollowSetting = FollowSetting.get_setting(context)
@@ -59,6 +59,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     follow_setting: FollowSetting = FollowSetting.get_setting(context)
     pagination = follow_setting.pagination
+    await pagination.load()
 
     # 메시지 텍스트
     info_text = pagination.generate_info_text()  # 각 종목 정보를 문자열로 만듦
@@ -74,6 +75,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.effective_chat.send_message(
             text=info_text, reply_markup=keyboard_markup, parse_mode="Markdown"
         )
+    pagination.prefetch_adjacent()
 
 
 # =============== #
@@ -88,6 +90,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     follow_setting: FollowSetting = FollowSetting.get_setting(context)
     pagination = follow_setting.pagination
+    await pagination.load()
 
     if data.startswith(f"{CALLBACK_PREFIX}_TOGGLE_"):
         await show_more_detail(update, context)
@@ -1,10 +1,12 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from api.hyperliquid import ListSubscriptionsResponse, CopytradingService
-from handler.utils.pagenation import Pagenation
+from api.utils import single_flight
+from handler.utils.pagenation import CursorPagenation
 from hypurrquant.logging_config import configure_logging
 
-from typing import List
+from typing import Dict, List, Set
+import asyncio
 import math
 
 logger = configure_logging(__name__)
@@ -12,17 +14,97 @@ logger = configure_logging(__name__)
 copytrading_service = CopytradingService()
 
 
-class SubscriptionPagination(Pagenation):
+# ================================
+# 구독 목록 페이지 조회 / prefetch
+# ================================
+class SubscriptionPages:
+    """
+    서버 페이지 단위의 구독 목록 조회. 목록은 모든 사용자에게 같으므로 사용자 간에 공유한다.
+
+    - 캐시: page_subscription 의 response_cache("subscription_page") 를 (page, page_size) 키로 사용
+    - 같은 페이지의 동시 조회는 하나로 합친다. prefetch 중인 페이지로 Next 를 누르면 그 결과를 기다린다
+    - prefetch_adjacent(): 페이지를 그린 뒤 앞 / 뒤 페이지를 백그라운드로 미리 캐시에 채운다
+    """
+
+    def __init__(self):
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats: Dict[str, int] = {"prefetched": 0, "prefetch_failed": 0}
+
+    async def get(self, page: int, page_size: int) -> ListSubscriptionsResponse:
+        return await single_flight.do(
+            ("subscription_page", page, page_size),
+            "subscription_page",
+            lambda: copytrading_service.page_subscription(page, page_size),
+        )
+
+    def prefetch_adjacent(self, page: int, page_size: int, total_pages: int):
+        for adjacent in (page + 1, page - 1):
+            if 1 <= adjacent <= total_pages:
+                task = asyncio.create_task(self._prefetch(adjacent, page_size))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _prefetch(self, page: int, page_size: int):
+        try:
+            await self.get(page, page_size)
+        except Exception as e:
+            # prefetch 실패는 사용자에게 보이지 않는다. 페이지를 넘길 때 다시 조회한다
+            self._stats["prefetch_failed"] += 1
+            logger.info(f"subscription page {page} prefetch failed: {e!r}")
+            return
+        self._stats["prefetched"] += 1
+
+    def stats_snapshot(self) -> dict:
+        return {
+            **self._stats,
+            "pending": len(self._tasks),
+            "flights": single_flight.stats_snapshot().get("subscription_page"),
+        }
+
+
+subscription_pages = SubscriptionPages()
+
+
+class SubscriptionPagination(CursorPagenation):
+    """
+    서버에서 페이지 단위로 가져오는 구독 목록. current_page 는 1부터 시작한다.
+    cursor 로는 페이지 번호와 전체 페이지 수만 보관하고, 현재 페이지 항목은
+    load() 에서 page_subscription 으로 다시 가져온다.
+    """
+
     def __init__(self, data: ListSubscriptionsResponse, page_size=15):
-        self.original_data = data
-        super().__init__(data=data["items"], page_size=page_size)
+        super().__init__(source_id="subscription", page_size=page_size)
         self.current_page = 1
-        self.total_pages = (data["total"] + data["page_size"] - 1) // data["page_size"]
+        self._set_total_pages(data)
+        self._set_rows(data["items"])
+
+    def _set_total_pages(self, data: ListSubscriptionsResponse):
+        page_size = data["page_size"]
+        self._total_pages = (data["total"] + page_size - 1) // page_size
+
+    async def _fetch(self) -> List[dict]:
+        data = await subscription_pages.get(self.current_page, self.page_size)
+        self._set_total_pages(data)
+        return data["items"]
+
+    def prefetch_adjacent(self):
+        """
+        현재 페이지를 그린 뒤 호출. Prev / Next 로 갈 페이지를 미리 가져온다
+        """
+        subscription_pages.prefetch_adjacent(
+            self.current_page, self.page_size, self.total_pages
+        )
+
+    def _clamp_page(self):
+        # 서버 페이지는 1부터 시작한다
+        self.current_page = max(1, min(self.current_page, self.total_pages))
+
+    @property
+    def total_pages(self) -> int:
+        return self._total_pages
 
-    def __update(self, data: ListSubscriptionsResponse):
-        self.original_data = data
-        self.data = data["items"]
-        self.total_pages = (data["total"] + data["page_size"] - 1) // data["page_size"]
+    def get_current_page_data(self) -> List[dict]:
+        return self.data
 
     def generate_info_text(self) -> str:
         lines = ["🔗 *Subscribed Targets:*", ""]
@@ -70,18 +152,12 @@ class SubscriptionPagination(Pagenation):
     def has_prev_page(self) -> bool:
         return self.current_page > 1
 
-    async def go_to_next_page(self):
+    def go_to_next_page(self):
         if self.has_next_page():
             self.current_page += 1
-            data = await copytrading_service.page_subscription(
-                self.current_page, self.page_size
-            )
-            self.__update(data)
+            self.release()  # 다음 load() 에서 새 페이지를 가져온다
 
-    async def go_to_prev_page(self):
+    def go_to_prev_page(self):
         if self.has_prev_page():
             self.current_page -= 1
-            data = await copytrading_service.page_subscription(
-                self.current_page, self.page_size
-            )
-            self.__update(data)
+            self.release()
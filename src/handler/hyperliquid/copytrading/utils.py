@@ -1,12 +1,11 @@
 from api import AccountService
-from api.hyperliquid import CopytradingService, HLAccountService
+from api.hyperliquid import CopytradingService
+from handler.utils.fetch_plan import FetchPlan
 from .settings import CopytradingSetting
-import asyncio
 
 from telegram.ext import ContextTypes
 
 account_service = AccountService()
-hl_account_service = HLAccountService()
 copytrading_service = CopytradingService()
 
 
@@ -14,14 +13,18 @@ async def generate_info_text(context: ContextTypes.DEFAULT_TYPE) -> str:
     copytrading_setting: CopytradingSetting = CopytradingSetting.get_setting(context)
     account = copytrading_setting.account  # copytraindg 계좌 조회
 
-    dto, account_detail, targets, count = await asyncio.gather(
-        hl_account_service.get_perp_balance(context._user_id, account.nickname),
-        account_service.get_account_detail(account.public_key),
-        copytrading_service.get_targets_by_subscriber(account.public_key),
-        copytrading_service.count_subscription(),
+    plan = FetchPlan("copytrading")
+    plan.add("detail", lambda: account_service.get_account_detail(account.public_key))
+    plan.add(
+        "targets",
+        lambda: copytrading_service.get_targets_by_subscriber(account.public_key),
+        fallback=None,
     )
+    plan.add("count", copytrading_service.count_subscription, fallback=None)
+    result = await plan.run()
+    targets, count = result["targets"], result["count"]
 
-    copytrading_detail = account_detail["copy_trading_details"]
+    copytrading_detail = result["detail"]["copy_trading_details"]
     message = (
         "*Copy Trading*\n\n"
         "**>*Feature Overview*\n"
@@ -39,7 +42,9 @@ async def generate_info_text(context: ContextTypes.DEFAULT_TYPE) -> str:
     message += "```\n"
     message += "* Subscriber *            \n"
     message += "+------------------------+\n"
-    if not targets:
+    if targets is None:
+        message += "| fail to fetch          |\n"
+    elif not targets:
         message += "| No subscribers yet     |\n"
     else:
         for target in targets:
@@ -54,13 +59,13 @@ async def generate_info_text(context: ContextTypes.DEFAULT_TYPE) -> str:
     message += f"| leverage:           X{int(copytrading_detail['order_details']['leverage'])} |\n"
     message += "+------------------------+```\n"
 
-    message += (
-        "**>*Note*\n"
-        "> \n"
-        f">· This feature supports only `{count['max']}` total subscriptions wallet across all users \(first\‑come, first\‑served\); "
-        f"`{count['count']}` wallets have already been claimed\n"
-        f">· This {count['max']} wallet limit is temporary, and capacity will be significantly expanded soon\n"
-        '>· The Copy Trading Type is initially set to "Copy," which means the sales will also be executed automatically\. This can be changed in the "Copy Trading Type" section||'
-    )
+    message += "**>*Note*\n> \n"
+    if count is not None:
+        message += (
+            f">· This feature supports only `{count['max']}` total subscriptions wallet across all users \(first\‑come, first\‑served\); "
+            f"`{count['count']}` wallets have already been claimed\n"
+            f">· This {count['max']} wallet limit is temporary, and capacity will be significantly expanded soon\n"
+        )
+    message += '>· The Copy Trading Type is initially set to "Copy," which means the sales will also be executed automatically\. This can be changed in the "Copy Trading Type" section||'
 
     return message
@@ -19,6 +19,7 @@ from handler.utils.account_helpers import (
     fetch_account_manager,
 )
 from handler.utils.account_manager import AccountManager
+from handler.utils.prefetch import balance_prefetcher
 from handler.command import Command
 from hypurrquant.models.account import Account
 from handler.utils.decorators import (
@@ -43,13 +44,15 @@ async def delta_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     setting: DeltaSetting = DeltaSetting.get_setting(context)
     account: Account = await fetch_active_account(context)
     account_hodler: AccountManager = await fetch_account_manager(context)
+    # 메뉴에서 미리 가져온 잔고가 있으면 다시 요청하지 않는다
+    prefetched = await balance_prefetcher.claim(account_hodler)
 
     # 2. 잔액 조회
     response, (spot_balance_mapping, perp_balance_mapping) = await asyncio.gather(
         hl_account_service.get_usdc_balance_by_nickname(
             context._user_id, account.nickname
         ),
-        account_hodler.refresh_all(force=True),
+        account_hodler.refresh_all(force=not prefetched),
     )
 
     # 3. 페이지네이션 설정
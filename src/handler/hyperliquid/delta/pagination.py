@@ -5,7 +5,7 @@ from hypurrquant.utils.paired_symbols import (
     symbol_table,
 )
 from handler.utils.pagenation import Pagenation
-from api.hyperliquid import PerpMarketDataCache
+from api.hyperliquid import market_snapshot_store
 
 from typing import List
 
@@ -13,8 +13,6 @@ logger = configure_logging(__name__)
 
 MINIMUM_PER_ORDER = 20  # 최소 주문 금액 (USDC)
 
-perp_market_data_cache = PerpMarketDataCache()
-
 
 class DeltaSymbolPagination(Pagenation):
     def __init__(
@@ -61,12 +59,11 @@ class DeltaSymbolPagination(Pagenation):
         response += "+----------+------------+----------+\n"
 
         # Table rows with data
+        snapshot = market_snapshot_store.current("perp")
         for stock in current_list:
-            price = perp_market_data_cache.market_datas[stock].midPx
-            apy = (
-                pow(1 + perp_market_data_cache.market_datas[stock].funding, 24 * 365)
-                - 1
-            ) * 100
+            market_data = snapshot.by_name(stock)
+            price = market_data.midPx
+            apy = (pow(1 + market_data.funding, 24 * 365) - 1) * 100
             response += (
                 f"| {stock:<9}"  # left-align width 9
                 f"| {price:>11.3f}"  # right-align width 11, 3 decimals
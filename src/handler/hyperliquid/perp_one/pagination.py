@@ -3,7 +3,8 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from hypurrquant.models.perp_market_data import (
     MarketData as PerpMarketData,
 )
-from handler.utils.pagenation import Pagenation
+from handler.utils.pagenation import SnapshotPagenation
+from api.hyperliquid import SnapshotView
 from hypurrquant.logging_config import configure_logging
 from handler.utils.cancel import create_cancel_inline_button
 from handler.command import Command
@@ -14,16 +15,15 @@ logger = configure_logging(__name__)
 MINIMUM_PER_ORDER = 20  # 최소 주문 금액 (USDC)
 
 
-class PerpMarketDataPagination(Pagenation):
+class PerpMarketDataPagination(SnapshotPagenation):
     def __init__(
         self,
-        market_data: List[PerpMarketData],
+        market_data: SnapshotView,
         current_balance: float,
         page_size=15,
     ):
         self.current_balance = current_balance
-        market_data = sorted(market_data, key=lambda x: x.dayNtlVlm, reverse=True)
-        # 상위 생성자 호출
+        # 상위 생성자 호출 (스냅샷 버전과 정렬 기준만 cursor 로 보관)
         super().__init__(market_data, page_size)
 
     def generate_info_text(self) -> str:
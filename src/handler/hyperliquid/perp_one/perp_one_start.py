@@ -15,7 +15,11 @@ from hypurrquant.logging_config import (
     configure_logging,
     force_coroutine_logging,
 )
-from api.hyperliquid import PerpOrderService, PerpMarketDataCache
+from api.hyperliquid import (
+    PerpOrderService,
+    PerpMarketDataCache,
+    market_snapshot_store,
+)
 from handler.command import Command
 from handler.utils.account_helpers import fetch_account_manager
 from handler.utils.account_manager import AccountManager
@@ -49,11 +53,12 @@ async def perp_one_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await answer(update)
     PerpOneSetting.clear_setting(context)
     perp_one_setting: PerpOneSetting = PerpOneSetting.get_setting(context)
-    market_datas: List[PerpMarketData] = list(
-        perp_market_data_caache.market_datas.values()
-    )
+    # 거래대금 순으로 정렬된 스냅샷 뷰 (레코드 복사 없음)
+    market_datas = market_snapshot_store.view("perp", sort_by="volume")
     account_manager: AccountManager = await fetch_account_manager(context)
-    perp_balance_mapping: PerpBalanceMapping = account_manager.perp_balance_mapping
+    perp_balance_mapping: PerpBalanceMapping = (
+        await account_manager.get_perp_balance_mapping()
+    )
     perp_market_data_pagination = PerpMarketDataPagination(
         market_datas, perp_balance_mapping.withdrawable
     )
@@ -71,6 +76,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.info(f"triggerred by user: {context._user_id}")
     perp_one_setting: PerpOneSetting = PerpOneSetting.get_setting(context)
     pagination = perp_one_setting.perp_market_data_pagination
+    await pagination.load()
 
     # 메시지 텍스트
     info_text = pagination.generate_info_text()  # 각 종목 정보를 문자열로 만듦
@@ -99,6 +105,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     perp_one_setting: PerpOneSetting = PerpOneSetting.get_setting(context)
     pagination = perp_one_setting.perp_market_data_pagination
+    await pagination.load()
 
     if data.startswith(f"{CALLBACK_PREFIX}_TOGGLE_"):
         await information(update, context)
@@ -231,7 +238,9 @@ async def select_leverage(update: Update, context: ContextTypes.DEFAULT_TYPE):
     perp_one_setting.leverage = value
 
     account_manager: AccountManager = await fetch_account_manager(context)
-    perp_balance_mapping: PerpBalanceMapping = account_manager.perp_balance_mapping
+    perp_balance_mapping: PerpBalanceMapping = (
+        await account_manager.get_perp_balance_mapping()
+    )
 
     message = f"How much would you like to purchase?\n\n"
     message += f"💰 Max Position Value: {float(perp_balance_mapping.withdrawable) * float(perp_one_setting.leverage)}\n"
@@ -263,7 +272,9 @@ async def order(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # validation: 최소 금액 확인
     account_manager: AccountManager = await fetch_account_manager(context)
-    perp_balance_mapping: PerpBalanceMapping = account_manager.perp_balance_mapping
+    perp_balance_mapping: PerpBalanceMapping = (
+        await account_manager.get_perp_balance_mapping()
+    )
     current_balance = perp_balance_mapping.withdrawable * float(
         perp_one_setting.leverage
     )
@@ -1,4 +1,5 @@
 from api.hyperliquid import HLAccountService
+from handler.utils.fetch_plan import FetchPlan
 from .settings import RebalanceSetting
 from api.hyperliquid import RebalanceService, RebalanceDetailDto, SpotBalanceMappingDTO
 from telegram.ext import ContextTypes
@@ -8,14 +9,20 @@ rebalance_service = RebalanceService()
 
 
 async def generate_info_text(context: ContextTypes.DEFAULT_TYPE) -> str:
-    respnose: RebalanceDetailDto = await rebalance_service.get_rebalance_detail(
-        context._user_id
-    )
-    spot_dto: SpotBalanceMappingDTO = (
-        await hl_account_service.get_spot_balance_by_public_key(respnose.public_key)
-    )
     account = RebalanceSetting.get_setting(context).account
 
+    # 잔고는 rebalance 계좌(setting.account)로 바로 조회하므로 detail 과 동시에 실행된다
+    plan = FetchPlan("rebalance")
+    plan.add("detail", lambda: rebalance_service.get_rebalance_detail(context._user_id))
+    plan.add(
+        "spot",
+        lambda: hl_account_service.get_spot_balance_by_public_key(account.public_key),
+        fallback=None,
+    )
+    result = await plan.run()
+    respnose: RebalanceDetailDto = result["detail"]
+    spot_dto: SpotBalanceMappingDTO = result["spot"]
+
     message = (
         "*Alarm Feature*\n\n"
         "The alarm feature tracks the total PNL of the Spot assets in the selected wallet and sends an alert to the user when a specific PNL target is reached.\n\n"
@@ -29,8 +36,12 @@ async def generate_info_text(context: ContextTypes.DEFAULT_TYPE) -> str:
     message += f"📊 public key: `{account.public_key}` ```\n"
     message += "* Account Info *\n"
     message += "+------------------------+\n"
-    message += f"| PNL(%):  {spot_dto.total_pnl_percent:12.2f}% |\n"
-    message += f"| PNL   :  {spot_dto.total_pnl:12.2f}$ |\n"
+    if spot_dto is not None:
+        message += f"| PNL(%):  {spot_dto.total_pnl_percent:12.2f}% |\n"
+        message += f"| PNL   :  {spot_dto.total_pnl:12.2f}$ |\n"
+    else:
+        message += f"| PNL(%):  {'fail to fetch':>13s} |\n"
+        message += f"| PNL   :  {'fail to fetch':>13s} |\n"
     message += "+------------------------+\n\n"
     message += "* Setting *\n"
     message += "+------------------------+\n"
@@ -1,23 +1,57 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
-from .models.orderable_spot_balance import (
-    OrderableSpotbalance,
-)
-from handler.utils.pagenation import Pagenation
+from handler.models.spot_balance import SpotBalance, SpotBalanceMapping
+from handler.utils.pagenation import CursorPagenation
+from handler.utils.account_manager import AccountManager
+from handler.utils.balance_cache import BALANCE_STALE_LIMIT
+from handler.utils.utils import TimeUtils
+from hypurrquant.models.account import Account
 from hypurrquant.logging_config import configure_logging
 
-from typing import List
+from typing import List, Optional
+import time
 
 logger = configure_logging(__name__)
 
 
-class SellableOrderPagination(Pagenation):
-    def __init__(self, data: List[OrderableSpotbalance], page_size=15):
-        logger.debug(f"Data: {data}")
+class SellableOrderPagination(CursorPagenation):
+    def __init__(
+        self, telegram_id: str, account: Account, min_value: float, page_size=15
+    ):
+        """
+        Args:
+            telegram_id (str): 사용자 telegram id.
+            account (Account): 매도할 계정. 잔고는 balance_cache 에서 다시 채운다.
+            min_value (float): 이 금액을 넘는 종목만 매도 대상으로 보여준다.
+        """
+        self.account = account
+        self.min_value = min_value
+        self.as_of: Optional[float] = None  # 보여주는 잔고를 가져온 시각
+        super().__init__(source_id=(telegram_id, account.nickname), page_size=page_size)
+
+    async def _fetch(self) -> List[SpotBalance]:
+        telegram_id, _ = self.source_id
+        account_manager = AccountManager(telegram_id=telegram_id)
+        # 목록은 BALANCE_STALE_LIMIT 이내의 캐시로 바로 보여준다.
+        # 주문 수량은 CONFIRM 시점에 최신 잔고로 다시 맞춘다 (sell_specific.page_callback)
+        spot_balance_mapping: SpotBalanceMapping = (
+            await account_manager.refresh_spot_balance(
+                self.account, stale_ok=BALANCE_STALE_LIMIT
+            )
+        )
+        self.as_of = time.time() - (
+            account_manager.balance_age("spot", self.account) or 0.0
+        )
+        data = [
+            balance
+            for balance in spot_balance_mapping.balances.values()
+            if balance.Value > self.min_value
+        ]
         sort_key_func = lambda x: x.PNL
-        data = sorted(data, key=sort_key_func, reverse=True)
-        # 상위 생성자 호출
-        super().__init__(data=data, page_size=page_size)
+        return sorted(data, key=sort_key_func, reverse=True)
+
+    def get_selected_data(self) -> List[SpotBalance]:
+        return [balance for balance in self.data if self.is_selected(balance.Name)]
 
     def generate_info_text(self) -> str:
 
@@ -39,11 +73,12 @@ class SellableOrderPagination(Pagenation):
             message += (
                 f"| {balance.Name:<8}"  # 왼쪽 정렬, 폭 8
                 f"| {balance.PNL:9.2f}$"  # 오른쪽 정렬, 폭 11, 소수점 5자리
-                f"| {'   ✅   ' if balance.is_sell else '   ❌   '}|\n"  # 오른쪽 정렬, 폭 10, 소수점 2자리, 'K' 추가
+                f"| {'   ✅   ' if self.is_selected(balance.Name) else '   ❌   '}|\n"  # 오른쪽 정렬, 폭 10, 소수점 2자리, 'K' 추가
             )
 
         message += "+---------+-----------+----------+\n"
         message += "```\n"
+        message += TimeUtils.format_as_of(self.as_of)
 
         return message
 
@@ -54,7 +89,9 @@ class SellableOrderPagination(Pagenation):
         row = []  # 한 행을 담는 임시 리스트
 
         for i, data in enumerate(current_page_data):
-            display_name = f"✅ {data.Name}" if data.is_sell else data.Name
+            display_name = (
+                f"✅ {data.Name}" if self.is_selected(data.Name) else data.Name
+            )
             row.append(
                 InlineKeyboardButton(
                     display_name,
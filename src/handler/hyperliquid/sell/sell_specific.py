@@ -13,15 +13,14 @@ from handler.utils.cancel import main_menu
 from handler.utils.utils import send_or_edit
 from handler.utils.account_helpers import fetch_account_manager
 from handler.utils.account_manager import AccountManager
+from handler.models.spot_balance import SpotBalanceMapping
 from .states import SpecificStates
 from .utils import (
+    MINIMUM_PER_ORDER,
     can_operation_sell,
     create_sepcific_sell_request_body,
 )
 from .pagenation import SellableOrderPagination
-from .models.orderable_spot_balance import (
-    OrderableSpotbalance,
-)
 from .settings import (
     SellSetting,
     SellSepcificSetting,
@@ -63,11 +62,10 @@ async def sell_sepecific_start(update: Update, context: ContextTypes.DEFAULT_TYP
         await asyncio.sleep(1.5)
         return await main_menu(update, context, specific_setting.return_to)
 
+    account_manager: AccountManager = await fetch_account_manager(context)
+    account = await account_manager.get_active_account()
     specific_setting.sellable_order_pagination = SellableOrderPagination(
-        [
-            OrderableSpotbalance(**(d.model_dump()))
-            for d in sell_setting.sellable_balance
-        ]
+        account_manager.telegram_id, account, min_value=MINIMUM_PER_ORDER
     )
 
     await show_current_page(update, context)
@@ -85,6 +83,7 @@ async def show_current_page(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     specific_setting: SellSepcificSetting = SellSepcificSetting.get_setting(context)
     pagination = specific_setting.sellable_order_pagination
+    await pagination.load()
 
     # 메시지 텍스트
     info_text = pagination.generate_info_text()  # 각 종목 정보를 문자열로 만듦
@@ -114,6 +113,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     specific_setting: SellSepcificSetting = SellSepcificSetting.get_setting(context)
     pagination = specific_setting.sellable_order_pagination
+    await pagination.load()
 
     if data.startswith(f"{CALLBACK_PREFIX}_TOGGLE_"):
         # 종목 선택/해제 토글
@@ -122,7 +122,7 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         current_page_data = pagination.get_current_page_data()
         for item in current_page_data:
             if item.Name == ticker:
-                item.is_sell = not item.is_sell
+                pagination.toggle(ticker)
                 break  # 찾으면 즉시 종료
 
         await show_current_page(update, context)
@@ -139,22 +139,37 @@ async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return SpecificStates.PAGE
 
     elif data == f"{CALLBACK_PREFIX}_CONFIRM":
-        will_sell_balance = [d for d in pagination.data if d.is_sell]
+        will_sell_balance = pagination.get_selected_data()
 
         if len(will_sell_balance) <= 0:
             await query.edit_message_text(NO_STOCK)
             return ConversationHandler.END
 
-        # 판매 주문 실행
-        request_body = create_sepcific_sell_request_body(
-            specific_setting.sellable_order_pagination.data
+        # 목록은 캐시된 잔고(stale-while-revalidate)일 수 있으므로, 그 사이 더 이상 보유하지 않는
+        # 토큰은 max_age 안의 잔고로 걸러낸다. 주문은 비율(100%)이라 수량은 잔고에서 가져오지 않는다
+        account_hodler: AccountManager = await fetch_account_manager(context)
+        fresh_mapping: SpotBalanceMapping = await account_hodler.refresh_spot_balance(
+            pagination.account
         )
+        fresh_by_name = {
+            balance.Name: balance for balance in fresh_mapping.balances.values()
+        }
+        will_sell_balance = [
+            fresh_by_name[balance.Name]
+            for balance in will_sell_balance
+            if balance.Name in fresh_by_name
+        ]
+        if len(will_sell_balance) <= 0:
+            await query.edit_message_text(NO_STOCK)
+            return ConversationHandler.END
+
+        # 판매 주문 실행
+        request_body = create_sepcific_sell_request_body(will_sell_balance)
         response = await sellOrderService.sell_order_market(
             context._user_id, request_body
         )
 
         # 잔고 갱신
-        account_hodler: AccountManager = await fetch_account_manager(context)
         await account_hodler.refresh_spot_balance(force=True)
         if response:
             await query.edit_message_text(
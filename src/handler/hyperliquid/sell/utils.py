@@ -3,9 +3,6 @@ from telegram.ext import ContextTypes
 
 from handler.models.spot_balance import SpotBalance
 from .settings import SellSetting
-from .models.orderable_spot_balance import (
-    OrderableSpotbalance,
-)
 from handler.models.spot_balance import SpotBalanceMapping
 from hypurrquant.logging_config import configure_logging
 
@@ -81,17 +78,16 @@ def create_partial_sell_request_body(
 
 
 def create_sepcific_sell_request_body(
-    spot_balances: List[OrderableSpotbalance],
+    spot_balances: List[SpotBalance],
 ) -> List[dict]:
     """
-    부분 매도 요청 바디를 생성하는 함수.
+    선택한 종목 전량 매도 요청 바디를 생성하는 함수.
 
     Args:
-        spot_balances (list): SpotBalance 리스트.
-        percent (float): 매도 비율.
+        spot_balances (list): 매도하기로 선택한 SpotBalance 리스트.
 
     Returns:
-        list: 부분 매도 요청 바디 리스트.
+        list: 매도 요청 바디 리스트.
     """
 
     filterd_balances = [
@@ -100,7 +96,6 @@ def create_sepcific_sell_request_body(
             "value": 100,
         }
         for balance in spot_balances
-        if balance.is_sell
     ]
     logger.debug(f"create_sepcific_sell_request_body: {filterd_balances}")
     return filterd_balances
@@ -9,15 +9,16 @@ from hypurrquant.logging_config import (
     configure_logging,
     force_coroutine_logging,
 )
-from hypurrquant.api.market_data import hyqFetch as market_data_cache
 
 from api import AccountService, BridgeService, Chain
-from api.hyperliquid import HLAccountService
+from api.hyperliquid import HLAccountService, MarketDataCache
 from api.exception import CannotApproveBuilderFeeException
 
 from handler.utils.cancel import cancel_handler, create_cancel_inline_button
 from handler.utils.utils import send_or_edit
-from handler.utils.account_helpers import fetch_active_account
+from handler.utils.account_helpers import fetch_active_account, fetch_account_manager
+from handler.utils.prefetch import balance_prefetcher
+from handler.utils.fetch_plan import FetchPlan, FetchResult
 from handler.start.states import StartStates
 from handler.command import Command
 from hypurrquant.models.account import Account
@@ -25,12 +26,14 @@ from .states import HLCoreStartState
 import os
 import re  # 🔹 추가
 import asyncio
+import functools
 
 logger = configure_logging(__name__)
 
 bridge_service = BridgeService()
 hl_account_service = HLAccountService()
 account_service = AccountService()
+market_data_cache = MarketDataCache()
 
 
 # 🔹 MarkdownV2 특수문자 자동 이스케이프 함수 추가
@@ -56,7 +59,12 @@ def HOW_TO_DEPOSIT(
     solana_time = metadata.get(Chain.SOLANA.value, {}).get("depositEta", "unknown")
     eth_time = metadata.get(Chain.ETHEREUM.value, {}).get("depositEta", "unknown")
     bitcoin_time = metadata.get(Chain.BITCOIN.value, {}).get("depositEta", "unknown")
-    fee = metadata.get("fee", 0.0)
+    fee = metadata.get("fee")
+    fee = f"{fee:.2f}" if fee is not None else "unknown"
+    solana_address, eth_address, bitcoin_address = (
+        address or "fail to fetch"
+        for address in (solana_address, eth_address, bitcoin_address)
+    )
     return (
         "**> *How to [Deposit](https://docs.hypurrquant.com/bot_commands/how-to-deposit)*\n"
         "> \n"
@@ -78,43 +86,75 @@ def HOW_TO_DEPOSIT(
         f">Please deposit at least `0.002` BTC to the following address: `{bitcoin_address}` \(tap to copy\)\n"
         f">Est\. time: \~ {bitcoin_time}\n"
         f">\n"
-        f">fee\($\): `{fee:.2f}`$||\n\n"
+        f">fee\($\): `{fee}`$||\n\n"
+    )
+
+
+def _plan_deposit_info(plan: FetchPlan, account: Account):
+    """
+    입금 안내에 쓰는 bridge 주소 / 수수료. 실패해도 나머지 화면은 그린다
+    """
+    for name, chain in (
+        ("sol_address", Chain.SOLANA),
+        ("eth_address", Chain.ETHEREUM),
+        ("bit_address", Chain.BITCOIN),
+    ):
+        plan.add(
+            name,
+            functools.partial(
+                bridge_service.get_bridge_address,
+                chain=chain,
+                dst_evm_addr=account.public_key,
+            ),
+            fallback=None,
+        )
+    plan.add(
+        "metadata",
+        functools.partial(bridge_service.estimate_solana_fees, convert_to_usd=True),
+        fallback={},
+    )
+
+
+def _how_to_deposit(result: FetchResult) -> str:
+    return HOW_TO_DEPOSIT(
+        result["sol_address"],
+        result["eth_address"],
+        result["bit_address"],
+        result["metadata"],
     )
 
 
 async def generate_command_message(account: Account) -> str:
+    plan = FetchPlan("hl_start")
+    _plan_deposit_info(plan, account)
     if account.is_approved_builder_fee:
-        withdrawable, spot_list, sol_address, eth_address, bit_address, metadata = (
-            await asyncio.gather(
-                hl_account_service.get_withdrawable(account.public_key),
-                hl_account_service.get_spot_balance_precompile(
-                    account.public_key, ["USDC", "HYPE", "USOL", "UBTC", "UETH"]
-                ),
-                bridge_service.get_bridge_address(
-                    chain=Chain.SOLANA,
-                    dst_evm_addr=account.public_key,
-                ),
-                bridge_service.get_bridge_address(
-                    chain=Chain.ETHEREUM,
-                    dst_evm_addr=account.public_key,
-                ),
-                bridge_service.get_bridge_address(
-                    chain=Chain.BITCOIN,
-                    dst_evm_addr=account.public_key,
-                ),
-                bridge_service.estimate_solana_fees(convert_to_usd=True),
-            )
+        plan.add(
+            "withdrawable",
+            functools.partial(hl_account_service.get_withdrawable, account.public_key),
+        )
+        plan.add(
+            "spot_list",
+            functools.partial(
+                hl_account_service.get_spot_balance_precompile,
+                account.public_key,
+                ["USDC", "HYPE", "USOL", "UBTC", "UETH"],
+            ),
+        )
+        result = await plan.run()
+        withdrawable, spot_list, metadata = (
+            result["withdrawable"],
+            result["spot_list"],
+            result["metadata"],
         )
         logger.debug(f"metadata= {metadata}")
         data = {
             ticker: {
                 "total": spot_list[ticker],
-                "value": float(market_data_cache.filter_by_Tname(ticker).midPx)
-                * spot_list[ticker],
+                "value": market_data_cache.mid_px(ticker) * spot_list[ticker],
             }
             for ticker in spot_list.keys()
         }
-        how_to_deposit = HOW_TO_DEPOSIT(sol_address, eth_address, bit_address, metadata)
+        how_to_deposit = _how_to_deposit(result)
 
         return (
             "🚀 Welcome to HypurrQuant\. All\-In\-One crypto portfolio utility bot by Team [QUANT](https://t.me/hypurrquantannouncement)\n\n"
@@ -131,22 +171,7 @@ async def generate_command_message(account: Account) -> str:
             "ℹ️ Questions? Join our [community](https://t.me/hypurrquant_official)"
         )
     else:
-        sol_address, eth_address, bit_address, metadata = await asyncio.gather(
-            bridge_service.get_bridge_address(
-                chain=Chain.SOLANA,
-                dst_evm_addr=account.public_key,
-            ),
-            bridge_service.get_bridge_address(
-                chain=Chain.ETHEREUM,
-                dst_evm_addr=account.public_key,
-            ),
-            bridge_service.get_bridge_address(
-                chain=Chain.BITCOIN,
-                dst_evm_addr=account.public_key,
-            ),
-            bridge_service.estimate_solana_fees(convert_to_usd=True),
-        )
-        how_to_deposit = HOW_TO_DEPOSIT(sol_address, eth_address, bit_address, metadata)
+        how_to_deposit = _how_to_deposit(await plan.run())
 
         msg = (
             "🚀 Welcome to HypurrQuant\. All\-In\-One crypto portfolio utility bot by Team [QUANT](https://t.me/hypurrquantannouncement)\n\n"
@@ -295,6 +320,10 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         disable_web_page_preview=True,
     )
 
+    if account.is_approved_builder_fee:
+        # 다음 탭(Balance / Spot Sell / Perp Close / Delta)이 쓸 잔고를 미리 가져온다
+        balance_prefetcher.schedule(await fetch_account_manager(context), account)
+
     return HLCoreStartState.TRIGGER
 
 
@@ -25,6 +25,20 @@ class MarginSummary(BaseModel):
     totalRawUsd: float  # 기준(참조) Raw USD (고정)
     totalMarginUsed: float  # 포지션 유지에 사용된 증거금의 합
 
+    @field_validator(
+        "accountValue",
+        "totalNtlPos",
+        "totalRawUsd",
+        "totalMarginUsed",
+        mode="before",
+    )
+    def convert_to_float(cls, v):
+        # 백엔드 응답에서 바로 검증할 때도 PerpBalanceMappingDTO 와 같은 규칙을 적용
+        try:
+            return float(v)
+        except (ValueError, TypeError):
+            return 0.0
+
 
 # --- Position 모델 ---
 # get_perp_data에서는 assetPositions 리스트를 재구조화하여,
@@ -55,6 +69,22 @@ class PerpBalanceMapping(BaseModel):
     class Config:
         extra = "ignore"  # 추가 필드는 무시
 
+    @field_validator(
+        "withdrawable",
+        "accountValue",
+        "invested",
+        "totalUnrealizedPnl",
+        "pnlPercentage",
+        "totalMarginUsed",
+        "crossMaintenanceMarginUsed",
+        mode="before",
+    )
+    def convert_fields(cls, v):
+        try:
+            return float(v)
+        except (ValueError, TypeError):
+            return 0.0
+
     @property
     def total_position_value(self) -> float:
         """
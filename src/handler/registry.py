@@ -0,0 +1,72 @@
+from handler.command import Command
+from handler.utils.exception_handler import exception_error_handler
+
+from telegram import BotCommand
+from telegram.ext import Application
+
+# ================================
+# 명령어 메뉴
+# ================================
+BOT_COMMANDS = [
+    BotCommand(Command.START, "Start the bot"),
+    # BotCommand(Command.BUY, "Buy spot assets using a strategy"),
+    # BotCommand(Command.BUY_ONE, "Buy a spot asset"),
+    # BotCommand(Command.SELL, "Sell spot assets"),
+    # BotCommand(Command.PERP_ONE, "Open a perpetual position"),
+    # BotCommand(Command.CLOSE, "Close perpetual positions."),
+    # BotCommand(Command.WALLET, "Manage your wallet settings"),
+    # BotCommand(Command.BALANCE, "View account balance and P&L summary"),
+    # BotCommand(Command.REBALANCE, "PNL alarm features"),
+    # BotCommand(
+    #     Command.COPY_TRADING,
+    #     "Execute copy traidng",
+    # ),
+    # BotCommand(Command.REFERRAL, "referral"),
+]
+
+
+# ================================
+# 핸들러 등록
+# ================================
+def register_handlers(application: Application) -> None:
+    """
+    봇의 handler graph 를 application 에 등록한다.
+    app.common() 과 benchmarks(replay)가 같은 graph 를 쓰도록 여기 한 곳에서 관리한다.
+    """
+    from handler.start.start import start_handler
+    from handler.hyperliquid.buy.buy import buy_conv_handler
+    from handler.hyperliquid.buy_one.buy_one import buy_one_conv_handler
+    from handler.hyperliquid.perp_one.perp_one import perp_one_conv_handler
+    from handler.hyperliquid.sell.sell import sell_conv
+    from handler.hyperliquid.close.close import close_conv
+    from handler.hyperliquid.copytrading.copytrading import copytrading_conv_handler
+    from handler.hyperliquid.dca.dca import dca_conv_handler
+    from handler.hyperliquid.grid.grid import grid_conv_handler
+    from handler.hyperliquid.delta.delta import delta_conv_handler
+    from handler.hyperliquid.balance.balacne import balance_conv_handler
+    from handler.hyperliquid.start.start import hyperliquid_core_start_handler
+    from handler.evm.lpvault.lpvault import lpvault_conv_handler
+    from handler.evm.balance.balance import (
+        balance_conv_handler as evm_balance_conv_handler,
+    )
+    from handler.wallet.wallet import wallet_handler
+    from handler.referral.referral import referral_conv_handler
+
+    application.add_handler(start_handler)
+    # application.add_handler(buy_conv_handler)
+    application.add_handler(buy_one_conv_handler)
+    application.add_handler(perp_one_conv_handler)
+    application.add_handler(sell_conv)
+    application.add_handler(close_conv)
+    application.add_handler(wallet_handler)
+    application.add_handler(balance_conv_handler)
+    application.add_handler(evm_balance_conv_handler)
+    # application.add_handler(rebalance_conv_handler)
+    application.add_handler(copytrading_conv_handler)
+    application.add_handler(hyperliquid_core_start_handler)
+    application.add_handler(referral_conv_handler)
+    application.add_handler(dca_conv_handler)
+    application.add_handler(grid_conv_handler)
+    application.add_handler(delta_conv_handler)
+    application.add_handler(lpvault_conv_handler)
+    application.add_error_handler(exception_error_handler)
@@ -7,14 +7,13 @@ from hypurrquant.logging_config import (
     configure_logging,
     force_coroutine_logging,
 )
-from hypurrquant.api.market_data import hyqFetch as market_data_cache
 from handler.utils.account_helpers import fetch_active_account
 from handler.command import Command
 from hypurrquant.models.account import Account
 from handler.start.states import StartStates
 from handler.evm.balance.states import EvmBalanceState
 from api import AccountService, Chain, BridgeService
-from api.hyperliquid import HLAccountService
+from api.hyperliquid import HLAccountService, MarketDataCache
 from api.exception import CannotApproveBuilderFeeException
 from handler.utils.utils import send_or_edit
 from .states import StartStates
@@ -27,6 +26,7 @@ PROFILE = os.getenv("PROFILE")
 bridge_service = BridgeService()
 hl_account_service = HLAccountService()
 account_service = AccountService()
+market_data_cache = MarketDataCache()
 
 
 # 🔹 MarkdownV2 특수문자 자동 이스케이프 함수 추가
@@ -105,8 +105,7 @@ async def generate_command_message(account: Account) -> str:
         data = {
             ticker: {
                 "total": spot_list[ticker],
-                "value": float(market_data_cache.filter_by_Tname(ticker).midPx)
-                * spot_list[ticker],
+                "value": market_data_cache.mid_px(ticker) * spot_list[ticker],
             }
             for ticker in spot_list.keys()
         }
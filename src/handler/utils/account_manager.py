@@ -2,6 +2,7 @@ from api import (
     AccountDto,
     AccountService,
 )
+from api.utils import single_flight
 from api.hyperliquid import (
     PerpBalanceMappingDTO,
     SpotBalanceMappingDTO,
@@ -12,11 +13,12 @@ from api.hyperliquid import (
 from hypurrquant.models.account import Account
 from handler.models.spot_balance import SpotBalanceMapping
 from handler.models.perp_balance import PerpBalanceMapping
+from handler.utils.balance_cache import BalanceEntry, balance_cache
 from hypurrquant.logging_config import configure_logging
 
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, PrivateAttr
 import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from asyncio import Lock
 import asyncio
 
@@ -33,19 +35,112 @@ logger = configure_logging(__name__)
 # Account를 보관하는 Utility Manager
 # ================================
 class AccountManager(BaseModel):
+    """
+    user_data 에 저장되는 계정 정보.
+
+    persistence 로 저장되는 것은 telegram_id 와 활성 계정(식별 정보)뿐이고,
+    잔고는 balance_cache 에 (telegram_id, nickname) 단위로 보관한다.
+    """
+
     telegram_id: str
     active_account: Optional[Account] = None
-    spot_balance_mapping: Optional[SpotBalanceMapping] = None
-    perp_balance_mapping: Optional[PerpBalanceMapping] = None
-    spot_last_refresh_time: float = Field(default=0.0)
-    perp_last_refresh_time: float = Field(default=0.0)
-    refresh_all_last_refresh_time: float = Field(default=0.0)
 
     # Private fields for locks
     _account_lock: Lock = PrivateAttr(default_factory=Lock)
-    _spot_refresh_lock: Lock = PrivateAttr(default_factory=Lock)
-    _perp_refresh_lock: Lock = PrivateAttr(default_factory=Lock)
-    _refresh_all_lock: Lock = PrivateAttr(default_factory=Lock)
+
+    def __setstate__(self, state):
+        # 이전 버전에서 user_data 에 함께 저장된 잔고 필드는 버린다
+        fields = type(self).model_fields
+        state["__dict__"] = {
+            key: value for key, value in state["__dict__"].items() if key in fields
+        }
+        state["__pydantic_fields_set__"] = {
+            key for key in state.get("__pydantic_fields_set__", ()) if key in fields
+        }
+        # 이전 버전의 refresh lock 들은 single_flight 로 대체되었다
+        state["__pydantic_private__"] = {
+            key: value
+            for key, value in (state.get("__pydantic_private__") or {}).items()
+            if key in type(self).__private_attributes__
+        }
+        super().__setstate__(state)
+
+    # ================================
+    # 잔고 캐시 접근
+    # ================================
+    def _balances(self, account: Account) -> BalanceEntry:
+        return balance_cache.get(self.telegram_id, account.nickname)
+
+    @property
+    def spot_balance_mapping(self) -> Optional[SpotBalanceMapping]:
+        """
+        활성 계정의 캐시된 SpotBalanceMapping. 캐시에 없으면 None.
+        """
+        if not self.active_account:
+            return None
+        entry = balance_cache.peek(self.telegram_id, self.active_account.nickname)
+        return entry.spot_balance_mapping if entry else None
+
+    @property
+    def perp_balance_mapping(self) -> Optional[PerpBalanceMapping]:
+        """
+        활성 계정의 캐시된 PerpBalanceMapping. 캐시에 없으면 None.
+        """
+        if not self.active_account:
+            return None
+        entry = balance_cache.peek(self.telegram_id, self.active_account.nickname)
+        return entry.perp_balance_mapping if entry else None
+
+    def balance_age(
+        self, kind: str, account: Optional[Account] = None
+    ) -> Optional[float]:
+        """
+        kind("spot" / "perp") 잔고를 마지막으로 가져온 뒤 지난 시간 (초). 캐시에 없으면 None.
+        """
+        account = account or self.active_account
+        if not account:
+            return None
+        entry = balance_cache.peek(self.telegram_id, account.nickname)
+        refreshed_at = getattr(entry, f"{kind}_last_refresh_time", 0.0)
+        if not refreshed_at:
+            return None
+        return time.time() - refreshed_at
+
+    # ================================
+    # stale-while-revalidate
+    # ================================
+    def _stale_mapping(
+        self, kind: str, account: Account, max_age: float, stale_ok: float
+    ):
+        """
+        stale_ok 초보다 젊은 캐시는 바로 돌려주고, max_age 가 지났으면 백그라운드에서 갱신한다.
+        캐시가 없거나 stale_ok 보다 오래됐으면 None.
+        """
+        entry = self._balances(account)
+        mapping = getattr(entry, f"{kind}_balance_mapping")
+        age = time.time() - getattr(entry, f"{kind}_last_refresh_time")
+        if mapping is None or age >= stale_ok:
+            return None
+        if age >= max_age:
+            self._revalidate(kind, account)
+        return mapping
+
+    def _revalidate(self, kind: str, account: Account):
+        """
+        백그라운드 갱신. 같은 잔고의 조회가 이미 진행 중이면 (어느 경로든) 새로 시작하지 않는다
+        """
+
+        async def fetch():
+            try:
+                return await self._fetch_balance(kind, account)
+            except Exception as e:
+                logger.info(
+                    f"background {kind} balance refresh failed "
+                    f"{self._flight_key(kind, account)}: {e!r}"
+                )
+                raise
+
+        single_flight.start(self._flight_key(kind, account), f"balance.{kind}", fetch)
 
     # ================================
     # getter 메소드
@@ -55,22 +150,22 @@ class AccountManager(BaseModel):
     ) -> SpotBalanceMapping:
         if not account:
             account: Account = await self.get_active_account()
-        await self.refresh_spot_balance(account)
+        spot_balance_mapping = await self.refresh_spot_balance(account)
 
-        if not self.spot_balance_mapping:
+        if not spot_balance_mapping:
             raise ValueError("No spot balance mapping")
-        return self.spot_balance_mapping
+        return spot_balance_mapping
 
     async def get_perp_balance_mapping(
         self, account: Account = None
     ) -> PerpBalanceMapping:
         if not account:
             account: Account = await self.get_active_account()
-        await self.refresh_perp_balance(account)
+        perp_balance_mapping = await self.refresh_perp_balance(account)
 
-        if not self.perp_balance_mapping:
+        if not perp_balance_mapping:
             raise ValueError("No perp balance mapping")
-        return self.perp_balance_mapping
+        return perp_balance_mapping
 
     async def get_active_account(self, force=False) -> Account:
         if force:
@@ -138,124 +233,119 @@ class AccountManager(BaseModel):
     # ================================
     # refresh 메소드
     # ================================
-    async def _refresh_perp_balance(self, account: Account):
-        dto_resposne: PerpBalanceMappingDTO = await hlAccountService.get_perp_balance(
-            self.telegram_id, account.nickname
-        )
-        perp_balance_mapping = PerpBalanceMapping.model_validate(
-            dto_resposne.model_dump()
+    def _flight_key(self, kind: str, account: Account) -> Tuple[str, str, str, str]:
+        # AccountManager 인스턴스가 달라도 같은 잔고는 같은 key
+        return ("balance", self.telegram_id, account.nickname, kind)
+
+    async def _fetch_balance(self, kind: str, account: Account):
+        """
+        upstream 에서 kind 잔고를 가져와 캐시에 넣는다. single_flight 를 통해서만 호출한다.
+        """
+        started_at = time.time()
+        # 응답 bytes 에서 SpotBalanceMapping / PerpBalanceMapping 으로 바로 검증 (DTO 를 거치지 않음)
+        if kind == "spot":
+            mapping = await hlAccountService.get_spot_balance(
+                self.telegram_id, account.nickname, model=SpotBalanceMapping
+            )
+        else:
+            mapping = await hlAccountService.get_perp_balance(
+                self.telegram_id, account.nickname, model=PerpBalanceMapping
+            )
+        entry = self._balances(account)
+        setattr(entry, f"{kind}_balance_mapping", mapping)
+        # 잔고별 freshness clock 은 하나. 요청을 시작한 시각 기준으로 기록한다
+        setattr(entry, f"{kind}_last_refresh_time", started_at)
+        entry.updated_at = time.time()
+        return mapping
+
+    async def _ensure_balance(
+        self, kind: str, account: Account, force: bool, max_age: float
+    ):
+        entry = self._balances(account)
+        requested_at = time.time()
+        mapping = getattr(entry, f"{kind}_balance_mapping")
+        if (
+            not force
+            and mapping
+            and requested_at - getattr(entry, f"{kind}_last_refresh_time") < max_age
+        ):
+            return mapping
+
+        # 같은 잔고에 대한 조회는 호출 경로와 AccountManager 인스턴스에 관계없이 하나로 합친다
+        return await single_flight.do(
+            self._flight_key(kind, account),
+            f"balance.{kind}",
+            lambda: self._fetch_balance(kind, account),
+            not_before=requested_at if force else None,
         )
-        self.perp_balance_mapping = perp_balance_mapping
 
     async def refresh_perp_balance(
         self,
         account: Optional[Account] = None,
         force: bool = False,
         max_age: float = 10.0,
+        stale_ok: Optional[float] = None,
     ) -> Optional[PerpBalanceMapping]:
         """
-        - force: 무조건 갱신할지 여부
+        - force: 무조건 갱신할지 여부 (호출 이후에 시작된 조회 결과만 사용)
         - max_age: 캐싱된 데이터의 최대 유효 시간 (초 단위)
+        - stale_ok: 지정하면 stale_ok 초보다 젊은 캐시는 기다리지 않고 바로 반환하고,
+          max_age 가 지났으면 백그라운드에서 갱신한다. (조회 화면용, 주문 화면은 지정하지 않음)
         """
-        async with self._perp_refresh_lock:
-            if not account:
-                account = await self.get_active_account()
-
-            current_time = time.time()
-
-            # 강제 갱신이 필요한 경우
-            if force:
-                await self._refresh_perp_balance(account)
-                return self.perp_balance_mapping
-
-            # 캐싱된 데이터가 유효한지 확인
-            if (
-                current_time - self.perp_last_refresh_time
-            ) < max_age and self.perp_balance_mapping:
-                return self.perp_balance_mapping
+        if not account:
+            account = await self.get_active_account()
 
-            # 캐시가 만료되었거나 데이터가 없는 경우 갱신
-            await self._refresh_perp_balance(account)
-            self.perp_last_refresh_time = current_time
-            return self.perp_balance_mapping
+        if stale_ok is not None and not force:
+            mapping = self._stale_mapping("perp", account, max_age, stale_ok)
+            if mapping is not None:
+                return mapping
 
-    async def _refresh_spot_balance(self, account: Account):
-
-        dto_resposne: SpotBalanceMappingDTO = await hlAccountService.get_spot_balance(
-            self.telegram_id, account.nickname
-        )
-        spot_balance_mapping = SpotBalanceMapping.model_validate(
-            dto_resposne.model_dump()
-        )
-        self.spot_balance_mapping = spot_balance_mapping
+        return await self._ensure_balance("perp", account, force, max_age)
 
     async def refresh_spot_balance(
         self,
         account: Optional[Account] = None,
         force: bool = False,
         max_age: float = 10.0,
+        stale_ok: Optional[float] = None,
     ) -> SpotBalanceMapping:
         """
         SpotBalanceMapping을 갱신한다.
-        - force: 무조건 갱신할지 여부
+        - force: 무조건 갱신할지 여부 (호출 이후에 시작된 조회 결과만 사용)
         - max_age: 캐싱된 데이터의 최대 유효 시간 (초 단위)
+        - stale_ok: 지정하면 stale_ok 초보다 젊은 캐시는 기다리지 않고 바로 반환하고,
+          max_age 가 지났으면 백그라운드에서 갱신한다. (조회 화면용, 주문 화면은 지정하지 않음)
         """
-        async with self._spot_refresh_lock:
-            if not account:
-                account = await self.get_active_account()
-
-            current_time = time.time()
-
-            # 강제 갱신이 필요한 경우
-            if force:
-                await self._refresh_spot_balance(account)
-                return self.spot_balance_mapping
+        if not account:
+            account = await self.get_active_account()
 
-            # 캐싱된 데이터가 유효한지 확인
-            if (
-                current_time - self.spot_last_refresh_time
-            ) < max_age and self.spot_balance_mapping:
-                return self.spot_balance_mapping
+        if stale_ok is not None and not force:
+            mapping = self._stale_mapping("spot", account, max_age, stale_ok)
+            if mapping is not None:
+                return mapping
 
-            # 캐시가 만료되었거나 데이터가 없는 경우 갱신
-            await self._refresh_spot_balance(account)
-            self.spot_last_refresh_time = current_time
-            return self.spot_balance_mapping
+        return await self._ensure_balance("spot", account, force, max_age)
 
     async def refresh_all(
         self,
         account: Account = None,
         force=False,
         max_age: float = 10.0,
+        stale_ok: Optional[float] = None,
     ):
-        async with self._refresh_all_lock:
-            if not account:
-                account = await self.get_active_account()
-                # 여기는 동기적으로 처리해도 되지만, 원한다면 여기에도 gather를 쓸 수 있습니다
-                await asyncio.gather(
-                    self._refresh_spot_balance(account),
-                    self._refresh_perp_balance(account),
-                )
-                return self.spot_balance_mapping, self.perp_balance_mapping
-
-            current_time = time.time()
-            should_refresh = not (
-                (current_time - self.refresh_all_last_refresh_time) < max_age
-                and self.spot_balance_mapping
-                and self.perp_balance_mapping
-            )
-
-            if force or should_refresh:
-                # spot, perp를 병렬로 한 번에 요청
-                await asyncio.gather(
-                    self._refresh_spot_balance(account),
-                    self._refresh_perp_balance(account),
-                )
-                self.refresh_all_last_refresh_time = current_time
-                return self.spot_balance_mapping, self.perp_balance_mapping
+        """
+        spot / perp 잔고를 함께 갱신한다. 인자는 refresh_spot_balance 와 같고,
+        spot / perp 각각의 freshness clock 과 진행 중인 조회를 그대로 공유한다.
+        """
+        if not account:
+            account = await self.get_active_account()
 
-            # 갱신 안 해도 될 때
-            return self.spot_balance_mapping, self.perp_balance_mapping
+        spot_balance_mapping, perp_balance_mapping = await asyncio.gather(
+            self.refresh_spot_balance(account, force, max_age, stale_ok),
+            self.refresh_perp_balance(account, force, max_age, stale_ok),
+        )
+        self._balances(account).refresh_all_last_refresh_time = time.time()
+        return spot_balance_mapping, perp_balance_mapping
 
     # ================================
     # wallet-setting에서 사용
@@ -318,6 +408,7 @@ class AccountManager(BaseModel):
     async def delete_wallet(self, nickname: str):
         async with self._account_lock:
             await accountService.delete_account(self.telegram_id, nickname)
+            balance_cache.invalidate(self.telegram_id, nickname)
 
             account: Account = await self.get_active_account(force=True)
             self.active_account = account
@@ -0,0 +1,104 @@
+from handler.models.spot_balance import SpotBalanceMapping
+from handler.models.perp_balance import PerpBalanceMapping
+from hypurrquant.logging_config import configure_logging
+
+from collections import OrderedDict
+from pydantic import BaseModel, Field
+from typing import Dict, Optional, Tuple
+import os
+import time
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+BALANCE_CACHE_MAXSIZE = int(os.getenv("BALANCE_CACHE_MAXSIZE") or 10000)
+BALANCE_CACHE_TTL = float(os.getenv("BALANCE_CACHE_TTL") or 600)  # 초
+# stale-while-revalidate 로 그대로 보여줄 수 있는 잔고의 최대 나이 (초)
+BALANCE_STALE_LIMIT = float(os.getenv("BALANCE_STALE_LIMIT") or 120)
+
+
+# ================================
+# (telegram_id, nickname) 별 잔고
+# ================================
+class BalanceEntry(BaseModel):
+    spot_balance_mapping: Optional[SpotBalanceMapping] = None
+    perp_balance_mapping: Optional[PerpBalanceMapping] = None
+    spot_last_refresh_time: float = Field(default=0.0)
+    perp_last_refresh_time: float = Field(default=0.0)
+    refresh_all_last_refresh_time: float = Field(default=0.0)
+    updated_at: float = Field(default_factory=time.time)
+
+
+# ================================
+# 프로세스 로컬 잔고 캐시
+# ================================
+class BalanceCache:
+    """
+    잔고(SpotBalanceMapping / PerpBalanceMapping)를 user_data 대신 보관하는 프로세스 로컬 캐시.
+
+    - key: (telegram_id, nickname)
+    - 마지막 갱신 후 ttl 초가 지난 항목은 조회 시 버린다
+    - maxsize 를 넘으면 가장 오래 조회되지 않은 항목부터 제거한다
+    - persistence 대상이 아니므로 재시작 후에는 비어 있고, 필요할 때 다시 조회한다
+    """
+
+    def __init__(
+        self, maxsize: int = BALANCE_CACHE_MAXSIZE, ttl: float = BALANCE_CACHE_TTL
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], BalanceEntry]" = OrderedDict()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _is_expired(self, entry: BalanceEntry) -> bool:
+        return time.time() - entry.updated_at > self.ttl
+
+    def peek(self, telegram_id: str, nickname: str) -> Optional[BalanceEntry]:
+        """
+        캐시된 항목. 없거나 만료되었으면 None.
+        """
+        key = (telegram_id, nickname)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            del self._entries[key]
+            self._stats["evictions"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, telegram_id: str, nickname: str) -> BalanceEntry:
+        """
+        캐시된 항목. 없거나 만료되었으면 빈 항목을 만들어 등록한다.
+        """
+        entry = self.peek(telegram_id, nickname)
+        if entry is not None:
+            self._stats["hits"] += 1
+            return entry
+
+        self._stats["misses"] += 1
+        entry = BalanceEntry()
+        self._entries[(telegram_id, nickname)] = entry
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+        return entry
+
+    def invalidate(self, telegram_id: str, nickname: Optional[str] = None):
+        """
+        nickname 이 없으면 telegram_id 의 모든 계정을 비운다.
+        """
+        if nickname is not None:
+            self._entries.pop((telegram_id, nickname), None)
+            return
+        for key in [key for key in self._entries if key[0] == telegram_id]:
+            del self._entries[key]
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        return {**self._stats, "size": len(self._entries)}
+
+
+balance_cache = BalanceCache()
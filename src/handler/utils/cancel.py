@@ -5,6 +5,7 @@ from telegram import Update, InlineKeyboardButton
 
 from hypurrquant.logging_config import configure_logging
 from handler.command import Command
+from .prefetch import balance_prefetcher
 from .settings import SettingMixin
 from .utils import _parse_callback_data
 
@@ -26,6 +27,8 @@ Handler = Callable[..., Awaitable]
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.info(f"triggered by user: {context._user_id}")
     await update.callback_query.answer()
+    # 메뉴를 떠나면 그 메뉴에서 시작한 prefetch 는 더 이상 필요 없다
+    balance_prefetcher.cancel(context._user_id)
 
     m = CANCEL_RE.match(update.callback_query.data or "")
     if m:
@@ -0,0 +1,194 @@
+from hypurrquant.logging_config import configure_logging
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+import asyncio
+import os
+import time
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+# 초, node 마다 따로 지정하지 않았을 때의 timeout
+SCREEN_FETCH_TIMEOUT = float(os.getenv("SCREEN_FETCH_TIMEOUT") or 8)
+
+# fallback 을 지정하지 않은 node (실패하면 화면 전체가 실패)
+REQUIRED = object()
+
+OnReady = Callable[[str, Any], None]
+
+
+class _Node:
+    __slots__ = ("name", "fetch", "after", "timeout", "fallback")
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[..., Awaitable[Any]],
+        after: Sequence[str],
+        timeout: Optional[float],
+        fallback: Any,
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.after = tuple(after)
+        self.timeout = timeout
+        self.fallback = fallback
+
+
+class FetchResult:
+    """
+    FetchPlan.run() 의 결과. result["name"] 으로 값을 꺼낸다.
+    실패해서 fallback 으로 대체된 node 는 degraded 에 (name -> 예외) 로 남는다.
+    """
+
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+        self.degraded: Dict[str, BaseException] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+    def ok(self, name: str) -> bool:
+        return name not in self.degraded
+
+
+class _SkippedDependency(Exception):
+    def __init__(self, dependency: str):
+        super().__init__(f"dependency {dependency!r} degraded")
+        self.dependency = dependency
+
+
+# ================================
+# 화면용 조회 계획
+# ================================
+class FetchPlan:
+    """
+    화면 하나를 그리는 데 필요한 조회들을 node 로 선언하고, 의존성이 없는 node 끼리는 동시에 실행한다.
+
+        plan = FetchPlan("lpvault")
+        plan.add("lp_list", lambda: lp_vault_service.lp_list(public_key))
+        plan.add("points", lambda: lp_vault_service.get_points(public_key, CHAIN), fallback={})
+        plan.add("positions", lambda lp_list: ..., after=("lp_list",))
+        result = await plan.run()
+
+    - after 에 적은 node 의 결과가 순서대로 fetch 의 인자로 들어온다. 의존 node 는 먼저 add 해야 한다
+    - node 마다 timeout(기본 SCREEN_FETCH_TIMEOUT) 이 있다
+    - fallback 이 있는 node 는 실패 / timeout 시 fallback 값으로 대체하고 화면은 일부만 그린다.
+      의존하던 node 가 대체되면 이 node 도 실행하지 않고 자기 fallback 을 쓴다
+    - fallback 이 없는 node 가 실패하면 나머지 node 를 취소하고 원래 예외를 그대로 올린다
+      (기존 exception_handler 의 처리 방식이 그대로 유지된다)
+    """
+
+    def __init__(self, name: str, timeout: float = SCREEN_FETCH_TIMEOUT):
+        self.name = name
+        self.timeout = timeout
+        self._nodes: Dict[str, _Node] = {}
+
+    def add(
+        self,
+        name: str,
+        fetch: Callable[..., Awaitable[Any]],
+        after: Sequence[str] = (),
+        timeout: Optional[float] = None,
+        fallback: Any = REQUIRED,
+    ) -> "FetchPlan":
+        if name in self._nodes:
+            raise ValueError(f"duplicate fetch node: {name}")
+        for dependency in after:
+            if dependency not in self._nodes:
+                raise ValueError(f"{name} depends on unknown node: {dependency}")
+        self._nodes[name] = _Node(
+            name, fetch, after, self.timeout if timeout is None else timeout, fallback
+        )
+        return self
+
+    async def run(self, on_ready: Optional[OnReady] = None) -> FetchResult:
+        """
+        Args:
+            on_ready (Optional[Callable]): node 하나가 끝날 때마다 (name, 값) 으로 호출된다.
+                fallback 으로 대체된 경우도 포함. 화면을 점진적으로 그릴 때 사용
+
+        Returns:
+            FetchResult: 모든 node 의 결과
+        """
+        result = FetchResult()
+        tasks: Dict[str, asyncio.Task] = {}
+        for node in self._nodes.values():
+            tasks[node.name] = asyncio.create_task(
+                self._run_node(node, tasks, result, on_ready)
+            )
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return result
+
+    async def _run_node(
+        self,
+        node: _Node,
+        tasks: Dict[str, asyncio.Task],
+        result: FetchResult,
+        on_ready: Optional[OnReady],
+    ):
+        started_at = time.monotonic()
+        try:
+            args: List[Any] = []
+            for dependency in node.after:
+                await tasks[dependency]
+                if dependency in result.degraded:
+                    if node.fallback is REQUIRED:
+                        raise result.degraded[dependency]
+                    raise _SkippedDependency(dependency)
+                args.append(result.values[dependency])
+            value = await asyncio.wait_for(node.fetch(*args), node.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            fetch_plan_stats.record(self.name, node.name, "failed", started_at)
+            if node.fallback is REQUIRED:
+                raise
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning(
+                    f"[{self.name}] {node.name} timed out after {node.timeout}s, using fallback"
+                )
+            elif not isinstance(e, _SkippedDependency):
+                logger.warning(
+                    f"[{self.name}] {node.name} failed, using fallback: {e!r}"
+                )
+            result.degraded[node.name] = e
+            value = node.fallback
+        else:
+            fetch_plan_stats.record(self.name, node.name, "ok", started_at)
+        result.values[node.name] = value
+        if on_ready is not None:
+            on_ready(node.name, value)
+
+
+# ================================
+# 통계
+# ================================
+class FetchPlanStats:
+    """
+    "plan.node" 별 성공 / 실패 횟수와 최대 소요 시간
+    """
+
+    def __init__(self):
+        self._nodes: Dict[str, Dict[str, float]] = {}
+
+    def record(self, plan: str, node: str, outcome: str, started_at: float):
+        stats = self._nodes.setdefault(
+            f"{plan}.{node}", {"ok": 0, "failed": 0, "max_seconds": 0.0}
+        )
+        stats[outcome] += 1
+        stats["max_seconds"] = max(stats["max_seconds"], time.monotonic() - started_at)
+
+    def stats_snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(stats) for name, stats in self._nodes.items()}
+
+
+fetch_plan_stats = FetchPlanStats()
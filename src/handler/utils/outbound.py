@@ -0,0 +1,333 @@
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+from hypurrquant.logging_config import configure_logging
+from handler.utils.render_cache import render_cache
+
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional, Tuple
+import asyncio
+import os
+import time
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+# https://core.telegram.org/bots/faq#my-bot-is-hitting-limits-how-do-i-avoid-this
+TELEGRAM_GLOBAL_RATE = float(os.getenv("TELEGRAM_GLOBAL_RATE") or 30)  # 초당
+TELEGRAM_GLOBAL_BURST = float(os.getenv("TELEGRAM_GLOBAL_BURST") or 30)
+TELEGRAM_CHAT_RATE = float(os.getenv("TELEGRAM_CHAT_RATE") or 1)  # 개인 채팅, 초당
+TELEGRAM_CHAT_BURST = float(os.getenv("TELEGRAM_CHAT_BURST") or 3)
+TELEGRAM_GROUP_RATE = float(os.getenv("TELEGRAM_GROUP_RATE") or 20 / 60)  # 그룹, 초당
+TELEGRAM_GROUP_BURST = float(os.getenv("TELEGRAM_GROUP_BURST") or 3)
+TELEGRAM_MAX_RETRIES = int(os.getenv("TELEGRAM_MAX_RETRIES") or 1)  # 429 재시도 수
+# 같은 메시지를 이 시간 안에 다시 edit 하면 잠시 모았다가 마지막 것만 보낸다 (초, 0 이면 끔)
+# 켜면 연속 edit 의 두 번째부터 최대 이 시간만큼 늦어지므로 기본은 끔
+TELEGRAM_EDIT_COALESCE_WINDOW = float(os.getenv("TELEGRAM_EDIT_COALESCE_WINDOW") or 0)
+BUCKET_SWEEP_INTERVAL = 60  # 초
+
+# 같은 메시지를 덮어쓰는 edit. 대기 중에 더 새로운 edit 이 오면 앞의 것은 보내지 않는다
+_EDIT_ENDPOINTS = {
+    "editMessageText",
+    "editMessageReplyMarkup",
+    "editMessageCaption",
+    "editMessageMedia",
+}
+
+Callback = Callable[..., Coroutine[Any, Any, Any]]
+
+
+class _Bucket:
+    """
+    예약형 token bucket.
+    reserve() 는 토큰을 하나 예약하고 그 토큰을 쓸 수 있을 때까지의 대기 시간을 돌려준다.
+    예약은 호출 순서대로 쌓이므로 같은 chat 의 요청 순서가 유지된다.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = max(now - self.updated_at, 0.0)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = max(now, self.updated_at)
+
+    def reserve(self, now: float) -> float:
+        self._refill(now)
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def pause(self, now: float, seconds: float):
+        """429 retry_after 가 지나야 다음 토큰을 쓸 수 있도록 비운다"""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0) - seconds * self.rate + 1
+
+    def is_idle(self, now: float) -> bool:
+        return self.tokens + (now - self.updated_at) * self.rate >= self.burst
+
+
+class _PendingEdit:
+    """
+    아직 보내지 않은 edit. 더 새로운 edit 이 오면 call 만 바꿔 끼우고, 모든 호출자는 같은 결과를 받는다
+    """
+
+    __slots__ = ("call", "future")
+
+    def __init__(self, call: Tuple[Callback, tuple, dict]):
+        self.call = call
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+# ================================
+# Bot API 발신 스케줄러
+# ================================
+class OutboundRateLimiter(BaseRateLimiter[None]):
+    """
+    Bot API 로 나가는 모든 요청(send_or_edit, edit_message_text, send_message ...)이 지나가는 rate limiter.
+    Application.builder().rate_limiter(...) 로 등록하면 handler 코드를 바꾸지 않고 적용된다.
+
+    - chat_id 가 있는 요청은 chat 별 token bucket(개인 TELEGRAM_CHAT_RATE, 그룹 TELEGRAM_GROUP_RATE)과
+      전역 token bucket(TELEGRAM_GLOBAL_RATE)을 차례로 통과한다. 토큰이 없으면 보내지 않고 기다린다 (deferred)
+    - 같은 메시지에 대한 edit 이 기다리는 동안 새 edit 이 오면 앞의 edit 은 보내지 않는다 (dropped).
+      "Loading 🔄" 직후 실제 내용으로 바뀌는 경우 등. 방금 edit 한 메시지를 다시 edit 하면
+      TELEGRAM_EDIT_COALESCE_WINDOW 동안 모아서 마지막 것만 보낸다
+    - 429(RetryAfter)를 받으면 해당 chat(chat 이 없으면 전역) bucket 을 retry_after 동안 멈추고
+      TELEGRAM_MAX_RETRIES 번까지 다시 보낸다
+    - answerCallbackQuery 처럼 chat_id 가 없는 요청은 제한하지 않는다
+    - 보낸 sendMessage / editMessageText 내용은 render_cache 에 남겨 send_or_edit 이 no-op edit 을 건너뛰게 한다
+    """
+
+    def __init__(
+        self,
+        global_rate: float = TELEGRAM_GLOBAL_RATE,
+        global_burst: float = TELEGRAM_GLOBAL_BURST,
+        chat_rate: float = TELEGRAM_CHAT_RATE,
+        chat_burst: float = TELEGRAM_CHAT_BURST,
+        group_rate: float = TELEGRAM_GROUP_RATE,
+        group_burst: float = TELEGRAM_GROUP_BURST,
+        max_retries: int = TELEGRAM_MAX_RETRIES,
+        edit_coalesce_window: float = TELEGRAM_EDIT_COALESCE_WINDOW,
+    ):
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.group_rate = group_rate
+        self.group_burst = group_burst
+        self.max_retries = max_retries
+        self.edit_coalesce_window = edit_coalesce_window
+        self._global = _Bucket(global_rate, global_burst)
+        self._chats: Dict[Hashable, _Bucket] = {}
+        self._pending_edits: Dict[Hashable, _PendingEdit] = {}
+        self._last_edit_at: Dict[Hashable, float] = {}
+        self._last_sweep = time.monotonic()
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "sent": 0,
+            "deferred": 0,  # 토큰을 기다린 요청
+            "deferred_seconds": 0.0,
+            "max_deferred_seconds": 0.0,
+            "dropped": 0,  # 더 새로운 edit 으로 대체되어 보내지 않은 edit
+            "retried": 0,  # 429 후 재시도
+            "rate_limited": 0,  # 받은 429 수
+        }
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        logger.info(f"telegram outbound stats: {self.stats_snapshot()}")
+
+    async def process_request(
+        self,
+        callback: Callback,
+        args: Any,
+        kwargs: Dict[str, Any],
+        endpoint: str,
+        data: Dict[str, Any],
+        rate_limit_args: Optional[None],
+    ):
+        chat_id = data.get("chat_id")
+        if chat_id is None and endpoint not in _EDIT_ENDPOINTS:
+            return await callback(*args, **kwargs)
+
+        self._stats["requests"] += 1
+        if endpoint in _EDIT_ENDPOINTS:
+            return await self._edit(chat_id, data, (callback, args, kwargs))
+        return await self._send(chat_id, (callback, args, kwargs))
+
+    # ================================
+    # 요청 처리
+    # ================================
+    async def _edit(self, chat_id, data: Dict[str, Any], call):
+        key = (chat_id, data.get("message_id"), data.get("inline_message_id"))
+        pending = self._pending_edits.get(key)
+        if pending is not None:
+            # 아직 보내지 않은 edit 이 있음 -> 내용만 바꾸고 그 결과를 같이 기다린다
+            pending.call = call
+            self._stats["dropped"] += 1
+            try:
+                return await asyncio.shield(pending.future)
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+                # 먼저 기다리던 호출이 취소됨 -> 이 edit 을 직접 보낸다
+                return await self._edit(chat_id, data, call)
+
+        pending = _PendingEdit(call)
+        self._pending_edits[key] = pending
+        try:
+            last_edit_at = self._last_edit_at.get(key)
+            if self.edit_coalesce_window and last_edit_at is not None:
+                await self._defer(
+                    last_edit_at + self.edit_coalesce_window - time.monotonic()
+                )
+            await self._acquire(chat_id)
+        except BaseException as e:
+            del self._pending_edits[key]
+            self._settle(pending, exception=e)
+            raise
+        # 여기서부터는 보내는 중이므로 새 edit 은 다음 차례를 기다린다
+        del self._pending_edits[key]
+        if self.edit_coalesce_window:
+            self._last_edit_at[key] = time.monotonic()
+        try:
+            result = await self._call(chat_id, pending.call)
+        except BaseException as e:
+            self._settle(pending, exception=e)
+            raise
+        self._settle(pending, result=result)
+        return result
+
+    async def _send(self, chat_id, call):
+        await self._acquire(chat_id)
+        return await self._call(chat_id, call)
+
+    async def _call(self, chat_id, call):
+        callback, args, kwargs = call
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await callback(*args, **kwargs)
+            except RetryAfter as e:
+                self._stats["rate_limited"] += 1
+                retry_after = e.retry_after
+                if not isinstance(retry_after, (int, float)):
+                    retry_after = retry_after.total_seconds()
+                bucket = self._global if chat_id is None else self._chat(chat_id)
+                bucket.pause(time.monotonic(), retry_after)
+                if attempt >= self.max_retries:
+                    raise
+                logger.info(
+                    f"telegram 429 for chat {chat_id}, retry after {retry_after}s"
+                )
+                self._stats["retried"] += 1
+                await self._acquire(chat_id)
+            else:
+                self._stats["sent"] += 1
+                _remember_render(chat_id, *args, result)
+                return result
+
+    async def _acquire(self, chat_id):
+        """chat bucket -> 전역 bucket 순서로 토큰을 얻는다"""
+        now = time.monotonic()
+        self._sweep(now)
+        if chat_id is not None:
+            await self._defer(self._chat(chat_id).reserve(now))
+            now = time.monotonic()
+        await self._defer(self._global.reserve(now))
+
+    async def _defer(self, delay: float):
+        if delay <= 0:
+            return
+        self._stats["deferred"] += 1
+        self._stats["deferred_seconds"] += delay
+        self._stats["max_deferred_seconds"] = max(
+            self._stats["max_deferred_seconds"], delay
+        )
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _settle(pending: _PendingEdit, result=None, exception=None):
+        if pending.future.done():
+            return
+        if exception is None:
+            pending.future.set_result(result)
+        elif isinstance(exception, asyncio.CancelledError):
+            pending.future.cancel()
+        else:
+            pending.future.set_exception(exception)
+            pending.future.exception()  # 기다리는 호출이 없어도 경고가 나지 않도록
+
+    def _chat(self, chat_id) -> _Bucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if _is_group(chat_id):
+                bucket = _Bucket(self.group_rate, self.group_burst)
+            else:
+                bucket = _Bucket(self.chat_rate, self.chat_burst)
+            self._chats[chat_id] = bucket
+        return bucket
+
+    def _sweep(self, now: float):
+        if now - self._last_sweep < BUCKET_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        for chat_id, bucket in list(self._chats.items()):
+            if bucket.is_idle(now):
+                del self._chats[chat_id]
+        for key, edited_at in list(self._last_edit_at.items()):
+            if now - edited_at > self.edit_coalesce_window:
+                del self._last_edit_at[key]
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        requests = self._stats["requests"]
+        return {
+            **self._stats,
+            "pending_edits": len(self._pending_edits),
+            "chats": len(self._chats),
+            "drop_ratio": self._stats["dropped"] / requests if requests else 0.0,
+        }
+
+
+def _remember_render(chat_id, endpoint: str, data: Dict[str, Any], result: Any):
+    """
+    send_or_edit 이 같은 내용의 edit 을 건너뛸 수 있도록, 실제로 보낸 내용을 render_cache 에 남긴다
+    """
+    message_id = data.get("message_id")
+    if endpoint == "editMessageText" and message_id is not None:
+        render_cache.record(
+            _chat_key(chat_id),
+            message_id,
+            data.get("text"),
+            data.get("parse_mode"),
+            data.get("reply_markup"),
+        )
+    elif endpoint == "sendMessage" and isinstance(result, dict):
+        render_cache.record(
+            result["chat"]["id"],
+            result["message_id"],
+            data.get("text"),
+            data.get("parse_mode"),
+            data.get("reply_markup"),
+        )
+    elif message_id is not None and chat_id is not None:
+        # reply markup / caption 만 바뀌었거나 삭제된 메시지
+        render_cache.forget(_chat_key(chat_id), message_id)
+
+
+def _chat_key(chat_id):
+    try:
+        return int(chat_id)
+    except (TypeError, ValueError):
+        return chat_id
+
+
+def _is_group(chat_id) -> bool:
+    # 그룹 / 채널 chat_id 는 음수, "@channel" 형태도 허용된다
+    try:
+        return int(chat_id) < 0
+    except (TypeError, ValueError):
+        return True
@@ -1,5 +1,9 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-from typing import List, Any
+from api.hyperliquid import SnapshotView, market_snapshot_store
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set
+from abc import ABC, abstractmethod
+import time
+import weakref
 
 
 class Pagenation:
@@ -67,3 +71,167 @@ class Pagenation:
 
     def generate_buttons(self, callback_prefix="PAGE") -> InlineKeyboardMarkup:
         pass
+
+
+# ================================
+# Cursor 기반 Pagenation
+# ================================
+CURSOR_IDLE_TTL = 600  # 초. 이 시간 동안 접근이 없으면 메모리의 페이지 데이터를 놓는다
+CURSOR_SWEEP_INTERVAL = 60  # 초
+
+
+class _CursorRegistry:
+    """
+    페이지 데이터를 들고 있는 cursor 들을 weakref 로 추적하고,
+    오래 접근되지 않은(버려진 세션의) cursor 의 데이터를 주기적으로 놓는다.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float = CURSOR_IDLE_TTL,
+        sweep_interval: float = CURSOR_SWEEP_INTERVAL,
+    ):
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+        self._cursors: "weakref.WeakSet[CursorPagenation]" = weakref.WeakSet()
+        self._last_sweep = time.time()
+        self._stats: Dict[str, int] = {"loads": 0, "released": 0}
+
+    def track(self, cursor: "CursorPagenation"):
+        self._stats["loads"] += 1
+        self._cursors.add(cursor)
+        self.sweep()
+
+    def sweep(self, force: bool = False):
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        for cursor in list(self._cursors):
+            if now - cursor.last_access > self.idle_ttl:
+                cursor.release()
+                self._cursors.discard(cursor)
+                self._stats["released"] += 1
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        return {**self._stats, "loaded": len(self._cursors)}
+
+
+cursor_registry = _CursorRegistry()
+
+
+class CursorPagenation(Pagenation, ABC):
+    """
+    데이터 리스트 대신 cursor 만 user_data 에 저장하는 Pagenation.
+
+    - persistence 대상: source_id, version, current_page, page_size, selected
+    - 페이지 데이터는 load() 에서 공유 캐시(스냅샷, 잔고 캐시 등)로부터 다시 채운다
+    - 한동안 접근이 없는 cursor 는 cursor_registry 가 메모리의 데이터를 놓고,
+      다음 load() 에서 다시 채운다
+
+    하위 클래스는 _fetch() 만 구현하면 된다.
+    """
+
+    def __init__(
+        self, source_id: Hashable, version: Optional[int] = None, page_size=15
+    ):
+        """
+        Args:
+            source_id (Hashable): 데이터 출처를 식별하는 값.
+            version (Optional[int]): 데이터 버전. None 이면 항상 최신 데이터를 사용.
+            page_size (int): 한 페이지에 표시할 데이터 개수.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be greater than 0.")
+
+        self.source_id = source_id
+        self.version = version
+        self.page_size: int = page_size
+        self.current_page: int = 0
+        self.selected: Set[str] = set()
+        self.last_access: float = time.time()
+        self._rows: Optional[Sequence[Any]] = None
+
+    @abstractmethod
+    async def _fetch(self) -> Sequence[Any]:
+        """
+        source_id / version 에 해당하는 전체 데이터를 가져온다.
+        """
+
+    def _set_rows(self, rows: Sequence[Any]):
+        self._rows = rows
+        self.last_access = time.time()
+        cursor_registry.track(self)
+
+    async def load(self) -> "CursorPagenation":
+        """
+        페이지 데이터를 채운다. 이미 채워져 있으면 아무것도 하지 않는다.
+        핸들러는 페이지 데이터에 접근하기 전에 반드시 호출해야 한다.
+        """
+        if self._rows is None:
+            self._set_rows(await self._fetch())
+            self._clamp_page()
+        self.last_access = time.time()
+        return self
+
+    def _clamp_page(self):
+        # 데이터가 줄어들었다면 현재 페이지를 범위 안으로 맞춘다
+        self.current_page = max(0, min(self.current_page, self.total_pages - 1))
+
+    def release(self):
+        self._rows = None
+
+    @property
+    def data(self) -> Sequence[Any]:
+        if self._rows is None:
+            raise RuntimeError(
+                f"{type(self).__name__} is not loaded. Call load() first."
+            )
+        return self._rows
+
+    @property
+    def total_pages(self) -> int:
+        return (len(self.data) - 1) // self.page_size + 1
+
+    def toggle(self, key: str) -> bool:
+        """
+        key 의 선택 여부를 뒤집는다.
+
+        Returns:
+            bool: 토글 후 선택 여부
+        """
+        if key in self.selected:
+            self.selected.discard(key)
+            return False
+        self.selected.add(key)
+        return True
+
+    def is_selected(self, key: str) -> bool:
+        return key in self.selected
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_rows"] = None
+        return state
+
+
+class SnapshotPagenation(CursorPagenation):
+    """
+    MarketSnapshotStore 의 스냅샷 뷰를 페이지로 보여주는 cursor.
+    source_id 는 (kind, sort_by, reverse), version 은 스냅샷 버전이다.
+    버전이 이미 밀려났다면 최신 스냅샷으로 다시 채운다.
+    """
+
+    def __init__(self, view: SnapshotView, page_size=15):
+        super().__init__(
+            source_id=(view.snapshot.kind, view.sort_by, view.reverse),
+            version=view.version,
+            page_size=page_size,
+        )
+        self._set_rows(view)
+
+    async def _fetch(self) -> SnapshotView:
+        kind, sort_by, reverse = self.source_id
+        view = market_snapshot_store.view(kind, sort_by, reverse, version=self.version)
+        self.version = view.version
+        return view
@@ -0,0 +1,474 @@
+from mongopersistence import MongoPersistence
+from mongopersistence.persistence import BOT_DATA_KEY, TypeData
+from pymongo import DeleteOne, UpdateOne
+from hypurrquant.logging_config import configure_logging
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import asyncio
+import hashlib
+import pickle
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+DEFAULT_WRITE_INTERVAL = 10.0  # 초
+DEFAULT_MAX_BATCH = 500  # bulk_write 한 번에 보낼 최대 operation 수
+
+
+def _fingerprint(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _is_field_name(key: Any) -> bool:
+    # MongoDB field path 로 쓸 수 있는 key 인지
+    return (
+        isinstance(key, str)
+        and key != ""
+        and "." not in key
+        and not key.startswith("$")
+    )
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return pickle.loads(value)
+    return value  # 이전 버전(MongoPersistence)이 저장한 raw 값
+
+
+# ================================
+# 문서 단위 dirty tracking
+# ================================
+class DirtyTracker:
+    """
+    문서(user / chat / bot) 별로 마지막으로 저장한 필드의 fingerprint 를 기억하고,
+    새 데이터와 비교해 바뀐 필드만 $set / $unset 으로 만든다.
+
+    - 최상위 값이 dict 이면 그 아래 key 단위(`root.key`)로 추적한다
+      (user_data["buy"]["strategy"] 처럼 setting 이 2단계로 저장되기 때문)
+    - 그 외 값은 최상위 key 단위로 추적한다
+    - 값은 pickle 로 직렬화해 저장한다
+
+    PTB 는 update_*_data 에 문서 전체(같은 dict 참조)를 넘기므로 어떤 key 가 바뀌었는지 알 수 없다.
+    그래서 flush 때 dirty 문서의 모든 값을 pickle 해서 fingerprint 를 비교한다.
+    Mongo 로 보내는 양은 바뀐 필드로 줄지만, 직렬화 CPU 비용은 dirty 문서 크기에 비례한다.
+
+    Mongo 에 의존하지 않으므로 단독으로 테스트할 수 있다.
+    """
+
+    def __init__(self, ignore: Optional[List[str]] = None):
+        self.ignore = set(ignore or [])
+        # doc_id -> {path: fingerprint}
+        self._written: Dict[Hashable, Dict[str, bytes]] = {}
+        # doc_id -> {root: dict 로 저장했는지 여부}
+        self._shapes: Dict[Hashable, Dict[str, bool]] = {}
+
+    def seed(self, doc_id: Hashable, document: dict):
+        """
+        DB 에서 읽은 문서(디코딩 전)로 저장 상태를 초기화한다.
+        """
+        written, shapes = {}, {}
+        for root, value in document.items():
+            if root == "_id":
+                continue
+            if isinstance(value, dict):
+                shapes[root] = True
+                for key, item in value.items():
+                    if isinstance(item, bytes):
+                        written[f"{root}.{key}"] = _fingerprint(item)
+            else:
+                shapes[root] = False
+                if isinstance(value, bytes):
+                    written[root] = _fingerprint(value)
+        self._written[doc_id] = written
+        self._shapes[doc_id] = shapes
+
+    def forget(self, doc_id: Hashable):
+        self._written.pop(doc_id, None)
+        self._shapes.pop(doc_id, None)
+
+    def _encode(self, data: dict) -> Tuple[Dict[str, bool], Dict[str, bytes]]:
+        shapes: Dict[str, bool] = {}
+        payloads: Dict[str, bytes] = {}
+        for root, value in data.items():
+            if root in self.ignore:
+                continue
+            if not _is_field_name(root):
+                logger.warning(f"Skip persisting non field-name key: {root!r}")
+                continue
+            if isinstance(value, dict) and value and all(map(_is_field_name, value)):
+                shapes[root] = True
+                for key, item in value.items():
+                    payloads[f"{root}.{key}"] = _dumps(item)
+            else:
+                shapes[root] = False
+                payloads[root] = _dumps(value)
+        return shapes, payloads
+
+    def diff(
+        self, doc_id: Hashable, data: dict
+    ) -> Tuple[Dict[str, Any], List[str], Dict[str, int]]:
+        """
+        Returns:
+            ($set 할 필드, $unset 할 필드, 통계). 통계에는 unchanged / total_bytes / written_bytes
+        """
+        shapes, payloads = self._encode(data)
+        old_shapes = self._shapes.get(doc_id, {})
+        old_written = self._written.get(doc_id, {})
+
+        to_set: Dict[str, Any] = {}
+        to_unset: List[str] = []
+        written: Dict[str, bytes] = {}
+        unchanged = 0
+        written_bytes = 0
+
+        for root, is_dict in shapes.items():
+            paths = {
+                path: payload
+                for path, payload in payloads.items()
+                if path == root or path.startswith(f"{root}.")
+            }
+            fingerprints = {path: _fingerprint(p) for path, p in paths.items()}
+            written.update(fingerprints)
+
+            if old_shapes.get(root) is not is_dict:
+                # 새 key 이거나 dict <-> 값 으로 형태가 바뀐 경우 root 전체를 다시 쓴다
+                if is_dict:
+                    prefix = len(root) + 1
+                    to_set[root] = {path[prefix:]: p for path, p in paths.items()}
+                else:
+                    to_set[root] = paths[root]
+                written_bytes += sum(map(len, paths.values()))
+                continue
+
+            for path, payload in paths.items():
+                if old_written.get(path) == fingerprints[path]:
+                    unchanged += 1
+                    continue
+                to_set[path] = payload
+                written_bytes += len(payload)
+            if is_dict:
+                for path in old_written:
+                    if path.startswith(f"{root}.") and path not in paths:
+                        to_unset.append(path)
+
+        for root in old_shapes:
+            if root not in shapes:
+                to_unset.append(root)
+
+        self._written[doc_id] = written
+        self._shapes[doc_id] = shapes
+        stats = {
+            "unchanged": unchanged,
+            "total_bytes": sum(map(len, payloads.values())),
+            "written_bytes": written_bytes,
+        }
+        return to_set, to_unset, stats
+
+
+# ================================
+# Write-behind persistence
+# ================================
+class WriteBehindMongoPersistence(MongoPersistence):
+    """
+    MongoPersistence 앞에 두는 write-behind persistence.
+
+    - update_*_data 는 해당 문서를 dirty 로 표시만 하고 바로 반환한다
+    - write_interval 마다 dirty 문서를 DirtyTracker 로 비교해
+      바뀐 필드만 $set / $unset 하는 UpdateOne 을 bulk_write 로 모아 보낸다
+    - conversation 상태도 key 단위 $set / $unset 으로 저장한다
+    - flush() (Application 종료 시) 에 남은 변경을 모두 쓴다
+
+    mongo_url 에 AsyncIOMotorClient 호환 객체를 넘기면 로컬 stand-in 으로 테스트할 수 있다.
+    """
+
+    def __init__(
+        self,
+        *args,
+        write_interval: float = DEFAULT_WRITE_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        **kwargs,
+    ):
+        kwargs.setdefault("load_on_flush", False)
+        super().__init__(*args, **kwargs)
+        self.write_interval = write_interval
+        self.max_batch = max_batch
+
+        self._trackers: Dict[str, DirtyTracker] = {
+            "user": DirtyTracker(self.user_data.to_ignore),
+            "chat": DirtyTracker(self.chat_data.to_ignore),
+            "bot": DirtyTracker(self.bot_data.to_ignore),
+        }
+        # kind -> {doc_id: 최신 데이터(참조)}. None 이면 삭제
+        self._dirty: Dict[str, Dict[Hashable, Optional[dict]]] = {
+            "user": {},
+            "chat": {},
+            "bot": {},
+        }
+        # conversation name -> {str(key): state}. None 이면 삭제
+        self._dirty_conversations: Dict[str, Dict[str, Any]] = {}
+        self._conversations: Dict[str, Dict[Any, Any]] = {}
+
+        self._writer: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self.metrics: Dict[str, int] = {
+            "updates": 0,  # update_* 호출 수
+            "flushes": 0,  # bulk_write 호출 수
+            "operations": 0,  # bulk_write 로 보낸 operation 수
+            "set_fields": 0,
+            "unset_fields": 0,
+            "unchanged_fields": 0,
+            "written_bytes": 0,  # 실제로 보낸 값의 크기
+            "document_bytes": 0,  # 문서 전체를 다시 썼다면 보냈을 크기
+            "errors": 0,
+        }
+
+    def _type_data(self, kind: str) -> TypeData:
+        return {"user": self.user_data, "chat": self.chat_data, "bot": self.bot_data}[
+            kind
+        ]
+
+    # ================================
+    # 로딩
+    # ================================
+    async def _load(self, kind: str) -> Dict[Hashable, dict]:
+        await self.post_init()
+        type_data = self._type_data(kind)
+        if not type_data.exists():
+            return {}
+        result = {}
+        tracker = self._trackers[kind]
+        for post in await type_data.col.find().to_list(length=None):
+            doc_id = post.pop("_id")
+            tracker.seed(doc_id, post)
+            result[doc_id] = {
+                root: (
+                    {key: _decode(item) for key, item in value.items()}
+                    if isinstance(value, dict)
+                    else _decode(value)
+                )
+                for root, value in post.items()
+            }
+        return result
+
+    async def get_user_data(self) -> dict:
+        return await self._load("user")
+
+    async def get_chat_data(self) -> dict:
+        return await self._load("chat")
+
+    async def get_bot_data(self) -> dict:
+        await self.post_init()
+        if not self.bot_data.exists():
+            return {}
+        post = await self.bot_data.col.find_one({"_id": BOT_DATA_KEY})
+        if not post:
+            return {}
+        content = post.get("content") or {}
+        self._trackers["bot"].seed(BOT_DATA_KEY, content)
+        return {
+            root: (
+                {key: _decode(item) for key, item in value.items()}
+                if isinstance(value, dict)
+                else _decode(value)
+            )
+            for root, value in content.items()
+        }
+
+    async def get_conversations(self, name: str) -> dict:
+        await self.post_init()
+        if not self.conversations_data.exists():
+            return {}
+        post = await self.conversations_data.col.find_one({"_id": name}) or {}
+        post.pop("_id", None)
+        conversations = {}
+        for key_string, state in post.items():
+            first, second = map(
+                int, key_string.replace("(", "").replace(")", "").split(",")
+            )
+            conversations[(first, second)] = _decode(state)
+        self._conversations[name] = dict(conversations)
+        return conversations
+
+    # ================================
+    # dirty 표시 (PTB 가 호출)
+    # ================================
+    def _mark(self, kind: str, doc_id: Hashable, data: Optional[dict]):
+        self.metrics["updates"] += 1
+        self._dirty[kind][doc_id] = data
+        self._ensure_writer()
+
+    async def update_user_data(self, user_id: int, data: dict) -> None:
+        self._mark("user", user_id, data)
+
+    async def update_chat_data(self, chat_id: int, data: dict) -> None:
+        self._mark("chat", chat_id, data)
+
+    async def update_bot_data(self, data: dict) -> None:
+        self._mark("bot", BOT_DATA_KEY, data)
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self._mark("user", user_id, None)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        self._mark("chat", chat_id, None)
+
+    async def refresh_user_data(self, user_id: int, user_data: dict) -> None:
+        pass  # 이 프로세스가 원본이므로 DB 에서 다시 읽지 않는다
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: dict) -> None:
+        pass
+
+    async def update_conversation(self, name: str, key, new_state) -> None:
+        states = self._conversations.setdefault(name, {})
+        if key in states and states[key] == new_state:
+            return
+        states[key] = new_state
+        self.metrics["updates"] += 1
+        self._dirty_conversations.setdefault(name, {})[str(key)] = new_state
+        self._ensure_writer()
+
+    # ================================
+    # write-behind
+    # ================================
+    def _ensure_writer(self):
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.write_interval)
+            try:
+                await self.write_dirty()
+            except Exception:
+                logger.exception(
+                    "write-behind persistence 저장 중 예외가 발생했습니다."
+                )
+
+    def _build_operations(self, kind: str) -> List[Any]:
+        tracker = self._trackers[kind]
+        dirty, self._dirty[kind] = self._dirty[kind], {}
+        operations = []
+        for doc_id, data in dirty.items():
+            if data is None:
+                tracker.forget(doc_id)
+                operations.append(DeleteOne({"_id": doc_id}))
+                continue
+
+            to_set, to_unset, stats = tracker.diff(doc_id, data)
+            self.metrics["unchanged_fields"] += stats["unchanged"]
+            self.metrics["document_bytes"] += stats["total_bytes"]
+            self.metrics["written_bytes"] += stats["written_bytes"]
+            if not to_set and not to_unset:
+                continue
+
+            if kind == "bot":
+                to_set = {f"content.{path}": value for path, value in to_set.items()}
+                to_unset = [f"content.{path}" for path in to_unset]
+            update = {}
+            if to_set:
+                update["$set"] = to_set
+            if to_unset:
+                update["$unset"] = {path: "" for path in to_unset}
+            self.metrics["set_fields"] += len(to_set)
+            self.metrics["unset_fields"] += len(to_unset)
+            operations.append(UpdateOne({"_id": doc_id}, update, upsert=True))
+        return operations
+
+    def _build_conversation_operations(self) -> List[Any]:
+        dirty, self._dirty_conversations = self._dirty_conversations, {}
+        operations = []
+        for name, states in dirty.items():
+            to_set = {k: _dumps(v) for k, v in states.items() if v is not None}
+            to_unset = {k: "" for k, v in states.items() if v is None}
+            update = {}
+            if to_set:
+                update["$set"] = to_set
+            if to_unset:
+                update["$unset"] = to_unset
+            self.metrics["set_fields"] += len(to_set)
+            self.metrics["unset_fields"] += len(to_unset)
+            self.metrics["written_bytes"] += sum(map(len, to_set.values()))
+            operations.append(UpdateOne({"_id": name}, update, upsert=True))
+        return operations
+
+    async def _bulk_write(self, type_data: TypeData, operations: List[Any]):
+        if not operations or not type_data.exists():
+            return
+        for start in range(0, len(operations), self.max_batch):
+            batch = operations[start : start + self.max_batch]
+            try:
+                await type_data.col.bulk_write(batch, ordered=False)
+            except Exception:
+                self.metrics["errors"] += 1
+                raise
+            self.metrics["flushes"] += 1
+            self.metrics["operations"] += len(batch)
+
+    async def write_dirty(self):
+        """
+        쌓인 변경을 bulk_write 로 저장한다.
+        """
+        await self.post_init()
+        async with self._write_lock:
+            for kind in ("user", "chat", "bot"):
+                pending = dict(self._dirty[kind])
+                try:
+                    await self._bulk_write(
+                        self._type_data(kind), self._build_operations(kind)
+                    )
+                except Exception:
+                    # 실패한 문서는 다음 주기에 다시 쓰도록 전체를 다시 dirty 로 표시
+                    for doc_id in pending:
+                        self._trackers[kind].forget(doc_id)
+                    self._dirty[kind] = {**pending, **self._dirty[kind]}
+                    raise
+            pending_conversations = self._dirty_conversations
+            try:
+                await self._bulk_write(
+                    self.conversations_data, self._build_conversation_operations()
+                )
+            except Exception:
+                for name, states in pending_conversations.items():
+                    states.update(self._dirty_conversations.get(name, {}))
+                    self._dirty_conversations[name] = states
+                raise
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        """
+        write amplification 지표.
+        write_ratio 는 문서 전체를 다시 썼을 때 대비 실제로 보낸 바이트 비율이다.
+        """
+        metrics = self.metrics
+        return {
+            **metrics,
+            "pending": sum(map(len, self._dirty.values()))
+            + sum(map(len, self._dirty_conversations.values())),
+            "write_ratio": (
+                metrics["written_bytes"] / metrics["document_bytes"]
+                if metrics["document_bytes"]
+                else 0.0
+            ),
+        }
+
+    async def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        try:
+            await self.write_dirty()
+        finally:
+            logger.info(f"write-behind persistence: {self.stats_snapshot()}")
+            self.client.close()
@@ -0,0 +1,165 @@
+from hypurrquant.logging_config import configure_logging
+from hypurrquant.models.account import Account
+from handler.utils.account_manager import AccountManager
+
+from typing import Dict, Optional
+import asyncio
+import os
+import time
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+# 전역 동시 prefetch 수
+PREFETCH_CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY") or 16)
+# 초, AccountManager.refresh_* 의 기본 max_age 와 같게 유지
+PREFETCH_TTL = float(os.getenv("PREFETCH_TTL") or 10)
+PREFETCH_CLAIM_WAIT = float(os.getenv("PREFETCH_CLAIM_WAIT") or 10)  # 초
+PREFETCH_SWEEP_INTERVAL = 60  # 초
+
+
+class _UserPrefetch:
+    __slots__ = ("task", "nickname", "completed_at")
+
+    def __init__(self, nickname: str):
+        self.task: Optional[asyncio.Task] = None
+        self.nickname = nickname
+        self.completed_at: Optional[float] = None
+
+    def is_fresh(self, now: float) -> bool:
+        return self.completed_at is not None and now - self.completed_at < PREFETCH_TTL
+
+
+# ================================
+# 다음 화면용 잔고 추측 prefetch
+# ================================
+class BalancePrefetcher:
+    """
+    메뉴를 그린 직후, 다음 화면(Balance / Spot Sell / Perp Close / Delta)이 쓸 잔고를
+    백그라운드에서 미리 balance_cache 에 채운다.
+
+    - 사용자당 prefetch 는 하나. 새로 schedule 하면 이전 것은 취소된다
+    - 전역 동시 실행 수(PREFETCH_CONCURRENCY)를 넘으면 대기하지 않고 건너뛴다 (낮은 우선순위)
+    - 다음 화면은 claim() 으로 prefetch 결과를 한 번만 소비한다.
+      claim 이 True 면 force 없이 refresh 해도 PREFETCH_TTL 이내의 잔고가 보장된다
+    - cancel() 은 대화가 끝나거나 다른 메뉴로 이동할 때 진행 중인 prefetch 를 취소한다
+    """
+
+    def __init__(self, concurrency: int = PREFETCH_CONCURRENCY):
+        self.concurrency = concurrency
+        self._budget = asyncio.Semaphore(concurrency)
+        self._users: Dict[str, _UserPrefetch] = {}
+        self._last_sweep = time.monotonic()
+        self._stats: Dict[str, int] = {
+            "scheduled": 0,
+            "dropped": 0,  # 전역 예산 초과로 건너뜀
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "hits": 0,
+            "misses": 0,
+            "wasted": 0,  # 완료됐지만 소비되지 않고 만료 / 교체됨
+        }
+
+    def schedule(self, account_manager: AccountManager, account: Account):
+        """
+        account 의 spot / perp 잔고를 백그라운드에서 갱신한다.
+        """
+        telegram_id = account_manager.telegram_id
+        self._sweep()
+        if self._budget.locked():
+            self._stats["dropped"] += 1
+            return
+        self._discard(self._users.pop(telegram_id, None))
+
+        state = _UserPrefetch(account.nickname)
+        state.task = asyncio.create_task(self._run(state, account_manager, account))
+        self._users[telegram_id] = state
+        self._stats["scheduled"] += 1
+
+    async def _run(
+        self, state: _UserPrefetch, account_manager: AccountManager, account: Account
+    ):
+        async with self._budget:
+            try:
+                await account_manager.refresh_all(account, max_age=PREFETCH_TTL)
+            except Exception as e:
+                # prefetch 실패는 사용자에게 보이지 않는다. 다음 화면이 직접 조회한다
+                self._stats["failed"] += 1
+                logger.info(
+                    f"balance prefetch failed for {account_manager.telegram_id}: {e!r}"
+                )
+                return
+        self._stats["completed"] += 1
+        state.completed_at = time.time()
+
+    async def claim(self, account_manager: AccountManager) -> bool:
+        """
+        활성 계정에 대한 prefetch 결과를 소비한다.
+        진행 중이면 끝날 때까지 (최대 PREFETCH_CLAIM_WAIT 초) 기다린다.
+
+        Returns:
+            bool: PREFETCH_TTL 이내에 prefetch 가 끝났으면 True (force 없이 refresh 해도 됨)
+        """
+        state = self._users.pop(account_manager.telegram_id, None)
+        account = account_manager.active_account
+        if state is None or account is None or state.nickname != account.nickname:
+            self._discard(state)
+            self._stats["misses"] += 1
+            return False
+
+        if not state.task.done():
+            await asyncio.wait({state.task}, timeout=PREFETCH_CLAIM_WAIT)
+        if state.is_fresh(time.time()):
+            self._stats["hits"] += 1
+            return True
+
+        self._discard(state)
+        self._stats["misses"] += 1
+        return False
+
+    def cancel(self, telegram_id: str):
+        """
+        telegram_id 의 진행 중인 prefetch 를 취소한다.
+        """
+        self._discard(self._users.pop(str(telegram_id), None))
+
+    def shutdown(self):
+        for telegram_id in list(self._users):
+            self.cancel(telegram_id)
+        logger.info(f"balance prefetch stats: {self.stats_snapshot()}")
+
+    def _discard(self, state: Optional[_UserPrefetch]):
+        if state is None:
+            return
+        if not state.task.done():
+            state.task.cancel()
+            self._stats["cancelled"] += 1
+        elif state.completed_at is not None:
+            self._stats["wasted"] += 1
+
+    def _sweep(self):
+        now = time.monotonic()
+        if now - self._last_sweep < PREFETCH_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        wall = time.time()
+        for telegram_id, state in list(self._users.items()):
+            if state.task.done() and not state.is_fresh(wall):
+                del self._users[telegram_id]
+                self._discard(state)
+
+    def stats_snapshot(self) -> dict:
+        claims = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / claims if claims else 0.0,
+            "pending": sum(
+                1 for state in self._users.values() if not state.task.done()
+            ),
+        }
+
+
+balance_prefetcher = BalancePrefetcher()
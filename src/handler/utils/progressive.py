@@ -0,0 +1,126 @@
+from telegram import Message, Update
+from telegram.error import BadRequest
+from telegram.ext import ContextTypes
+from hypurrquant.logging_config import configure_logging
+
+from handler.utils.render_cache import render_cache
+from handler.utils.utils import send_or_edit
+
+from typing import Any, Callable, Dict, Optional, Tuple
+import asyncio
+import os
+import time
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+# 초, 중간 edit 사이의 최소 간격 (Bot API 의 채팅별 1/s 제한에 맞춤)
+PROGRESSIVE_EDIT_INTERVAL = float(os.getenv("PROGRESSIVE_EDIT_INTERVAL") or 1.0)
+
+Render = Callable[[], Tuple[str, Dict[str, Any]]]
+
+
+# ================================
+# 데이터가 도착하는 대로 다시 그리는 메시지
+# ================================
+class ProgressiveMessage:
+    """
+    화면의 데이터가 도착하는 대로 메시지를 여러 번 나눠 그린다.
+
+    - render() 는 현재까지 도착한 데이터로 (text, send_or_edit kwargs) 를 만든다
+    - changed() 는 다시 그릴 필요가 있다고 표시만 한다. 중간 edit 은 PROGRESSIVE_EDIT_INTERVAL 에
+      한 번만 보내고, 그 사이의 변경은 다음 edit 에 합쳐진다. (OutboundRateLimiter 에 지난 상태의
+      edit 이 쌓이지 않도록)
+    - finish() 는 마지막 상태를 반드시 보낸다. 내용이 같으면 render_cache 가 건너뛴다
+    - callback 이 아닌 update(명령어)는 start() 에서 보낸 메시지를 이어서 edit 한다
+    """
+
+    def __init__(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        render: Render,
+        interval: float = PROGRESSIVE_EDIT_INTERVAL,
+    ):
+        self._update = update
+        self._context = context
+        self._render = render
+        self.interval = interval
+        self._message: Optional[Message] = None
+        self._last_sent = time.monotonic()
+        self._dirty = asyncio.Event()
+        self._closed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, text: str, **kwargs):
+        """
+        데이터를 기다리는 동안 보여줄 첫 메시지 ("Loading 🔄")
+        """
+        self._message = await send_or_edit(self._update, self._context, text, **kwargs)
+        self._last_sent = time.monotonic()
+
+    def changed(self):
+        if self._closed.is_set():
+            return
+        self._dirty.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def cancel(self):
+        """
+        화면을 그리다 실패했을 때. 남은 중간 edit 을 보내지 않는다
+        """
+        self._closed.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def finish(self):
+        self._closed.set()
+        if self._task is not None:
+            self._dirty.set()
+            await self._task
+        await self._send()
+
+    async def _run(self):
+        while not self._closed.is_set():
+            await self._dirty.wait()
+            delay = self._last_sent + self.interval - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._closed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            if self._closed.is_set():
+                return
+            self._dirty.clear()
+            try:
+                await self._send()
+            except Exception:
+                # 중간 edit 실패는 무시한다. finish() 가 마지막 상태를 다시 보낸다
+                logger.info("progressive edit failed", exc_info=True)
+
+    async def _send(self):
+        text, kwargs = self._render()
+        self._last_sent = time.monotonic()
+        if self._update.callback_query or self._message is None:
+            self._message = await send_or_edit(
+                self._update, self._context, text, **kwargs
+            )
+            return
+
+        message = self._message
+        if render_cache.unchanged(
+            message.chat_id,
+            message.message_id,
+            text,
+            kwargs.get("parse_mode"),
+            kwargs.get("reply_markup"),
+        ):
+            return
+        try:
+            self._message = await message.edit_text(text, **kwargs)
+        except BadRequest as e:
+            if "Message is not modified" not in str(e):
+                raise
@@ -0,0 +1,109 @@
+from hypurrquant.logging_config import configure_logging
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+import hashlib
+import json
+import os
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE") or 10000)  # 기억할 메시지 수
+
+
+def _markup_dict(reply_markup: Any) -> Any:
+    if reply_markup is None or isinstance(reply_markup, (dict, str)):
+        return reply_markup
+    return reply_markup.to_dict()
+
+
+def render_hash(text: Optional[str], parse_mode: Any, reply_markup: Any) -> bytes:
+    """
+    (text, parse_mode, reply_markup) 로 메시지에 보이는 내용을 식별하는 hash
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((text or "").encode())
+    digest.update(b"\x00")
+    digest.update(str(parse_mode or "").encode())
+    digest.update(b"\x00")
+    digest.update(
+        json.dumps(
+            _markup_dict(reply_markup), sort_keys=True, ensure_ascii=False
+        ).encode()
+    )
+    return digest.digest()
+
+
+# ================================
+# 메시지별 마지막 렌더 결과
+# ================================
+class RenderCache:
+    """
+    (chat_id, message_id) 별로 마지막으로 보낸 (text, parse_mode, reply_markup) 의 hash 를 기억한다.
+
+    - send_or_edit 은 edit 전에 unchanged() 로 확인하고, 같으면 Bot API 를 호출하지 않는다
+      ("Message is not modified" 왕복을 없앰)
+    - OutboundRateLimiter 가 나가는 모든 sendMessage / editMessageText 를 record() 하므로
+      send_or_edit 을 거치지 않은 edit 도 반영된다. 내용을 알 수 없는 변경(caption, media,
+      삭제 등)은 forget() 으로 지운다
+    - 프로세스 메모리에만 있으므로 재시작 직후에는 첫 edit 이 항상 나간다
+    """
+
+    def __init__(self, maxsize: int = RENDER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._hashes: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._stats: Dict[str, int] = {"checks": 0, "avoided": 0, "records": 0}
+
+    def unchanged(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: Optional[str],
+        parse_mode: Any = None,
+        reply_markup: Any = None,
+    ) -> bool:
+        """
+        메시지에 이미 같은 내용이 보이고 있으면 True (호출하지 않아도 됨)
+        """
+        self._stats["checks"] += 1
+        key = (chat_id, message_id)
+        previous = self._hashes.get(key)
+        if previous is None:
+            return False
+        if previous != render_hash(text, parse_mode, reply_markup):
+            return False
+        self._hashes.move_to_end(key)
+        self._stats["avoided"] += 1
+        return True
+
+    def record(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: Optional[str],
+        parse_mode: Any = None,
+        reply_markup: Any = None,
+    ):
+        key = (chat_id, message_id)
+        self._hashes[key] = render_hash(text, parse_mode, reply_markup)
+        self._hashes.move_to_end(key)
+        self._stats["records"] += 1
+        while len(self._hashes) > self.maxsize:
+            self._hashes.popitem(last=False)
+
+    def forget(self, chat_id: int, message_id: int):
+        self._hashes.pop((chat_id, message_id), None)
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        checks = self._stats["checks"]
+        return {
+            **self._stats,
+            "size": len(self._hashes),
+            "avoided_ratio": self._stats["avoided"] / checks if checks else 0.0,
+        }
+
+
+render_cache = RenderCache()
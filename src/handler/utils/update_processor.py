@@ -0,0 +1,167 @@
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+from api.loop_monitor import loop_monitor
+from hypurrquant.logging_config import configure_logging
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, Hashable, List, Optional
+import asyncio
+import bisect
+import time
+
+logger = configure_logging(__name__)
+
+# ================================
+# 설정 정보
+# ================================
+DEFAULT_MAX_CONCURRENT_UPDATES = 64
+QUEUE_CAPACITY_FACTOR = 16  # 전역 실행 수 대비 대기까지 허용할 update 수
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0)  # 초
+USER_STATS_SIZE = 1000  # 대기 시간을 기록해 둘 최근 사용자 수
+
+
+class _KeyState:
+    __slots__ = ("lock", "pending")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.pending = 0
+
+
+# ================================
+# 사용자 단위 순서 보장 update processor
+# ================================
+class KeyedUpdateProcessor(BaseUpdateProcessor):
+    """
+    서로 다른 사용자의 update 는 동시에, 같은 사용자(없으면 chat)의 update 는 도착 순서대로 처리한다.
+
+    - 같은 key 의 update 는 FIFO lock 으로 직렬화되므로 ConversationHandler 상태가 꼬이지 않는다
+    - 실제로 실행 중인 update 수는 max_concurrent_updates 로 제한한다.
+      순서를 기다리는 update 는 실행 슬롯을 차지하지 않는다
+    - 대기열 길이, 전역 / 사용자별 대기 시간을 stats_snapshot() 으로 노출한다
+    - loop_monitor 가 켜져 있으면 handler 의 slow step 을 coroutine_id 와 함께 기록한다
+    """
+
+    def __init__(self, max_concurrent_updates: int = DEFAULT_MAX_CONCURRENT_UPDATES):
+        # BaseUpdateProcessor 의 semaphore 는 대기열 상한으로만 사용한다
+        super().__init__(max_concurrent_updates * QUEUE_CAPACITY_FACTOR)
+        self.max_running = max_concurrent_updates
+        self._running = asyncio.BoundedSemaphore(max_concurrent_updates)
+        self._keys: Dict[Hashable, _KeyState] = {}
+
+        self.queued = 0  # 같은 사용자의 앞선 update 또는 실행 슬롯을 기다리는 update 수
+        self.running = 0
+        self.processed = 0
+        self._wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        # key -> {"count", "total", "max"}
+        self._user_waits: "OrderedDict[Hashable, Dict[str, float]]" = OrderedDict()
+
+    @staticmethod
+    def _key(update: object) -> Optional[Hashable]:
+        if not isinstance(update, Update):
+            return None
+        if update.effective_user:
+            return ("user", update.effective_user.id)
+        if update.effective_chat:
+            return ("chat", update.effective_chat.id)
+        return None
+
+    def _record_wait(self, key: Optional[Hashable], wait: float):
+        self._wait_buckets[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        if key is None:
+            return
+        stats = self._user_waits.pop(key, None) or {
+            "count": 0,
+            "total": 0.0,
+            "max": 0.0,
+        }
+        stats["count"] += 1
+        stats["total"] += wait
+        stats["max"] = max(stats["max"], wait)
+        self._user_waits[key] = stats
+        while len(self._user_waits) > USER_STATS_SIZE:
+            self._user_waits.popitem(last=False)
+
+    async def _run(
+        self, key: Optional[Hashable], arrived: float, coroutine: Awaitable[Any]
+    ):
+        self.queued += 1
+        try:
+            await self._running.acquire()
+        finally:
+            self.queued -= 1
+        self._record_wait(key, time.perf_counter() - arrived)
+        self.running += 1
+        try:
+            # 루프를 오래 붙잡는 handler 를 찾기 위해 step 단위로 시간을 잰다
+            await loop_monitor.instrument(coroutine)
+        finally:
+            self.running -= 1
+            self.processed += 1
+            self._running.release()
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        arrived = time.perf_counter()
+        key = self._key(update)
+        if key is None:
+            await self._run(None, arrived, coroutine)
+            return
+
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _KeyState()
+        state.pending += 1
+        try:
+            self.queued += 1
+            try:
+                await state.lock.acquire()
+            finally:
+                self.queued -= 1
+            try:
+                await self._run(key, arrived, coroutine)
+            finally:
+                state.lock.release()
+        finally:
+            state.pending -= 1
+            if state.pending == 0:
+                self._keys.pop(key, None)
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        logger.info(f"update processor stats: {self.stats_snapshot()}")
+
+    def stats_snapshot(self) -> dict:
+        """
+        queue_depth: 실행을 기다리는 update 수 (같은 사용자의 앞선 update 대기 포함)
+        wait_histogram: 도착부터 실행 시작까지 걸린 시간 분포 (초 단위 상한 -> 개수)
+        users: 최근 사용자별 대기 시간 (count / avg / max)
+        """
+        count = sum(self._wait_buckets)
+        return {
+            "running": self.running,
+            "max_running": self.max_running,
+            "queue_depth": self.queued,
+            "active_keys": len(self._keys),
+            "processed": self.processed,
+            "wait_avg": self._wait_total / count if count else 0.0,
+            "wait_max": self._wait_max,
+            "wait_histogram": dict(
+                zip([*map(str, WAIT_BUCKETS), "inf"], self._wait_buckets)
+            ),
+            "users": {
+                str(key[1]): {
+                    "count": stats["count"],
+                    "avg": stats["total"] / stats["count"],
+                    "max": stats["max"],
+                }
+                for key, stats in self._user_waits.items()
+            },
+        }
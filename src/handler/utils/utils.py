@@ -1,10 +1,12 @@
 from hypurrquant.logging_config import configure_logging
+from handler.utils.render_cache import render_cache
 
 from telegram import Update, InlineKeyboardButton
 from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 from datetime import datetime
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
+import time
 
 logger = configure_logging(__name__)
 
@@ -57,6 +59,29 @@ class TimeUtils:
 
         return int(days), int(hours), int(minutes), int(seconds)
 
+    @staticmethod
+    def format_as_of(refreshed_at: Optional[float], min_age: float = 5) -> str:
+        """
+        데이터를 가져온 시각(epoch 초)을 "🕒 as of 1m 5s ago" 형태의 문구로 변환합니다.
+        :param refreshed_at: 데이터를 가져온 시각. None 이면 빈 문자열
+        :param min_age: 이보다 최근이면 표시하지 않음 (초)
+        :return: 마크다운 특수문자가 없는 한 줄 문구 (줄바꿈 포함) 또는 빈 문자열
+        """
+        if refreshed_at is None:
+            return ""
+        age = time.time() - refreshed_at
+        if age < min_age:
+            return ""
+
+        _, hours, minutes, seconds = TimeUtils.seconds_to_dhms(int(age))
+        if hours:
+            text = f"{hours}h {minutes}m"
+        elif minutes:
+            text = f"{minutes}m {seconds}s"
+        else:
+            text = f"{seconds}s"
+        return f"🕒 as of {text} ago\n"
+
 
 async def send_or_edit(
     update: Update, context: ContextTypes.DEFAULT_TYPE, text: str, **kwargs
@@ -64,14 +89,36 @@ async def send_or_edit(
     """
     update.callback_query가 있으면 edit, 없으면 send.
     나머지 인자들은 **kwargs로 모두 넘겨주세요.
+    edit 할 내용(text, parse_mode, reply_markup)이 메시지에 이미 보이는 것과 같으면 호출하지 않는다.
     """
     if update.callback_query:
+        message = update.callback_query.message
+        parse_mode = kwargs.get("parse_mode")
+        reply_markup = kwargs.get("reply_markup")
+        if message is not None and render_cache.unchanged(
+            message.chat_id, message.message_id, text, parse_mode, reply_markup
+        ):
+            return message
         try:
-            return await update.callback_query.edit_message_text(text, **kwargs)
+            edited = await update.callback_query.edit_message_text(text, **kwargs)
         except BadRequest as e:
             if "Message is not modified" in str(e):
-                return update.callback_query.message
+                if message is not None:
+                    render_cache.record(
+                        message.chat_id,
+                        message.message_id,
+                        text,
+                        parse_mode,
+                        reply_markup,
+                    )
+                return message
             logger.exception("send_or_edit에서 문제가 발생했습니다.")
+        else:
+            if message is not None:
+                render_cache.record(
+                    message.chat_id, message.message_id, text, parse_mode, reply_markup
+                )
+            return edited
     else:
         return await update.effective_chat.send_message(text, **kwargs)
 
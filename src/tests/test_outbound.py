@@ -0,0 +1,147 @@
+from handler.utils.outbound import OutboundRateLimiter
+
+from telegram.error import RetryAfter
+import asyncio
+import time
+
+import pytest
+
+
+class FakeBotApi:
+    """
+    PTB 가 rate limiter 에 넘기는 callback 대신 호출 내용을 기록한다.
+    failures 만큼은 RetryAfter(retry_after) 를 올린다
+    """
+
+    def __init__(self, failures: int = 0, retry_after: float = 0.0):
+        self.calls = []
+        self.failures = failures
+        self.retry_after = retry_after
+
+    async def __call__(self, endpoint: str, data: dict):
+        self.calls.append((time.monotonic(), endpoint, dict(data)))
+        if self.failures:
+            self.failures -= 1
+            raise RetryAfter(self.retry_after)
+        return {
+            "message_id": data.get("message_id", 1),
+            "chat": {"id": data.get("chat_id")},
+            "text": data.get("text"),
+        }
+
+
+def _request(limiter: OutboundRateLimiter, api: FakeBotApi, endpoint: str, **data):
+    return limiter.process_request(
+        api, (endpoint, data), {}, endpoint, data, rate_limit_args=None
+    )
+
+
+def test_newer_edit_supersedes_a_waiting_edit():
+    async def main():
+        # chat token 이 하나뿐이라 sendMessage 다음 edit 들은 토큰을 기다린다
+        limiter = OutboundRateLimiter(chat_rate=20, chat_burst=1)
+        api = FakeBotApi()
+        await _request(limiter, api, "sendMessage", chat_id=1, text="Loading")
+
+        results = await asyncio.gather(
+            *(
+                _request(
+                    limiter,
+                    api,
+                    "editMessageText",
+                    chat_id=1,
+                    message_id=1,
+                    text=text,
+                )
+                for text in ("first", "second", "last")
+            )
+        )
+
+        assert [endpoint for _, endpoint, _ in api.calls] == [
+            "sendMessage",
+            "editMessageText",
+        ]
+        assert api.calls[-1][2]["text"] == "last"
+        assert all(result["text"] == "last" for result in results)
+        stats = limiter.stats_snapshot()
+        assert stats["dropped"] == 2
+        assert stats["deferred"] >= 1
+        assert stats["pending_edits"] == 0
+
+    asyncio.run(main())
+
+
+def test_edits_of_different_messages_are_all_sent():
+    async def main():
+        limiter = OutboundRateLimiter(chat_rate=100, chat_burst=1)
+        api = FakeBotApi()
+        await asyncio.gather(
+            *(
+                _request(
+                    limiter,
+                    api,
+                    "editMessageText",
+                    chat_id=1,
+                    message_id=message_id,
+                    text="text",
+                )
+                for message_id in range(3)
+            )
+        )
+        assert len(api.calls) == 3
+        assert limiter.stats_snapshot()["dropped"] == 0
+
+    asyncio.run(main())
+
+
+def test_429_pauses_the_chat_and_retries():
+    async def main():
+        limiter = OutboundRateLimiter(chat_rate=100, chat_burst=5, max_retries=1)
+        api = FakeBotApi(failures=1, retry_after=0.1)
+
+        await _request(limiter, api, "sendMessage", chat_id=1, text="a")
+        (failed_at, _, _), (retried_at, _, _) = api.calls
+        assert retried_at - failed_at >= 0.09
+
+        # retry_after 동안 멈춘 bucket 은 같은 chat 의 다음 요청도 기다리게 한다
+        api.calls.clear()
+        api.failures, api.retry_after = 1, 0.1
+        first = asyncio.create_task(
+            _request(limiter, api, "sendMessage", chat_id=2, text="b")
+        )
+        await asyncio.sleep(0.01)
+        await _request(limiter, api, "sendMessage", chat_id=2, text="c")
+        await first
+        failed_at = api.calls[0][0]
+        assert all(called_at - failed_at >= 0.09 for called_at, _, _ in api.calls[1:])
+
+        stats = limiter.stats_snapshot()
+        assert stats["rate_limited"] == 2
+        assert stats["retried"] == 2
+        assert stats["sent"] == 3
+
+    asyncio.run(main())
+
+
+def test_429_is_raised_after_max_retries():
+    async def main():
+        limiter = OutboundRateLimiter(chat_rate=100, chat_burst=5, max_retries=1)
+        api = FakeBotApi(failures=2, retry_after=0.01)
+        with pytest.raises(RetryAfter):
+            await _request(limiter, api, "sendMessage", chat_id=1, text="a")
+        assert len(api.calls) == 2
+
+    asyncio.run(main())
+
+
+def test_requests_without_chat_are_not_limited():
+    async def main():
+        limiter = OutboundRateLimiter(global_rate=1, global_burst=1)
+        api = FakeBotApi()
+        started = time.monotonic()
+        for _ in range(5):
+            await _request(limiter, api, "answerCallbackQuery", callback_query_id="1")
+        assert time.monotonic() - started < 0.5
+        assert limiter.stats_snapshot()["requests"] == 0
+
+    asyncio.run(main())
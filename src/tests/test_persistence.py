@@ -0,0 +1,170 @@
+from handler.utils.persistence import DirtyTracker, WriteBehindMongoPersistence, _dumps
+
+from mongomock_motor import AsyncMongoMockClient
+import asyncio
+import pickle
+
+import mongopersistence.persistence
+import pytest
+
+
+@pytest.fixture
+def persistence(monkeypatch):
+    # MongoPersistence 는 AsyncIOMotorClient 인지 isinstance 로 확인한다
+    monkeypatch.setattr(
+        mongopersistence.persistence, "AsyncIOMotorClient", AsyncMongoMockClient
+    )
+
+    def build(client=None):
+        return WriteBehindMongoPersistence(
+            client or AsyncMongoMockClient(),
+            "test",
+            name_col_user_data="user-data",
+            name_col_conversations_data="conversations",
+            write_interval=3600,
+        )
+
+    return build
+
+
+# ================================
+# DirtyTracker
+# ================================
+def test_diff_sets_only_changed_nested_keys():
+    tracker = DirtyTracker()
+    data = {"buy": {"strategy": {"a": 1}, "amount": 10}, "lang": "en"}
+    to_set, to_unset, _ = tracker.diff(1, data)
+    assert to_set == {
+        "buy": {"strategy": _dumps({"a": 1}), "amount": _dumps(10)},
+        "lang": _dumps("en"),
+    }
+    assert to_unset == []
+
+    data["buy"]["amount"] = 20
+    to_set, to_unset, stats = tracker.diff(1, data)
+    assert to_set == {"buy.amount": _dumps(20)}
+    assert to_unset == []
+    assert stats["unchanged"] == 2
+
+    del data["buy"]["strategy"]
+    to_set, to_unset, _ = tracker.diff(1, data)
+    assert to_set == {}
+    assert to_unset == ["buy.strategy"]
+
+
+def test_diff_rewrites_root_when_shape_changes():
+    tracker = DirtyTracker()
+    tracker.diff(1, {"buy": {"amount": 10}})
+
+    to_set, to_unset, _ = tracker.diff(1, {"buy": 5})
+    assert to_set == {"buy": _dumps(5)}
+    assert to_unset == []
+
+    to_set, to_unset, _ = tracker.diff(1, {"buy": {"amount": 10}})
+    assert to_set == {"buy": {"amount": _dumps(10)}}
+    assert to_unset == []
+
+
+def test_diff_unsets_removed_roots_and_skips_ignored():
+    tracker = DirtyTracker(ignore=["cache"])
+    tracker.diff(1, {"buy": {"amount": 10}, "lang": "en"})
+
+    to_set, to_unset, _ = tracker.diff(1, {"lang": "en", "cache": {"x": 1}})
+    assert to_set == {}
+    assert to_unset == ["buy"]
+
+
+def test_seeded_document_is_not_rewritten():
+    tracker = DirtyTracker()
+    tracker.seed(1, {"_id": 1, "buy": {"amount": _dumps(10)}, "lang": _dumps("en")})
+
+    to_set, to_unset, _ = tracker.diff(1, {"buy": {"amount": 10}, "lang": "en"})
+    assert to_set == {}
+    assert to_unset == []
+
+
+# ================================
+# WriteBehindMongoPersistence
+# ================================
+def test_write_dirty_sends_only_changed_fields(persistence):
+    async def main():
+        store = persistence()
+        data = {"buy": {"strategy": {"a": 1}, "amount": 10}}
+        await store.update_user_data(1, data)
+        await store.write_dirty()
+
+        data["buy"]["amount"] = 20
+        await store.update_user_data(1, data)
+        await store.write_dirty()
+
+        post = await store.user_data.col.find_one({"_id": 1})
+        assert pickle.loads(post["buy"]["amount"]) == 20
+        assert pickle.loads(post["buy"]["strategy"]) == {"a": 1}
+        assert store.metrics["set_fields"] == 2  # 처음 buy 전체, 그 다음 buy.amount
+        await store.flush()
+
+    asyncio.run(main())
+
+
+def test_failed_bulk_write_marks_documents_dirty_again(persistence, monkeypatch):
+    async def main():
+        store = persistence()
+        await store.post_init()
+        await store.update_user_data(1, {"lang": "en"})
+
+        bulk_write = store.user_data.col.bulk_write
+
+        async def failing(*args, **kwargs):
+            raise RuntimeError("mongo is down")
+
+        monkeypatch.setattr(store.user_data.col, "bulk_write", failing)
+        with pytest.raises(RuntimeError):
+            await store.write_dirty()
+        assert store.stats_snapshot()["pending"] == 1
+        assert store.metrics["errors"] == 1
+
+        monkeypatch.setattr(store.user_data.col, "bulk_write", bulk_write)
+        await store.write_dirty()
+        post = await store.user_data.col.find_one({"_id": 1})
+        assert pickle.loads(post["lang"]) == "en"
+        assert store.stats_snapshot()["pending"] == 0
+        await store.flush()
+
+    asyncio.run(main())
+
+
+def test_conversation_save_delete_and_reload(persistence):
+    async def main():
+        client = AsyncMongoMockClient()
+        store = persistence(client)
+        await store.update_conversation("buy", (1, 1), 3)
+        await store.update_conversation("buy", (2, 2), 4)
+        await store.write_dirty()
+        await store.update_conversation("buy", (2, 2), None)
+        await store.write_dirty()
+
+        reloaded = persistence(client)
+        assert await reloaded.get_conversations("buy") == {(1, 1): 3}
+
+    asyncio.run(main())
+
+
+def test_loads_legacy_raw_values(persistence):
+    async def main():
+        client = AsyncMongoMockClient()
+        collection = client["test"]["user-data"]
+        # 이전 MongoPersistence 는 pickle 하지 않은 값을 그대로 저장했다
+        await collection.insert_one(
+            {"_id": 1, "buy": {"amount": 10}, "lang": _dumps("en")}
+        )
+
+        store = persistence(client)
+        assert await store.get_user_data() == {1: {"buy": {"amount": 10}, "lang": "en"}}
+
+        # raw 값은 fingerprint 가 없으므로 다음 저장 때 pickle 로 다시 쓴다
+        await store.update_user_data(1, {"buy": {"amount": 10}, "lang": "en"})
+        await store.write_dirty()
+        post = await collection.find_one({"_id": 1})
+        assert pickle.loads(post["buy"]["amount"]) == 10
+
+    asyncio.run(main())
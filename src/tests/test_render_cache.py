@@ -0,0 +1,67 @@
+from handler.utils import utils as utils_module
+from handler.utils.render_cache import RenderCache
+from handler.utils.utils import send_or_edit
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from types import SimpleNamespace
+import asyncio
+
+
+def _markup(label: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([[InlineKeyboardButton(label, callback_data=label)]])
+
+
+def test_unchanged_only_after_same_render():
+    cache = RenderCache()
+    assert not cache.unchanged(1, 10, "text", "MarkdownV2", _markup("a"))
+
+    cache.record(1, 10, "text", "MarkdownV2", _markup("a"))
+    assert cache.unchanged(1, 10, "text", "MarkdownV2", _markup("a"))
+    # 같은 버튼을 dict 로 넘겨도 같은 내용으로 본다
+    assert cache.unchanged(1, 10, "text", "MarkdownV2", _markup("a").to_dict())
+
+    assert not cache.unchanged(1, 10, "other", "MarkdownV2", _markup("a"))
+    assert not cache.unchanged(1, 10, "text", None, _markup("a"))
+    assert not cache.unchanged(1, 10, "text", "MarkdownV2", _markup("b"))
+    assert not cache.unchanged(1, 11, "text", "MarkdownV2", _markup("a"))
+
+    stats = cache.stats_snapshot()
+    assert stats["avoided"] == 2
+    assert stats["checks"] == 7
+
+
+def test_forget_and_lru_limit():
+    cache = RenderCache(maxsize=2)
+    cache.record(1, 1, "a")
+    cache.record(1, 2, "b")
+    assert cache.unchanged(1, 1, "a")  # 1 을 최근에 쓴 것으로 만든다
+    cache.record(1, 3, "c")
+    assert cache.unchanged(1, 1, "a")
+    assert not cache.unchanged(1, 2, "b")
+
+    cache.forget(1, 1)
+    assert not cache.unchanged(1, 1, "a")
+
+
+def test_send_or_edit_skips_a_no_op_edit(monkeypatch):
+    async def main():
+        monkeypatch.setattr(utils_module, "render_cache", RenderCache())
+        edits = []
+        message = SimpleNamespace(chat_id=1, message_id=10)
+
+        async def edit_message_text(text, **kwargs):
+            edits.append(text)
+            return message
+
+        update = SimpleNamespace(
+            callback_query=SimpleNamespace(
+                message=message, edit_message_text=edit_message_text
+            )
+        )
+        markup = _markup("a")
+        await send_or_edit(update, None, "text", reply_markup=markup)
+        await send_or_edit(update, None, "text", reply_markup=markup)
+        await send_or_edit(update, None, "changed", reply_markup=markup)
+        assert edits == ["text", "changed"]
+
+    asyncio.run(main())
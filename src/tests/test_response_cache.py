@@ -0,0 +1,128 @@
+from api import cache as cache_module
+from api.cache import ResponseCache
+from api.exception import NoSuchTickerException
+
+import asyncio
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def _service(cache: ResponseCache, **options):
+    class Service:
+        def __init__(self):
+            self.calls = []
+
+        @cache.cached("items", **options)
+        async def get_item(self, item_id: int, currency: str = "USD"):
+            self.calls.append((item_id, currency))
+            if item_id < 0:
+                raise NoSuchTickerException()
+            return {"id": item_id, "currency": currency}
+
+        @cache.invalidates("items")
+        async def update_item(self, item_id: int):
+            return item_id
+
+    return Service()
+
+
+def test_entry_expires_after_ttl(clock):
+    async def main():
+        service = _service(ResponseCache(), ttl=30)
+        await service.get_item(1)
+        clock.now += 29
+        await service.get_item(1)
+        assert len(service.calls) == 1
+
+        clock.now += 2
+        await service.get_item(1)
+        assert len(service.calls) == 2
+
+    asyncio.run(main())
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    async def main():
+        cache = ResponseCache()
+        service = _service(cache, ttl=30, maxsize=2)
+        await service.get_item(1)
+        await service.get_item(2)
+        await service.get_item(1)  # 2 가 가장 오래 안 쓴 항목이 된다
+        await service.get_item(3)
+        assert cache.stats_snapshot()["items"]["evictions"] == 1
+
+        await service.get_item(1)
+        await service.get_item(2)
+        assert service.calls == [(1, "USD"), (2, "USD"), (3, "USD"), (2, "USD")]
+
+    asyncio.run(main())
+
+
+def test_not_found_is_cached_for_negative_ttl(clock):
+    async def main():
+        cache = ResponseCache()
+        service = _service(cache, ttl=30, negative_ttl=5)
+        with pytest.raises(NoSuchTickerException):
+            await service.get_item(-1)
+        with pytest.raises(NoSuchTickerException) as hit:
+            await service.get_item(-1)
+        assert len(service.calls) == 1
+        assert cache.stats_snapshot()["items"]["negative_hits"] == 1
+
+        # 같은 예외 객체를 다시 올려도 traceback 이 hit 마다 길어지지 않는다
+        depth = len(hit.traceback)
+        with pytest.raises(NoSuchTickerException) as again:
+            await service.get_item(-1)
+        assert len(again.traceback) == depth
+
+        clock.now += 6
+        with pytest.raises(NoSuchTickerException):
+            await service.get_item(-1)
+        assert len(service.calls) == 2
+
+    asyncio.run(main())
+
+
+def test_positional_keyword_and_default_calls_share_one_key(clock):
+    async def main():
+        service = _service(ResponseCache(), ttl=30)
+        await service.get_item(1)
+        await service.get_item(1, "USD")
+        await service.get_item(item_id=1)
+        await service.get_item(currency="USD", item_id=1)
+        assert service.calls == [(1, "USD")]
+
+        await service.get_item(1, currency="KRW")
+        assert service.calls == [(1, "USD"), (1, "KRW")]
+
+    asyncio.run(main())
+
+
+def test_invalidates_clears_the_namespace(clock):
+    async def main():
+        cache = ResponseCache()
+        service = _service(cache, ttl=30)
+        await service.get_item(1)
+        await service.get_item(2)
+        await service.update_item(1)
+        assert cache.stats_snapshot()["items"]["size"] == 0
+
+        await service.get_item(1)
+        assert len(service.calls) == 3
+
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+from api.utils import SingleFlight
+
+import asyncio
+import time
+
+import pytest
+
+
+async def _slow(result, started: asyncio.Event, delay: float = 0.05):
+    started.set()
+    await asyncio.sleep(delay)
+    return result
+
+
+def test_concurrent_calls_share_one_execution():
+    async def main():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(
+            *(flight.do("key", "/endpoint", fetch) for _ in range(5))
+        )
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats_snapshot()["/endpoint"]["executed"] == 1
+
+    asyncio.run(main())
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        leader = asyncio.create_task(
+            flight.do("key", "/endpoint", lambda: _slow("ok", started))
+        )
+        await started.wait()
+        follower = asyncio.create_task(
+            flight.do("key", "/endpoint", lambda: _slow("other", asyncio.Event()))
+        )
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        assert await follower == "ok"
+        assert not follower.cancelled()
+        assert leader.cancelled()
+        assert flight.stats_snapshot()["/endpoint"]["executed"] == 1
+
+    asyncio.run(main())
+
+
+def test_request_cancelled_when_every_caller_is_cancelled():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        finished = False
+
+        async def fetch():
+            nonlocal finished
+            started.set()
+            await asyncio.sleep(0.05)
+            finished = True
+
+        callers = [
+            asyncio.create_task(flight.do("key", "/endpoint", fetch)) for _ in range(2)
+        ]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0.1)
+        assert not finished
+
+        # 취소된 요청에 합류하지 않고 새로 실행한다
+        started.clear()
+        assert (
+            await flight.do("key", "/endpoint", lambda: _slow("new", started)) == "new"
+        )
+
+    asyncio.run(main())
+
+
+def test_exception_is_shared():
+    async def main():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("key", "/endpoint", fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+        with pytest.raises(ValueError):
+            await flight.do("key", "/endpoint", fetch)
+
+    asyncio.run(main())
+
+
+def test_not_before_waits_for_a_newer_execution():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.02)
+            return calls
+
+        older = asyncio.create_task(flight.do("key", "/endpoint", fetch))
+        await started.wait()
+        forced = await flight.do("key", "/endpoint", fetch, not_before=time.time())
+        assert await older == 1
+        assert forced == 2
+
+    asyncio.run(main())
+
+
+def test_start_runs_in_background_once():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return await _slow("background", started)
+
+        flight.start("key", "/endpoint", fetch)
+        flight.start("key", "/endpoint", fetch)
+        assert await flight.do("key", "/endpoint", fetch) == "background"
+        assert calls == 1
+
+    asyncio.run(main())
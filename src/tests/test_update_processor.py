@@ -0,0 +1,84 @@
+from handler.utils.update_processor import KeyedUpdateProcessor
+
+from datetime import datetime, timezone
+from telegram import Chat, Message, Update, User
+import asyncio
+
+
+def _update(update_id: int, user_id: int) -> Update:
+    return Update(
+        update_id,
+        message=Message(
+            update_id,
+            datetime.now(timezone.utc),
+            Chat(user_id, Chat.PRIVATE),
+            from_user=User(user_id, "user", False),
+        ),
+    )
+
+
+def test_same_user_in_order_different_users_concurrent():
+    async def main():
+        processor = KeyedUpdateProcessor(max_concurrent_updates=2)
+        order = {1: [], 2: [], 3: []}
+        max_running = 0
+        active_users = set()
+        overlapped = False
+
+        async def handle(user_id: int, index: int):
+            nonlocal max_running, overlapped
+            max_running = max(max_running, processor.running)
+            assert user_id not in active_users  # 같은 사용자는 동시에 실행되지 않는다
+            active_users.add(user_id)
+            overlapped = overlapped or len(active_users) > 1
+            # 뒤에 도착한 update 가 먼저 끝날 수 있도록 앞선 update 를 더 오래 잡는다
+            await asyncio.sleep(0.01 * (5 - index))
+            order[user_id].append(index)
+            active_users.discard(user_id)
+
+        updates = [
+            (user_id, index) for index in range(5) for user_id in order
+        ]  # 사용자별로 번갈아 도착
+        await asyncio.gather(
+            *(
+                processor.process_update(
+                    _update(number, user_id), handle(user_id, index)
+                )
+                for number, (user_id, index) in enumerate(updates)
+            )
+        )
+
+        assert all(indexes == list(range(5)) for indexes in order.values())
+        assert overlapped
+        assert max_running <= processor.max_running
+        assert processor.stats_snapshot()["processed"] == len(updates)
+        assert processor._keys == {}
+        assert processor.queued == 0 and processor.running == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_update_releases_its_key():
+    async def main():
+        processor = KeyedUpdateProcessor(max_concurrent_updates=1)
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def fast():
+            return None
+
+        first = asyncio.create_task(processor.process_update(_update(1, 1), slow()))
+        await started.wait()
+        second = asyncio.create_task(processor.process_update(_update(2, 1), fast()))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await second
+
+        assert processor._keys == {}
+        assert processor.running == 0
+
+    asyncio.run(main())